@@ -109,7 +109,7 @@ class BamlAsyncClient:
                 "text": text,"brand_name": brand_name,"brand_aliases": brand_aliases,
             })
             return typing.cast(types.BrandMatchResult, result.cast_to(types, types, stream_types, False, __runtime__))
-    async def EvalBrandMatchBatch(self, text: str,brands: typing.List[str],
+    async def EvalBrandMatchBatch(self, text: str,brands: typing.List["types.BrandQuery"],
         baml_options: BamlCallOptions = {},
     ) -> types.BrandMatchBatchResult:
         # Check if on_tick is provided
@@ -199,6 +199,36 @@ class BamlAsyncClient:
                 "query": query,"k": k,
             })
             return typing.cast(types.RankingResult, result.cast_to(types, types, stream_types, False, __runtime__))
+    async def RankEntitiesBatchOllama(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> types.RankingBatchResult:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            # Use streaming internally when on_tick is provided
+            stream = self.stream.RankEntitiesBatchOllama(items=items,
+                baml_options=baml_options)
+            return await stream.get_final_response()
+        else:
+            # Original non-streaming code
+            result = await self.__options.merge_options(baml_options).call_function_async(function_name="RankEntitiesBatchOllama", args={
+                "items": items,
+            })
+            return typing.cast(types.RankingBatchResult, result.cast_to(types, types, stream_types, False, __runtime__))
+    async def RankEntitiesBatchOpenAI(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> types.RankingBatchResult:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            # Use streaming internally when on_tick is provided
+            stream = self.stream.RankEntitiesBatchOpenAI(items=items,
+                baml_options=baml_options)
+            return await stream.get_final_response()
+        else:
+            # Original non-streaming code
+            result = await self.__options.merge_options(baml_options).call_function_async(function_name="RankEntitiesBatchOpenAI", args={
+                "items": items,
+            })
+            return typing.cast(types.RankingBatchResult, result.cast_to(types, types, stream_types, False, __runtime__))
     async def RankEntitiesOllama(self, query: str,k: int,
         baml_options: BamlCallOptions = {},
     ) -> types.RankingResult:
@@ -229,6 +259,21 @@ class BamlAsyncClient:
                 "query": query,"k": k,
             })
             return typing.cast(types.RankingResult, result.cast_to(types, types, stream_types, False, __runtime__))
+    async def RankEntitiesWithSourcesBatchOpenAI(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> types.RankingBatchResultWithSources:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            # Use streaming internally when on_tick is provided
+            stream = self.stream.RankEntitiesWithSourcesBatchOpenAI(items=items,
+                baml_options=baml_options)
+            return await stream.get_final_response()
+        else:
+            # Original non-streaming code
+            result = await self.__options.merge_options(baml_options).call_function_async(function_name="RankEntitiesWithSourcesBatchOpenAI", args={
+                "items": items,
+            })
+            return typing.cast(types.RankingBatchResultWithSources, result.cast_to(types, types, stream_types, False, __runtime__))
     async def RankEntitiesWithSourcesOllama(self, query: str,k: int,
         baml_options: BamlCallOptions = {},
     ) -> types.RankingResultWithSources:
@@ -292,7 +337,7 @@ class BamlStreamClient:
           lambda x: typing.cast(types.BrandMatchResult, x.cast_to(types, types, stream_types, False, __runtime__)),
           ctx,
         )
-    def EvalBrandMatchBatch(self, text: str,brands: typing.List[str],
+    def EvalBrandMatchBatch(self, text: str,brands: typing.List["types.BrandQuery"],
         baml_options: BamlCallOptions = {},
     ) -> baml_py.BamlStream[stream_types.BrandMatchBatchResult, types.BrandMatchBatchResult]:
         ctx, result = self.__options.merge_options(baml_options).create_async_stream(function_name="EvalBrandMatchBatch", args={
@@ -364,6 +409,30 @@ class BamlStreamClient:
           lambda x: typing.cast(types.RankingResult, x.cast_to(types, types, stream_types, False, __runtime__)),
           ctx,
         )
+    def RankEntitiesBatchOllama(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlStream[stream_types.RankingBatchResult, types.RankingBatchResult]:
+        ctx, result = self.__options.merge_options(baml_options).create_async_stream(function_name="RankEntitiesBatchOllama", args={
+            "items": items,
+        })
+        return baml_py.BamlStream[stream_types.RankingBatchResult, types.RankingBatchResult](
+          result,
+          lambda x: typing.cast(stream_types.RankingBatchResult, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(types.RankingBatchResult, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def RankEntitiesBatchOpenAI(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlStream[stream_types.RankingBatchResult, types.RankingBatchResult]:
+        ctx, result = self.__options.merge_options(baml_options).create_async_stream(function_name="RankEntitiesBatchOpenAI", args={
+            "items": items,
+        })
+        return baml_py.BamlStream[stream_types.RankingBatchResult, types.RankingBatchResult](
+          result,
+          lambda x: typing.cast(stream_types.RankingBatchResult, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(types.RankingBatchResult, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
     def RankEntitiesOllama(self, query: str,k: int,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.BamlStream[stream_types.RankingResult, types.RankingResult]:
@@ -388,6 +457,18 @@ class BamlStreamClient:
           lambda x: typing.cast(types.RankingResult, x.cast_to(types, types, stream_types, False, __runtime__)),
           ctx,
         )
+    def RankEntitiesWithSourcesBatchOpenAI(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlStream[stream_types.RankingBatchResultWithSources, types.RankingBatchResultWithSources]:
+        ctx, result = self.__options.merge_options(baml_options).create_async_stream(function_name="RankEntitiesWithSourcesBatchOpenAI", args={
+            "items": items,
+        })
+        return baml_py.BamlStream[stream_types.RankingBatchResultWithSources, types.RankingBatchResultWithSources](
+          result,
+          lambda x: typing.cast(stream_types.RankingBatchResultWithSources, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(types.RankingBatchResultWithSources, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
     def RankEntitiesWithSourcesOllama(self, query: str,k: int,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.BamlStream[stream_types.RankingResultWithSources, types.RankingResultWithSources]:
@@ -434,7 +515,7 @@ class BamlHttpRequestClient:
             "text": text,"brand_name": brand_name,"brand_aliases": brand_aliases,
         }, mode="request")
         return result
-    async def EvalBrandMatchBatch(self, text: str,brands: typing.List[str],
+    async def EvalBrandMatchBatch(self, text: str,brands: typing.List["types.BrandQuery"],
         baml_options: BamlCallOptions = {},
     ) -> baml_py.baml_py.HTTPRequest:
         result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="EvalBrandMatchBatch", args={
@@ -476,6 +557,20 @@ class BamlHttpRequestClient:
             "query": query,"k": k,
         }, mode="request")
         return result
+    async def RankEntitiesBatchOllama(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="RankEntitiesBatchOllama", args={
+            "items": items,
+        }, mode="request")
+        return result
+    async def RankEntitiesBatchOpenAI(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="RankEntitiesBatchOpenAI", args={
+            "items": items,
+        }, mode="request")
+        return result
     async def RankEntitiesOllama(self, query: str,k: int,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.baml_py.HTTPRequest:
@@ -490,6 +585,13 @@ class BamlHttpRequestClient:
             "query": query,"k": k,
         }, mode="request")
         return result
+    async def RankEntitiesWithSourcesBatchOpenAI(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="RankEntitiesWithSourcesBatchOpenAI", args={
+            "items": items,
+        }, mode="request")
+        return result
     async def RankEntitiesWithSourcesOllama(self, query: str,k: int,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.baml_py.HTTPRequest:
@@ -526,7 +628,7 @@ class BamlHttpStreamRequestClient:
             "text": text,"brand_name": brand_name,"brand_aliases": brand_aliases,
         }, mode="stream")
         return result
-    async def EvalBrandMatchBatch(self, text: str,brands: typing.List[str],
+    async def EvalBrandMatchBatch(self, text: str,brands: typing.List["types.BrandQuery"],
         baml_options: BamlCallOptions = {},
     ) -> baml_py.baml_py.HTTPRequest:
         result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="EvalBrandMatchBatch", args={
@@ -568,6 +670,20 @@ class BamlHttpStreamRequestClient:
             "query": query,"k": k,
         }, mode="stream")
         return result
+    async def RankEntitiesBatchOllama(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="RankEntitiesBatchOllama", args={
+            "items": items,
+        }, mode="stream")
+        return result
+    async def RankEntitiesBatchOpenAI(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="RankEntitiesBatchOpenAI", args={
+            "items": items,
+        }, mode="stream")
+        return result
     async def RankEntitiesOllama(self, query: str,k: int,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.baml_py.HTTPRequest:
@@ -582,6 +698,13 @@ class BamlHttpStreamRequestClient:
             "query": query,"k": k,
         }, mode="stream")
         return result
+    async def RankEntitiesWithSourcesBatchOpenAI(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = await self.__options.merge_options(baml_options).create_http_request_async(function_name="RankEntitiesWithSourcesBatchOpenAI", args={
+            "items": items,
+        }, mode="stream")
+        return result
     async def RankEntitiesWithSourcesOllama(self, query: str,k: int,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.baml_py.HTTPRequest:
@@ -72,6 +72,18 @@ class LlmResponseParser:
         result = self.__options.merge_options(baml_options).parse_response(function_name="RankEntities", llm_response=llm_response, mode="request")
         return typing.cast(types.RankingResult, result)
 
+    def RankEntitiesBatchOllama(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> types.RankingBatchResult:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="RankEntitiesBatchOllama", llm_response=llm_response, mode="request")
+        return typing.cast(types.RankingBatchResult, result)
+
+    def RankEntitiesBatchOpenAI(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> types.RankingBatchResult:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="RankEntitiesBatchOpenAI", llm_response=llm_response, mode="request")
+        return typing.cast(types.RankingBatchResult, result)
+
     def RankEntitiesOllama(
         self, llm_response: str, baml_options: BamlCallOptions = {},
     ) -> types.RankingResult:
@@ -84,6 +96,12 @@ class LlmResponseParser:
         result = self.__options.merge_options(baml_options).parse_response(function_name="RankEntitiesOpenAI", llm_response=llm_response, mode="request")
         return typing.cast(types.RankingResult, result)
 
+    def RankEntitiesWithSourcesBatchOpenAI(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> types.RankingBatchResultWithSources:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="RankEntitiesWithSourcesBatchOpenAI", llm_response=llm_response, mode="request")
+        return typing.cast(types.RankingBatchResultWithSources, result)
+
     def RankEntitiesWithSourcesOllama(
         self, llm_response: str, baml_options: BamlCallOptions = {},
     ) -> types.RankingResultWithSources:
@@ -152,6 +170,18 @@ class LlmStreamParser:
         result = self.__options.merge_options(baml_options).parse_response(function_name="RankEntities", llm_response=llm_response, mode="stream")
         return typing.cast(stream_types.RankingResult, result)
 
+    def RankEntitiesBatchOllama(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> stream_types.RankingBatchResult:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="RankEntitiesBatchOllama", llm_response=llm_response, mode="stream")
+        return typing.cast(stream_types.RankingBatchResult, result)
+
+    def RankEntitiesBatchOpenAI(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> stream_types.RankingBatchResult:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="RankEntitiesBatchOpenAI", llm_response=llm_response, mode="stream")
+        return typing.cast(stream_types.RankingBatchResult, result)
+
     def RankEntitiesOllama(
         self, llm_response: str, baml_options: BamlCallOptions = {},
     ) -> stream_types.RankingResult:
@@ -164,6 +194,12 @@ class LlmStreamParser:
         result = self.__options.merge_options(baml_options).parse_response(function_name="RankEntitiesOpenAI", llm_response=llm_response, mode="stream")
         return typing.cast(stream_types.RankingResult, result)
 
+    def RankEntitiesWithSourcesBatchOpenAI(
+        self, llm_response: str, baml_options: BamlCallOptions = {},
+    ) -> stream_types.RankingBatchResultWithSources:
+        result = self.__options.merge_options(baml_options).parse_response(function_name="RankEntitiesWithSourcesBatchOpenAI", llm_response=llm_response, mode="stream")
+        return typing.cast(stream_types.RankingBatchResultWithSources, result)
+
     def RankEntitiesWithSourcesOllama(
         self, llm_response: str, baml_options: BamlCallOptions = {},
     ) -> stream_types.RankingResultWithSources:
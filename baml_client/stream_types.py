@@ -23,7 +23,7 @@ class StreamState(BaseModel, typing.Generic[StreamStateValueT]):
     value: StreamStateValueT
     state: typing_extensions.Literal["Pending", "Incomplete", "Complete"]
 # #########################################################################
-# Generated classes (11)
+# Generated classes (17)
 # #########################################################################
 
 class Answer(BaseModel):
@@ -52,12 +52,35 @@ class BrandMatchResult(BaseModel):
     matched_alias: typing.Optional[str] = None
     reasoning: typing.Optional[str] = None
 
+class BrandQuery(BaseModel):
+    name: typing.Optional[str] = None
+    aliases: typing.List[str]
+
 class EvalResult(BaseModel):
     passed: typing.Optional[bool] = None
     score: typing.Optional[float] = None
     feedback: typing.Optional[str] = None
     issues: typing.List[str]
 
+class RankQuery(BaseModel):
+    index: typing.Optional[int] = None
+    query: typing.Optional[str] = None
+    k: typing.Optional[int] = None
+
+class RankingBatchItem(BaseModel):
+    index: typing.Optional[int] = None
+    answers: typing.List["Answer"]
+
+class RankingBatchItemWithSources(BaseModel):
+    index: typing.Optional[int] = None
+    answers: typing.List["AnswerWithSources"]
+
+class RankingBatchResult(BaseModel):
+    results: typing.List["RankingBatchItem"]
+
+class RankingBatchResultWithSources(BaseModel):
+    results: typing.List["RankingBatchItemWithSources"]
+
 class RankingResult(BaseModel):
     answers: typing.List["Answer"]
 
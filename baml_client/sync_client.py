@@ -119,7 +119,7 @@ class BamlSyncClient:
                 "text": text,"brand_name": brand_name,"brand_aliases": brand_aliases,
             })
             return typing.cast(types.BrandMatchResult, result.cast_to(types, types, stream_types, False, __runtime__))
-    def EvalBrandMatchBatch(self, text: str,brands: typing.List[str],
+    def EvalBrandMatchBatch(self, text: str,brands: typing.List["types.BrandQuery"],
         baml_options: BamlCallOptions = {},
     ) -> types.BrandMatchBatchResult:
         # Check if on_tick is provided
@@ -203,6 +203,34 @@ class BamlSyncClient:
                 "query": query,"k": k,
             })
             return typing.cast(types.RankingResult, result.cast_to(types, types, stream_types, False, __runtime__))
+    def RankEntitiesBatchOllama(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> types.RankingBatchResult:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            stream = self.stream.RankEntitiesBatchOllama(items=items,
+                baml_options=baml_options)
+            return stream.get_final_response()
+        else:
+            # Original non-streaming code
+            result = self.__options.merge_options(baml_options).call_function_sync(function_name="RankEntitiesBatchOllama", args={
+                "items": items,
+            })
+            return typing.cast(types.RankingBatchResult, result.cast_to(types, types, stream_types, False, __runtime__))
+    def RankEntitiesBatchOpenAI(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> types.RankingBatchResult:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            stream = self.stream.RankEntitiesBatchOpenAI(items=items,
+                baml_options=baml_options)
+            return stream.get_final_response()
+        else:
+            # Original non-streaming code
+            result = self.__options.merge_options(baml_options).call_function_sync(function_name="RankEntitiesBatchOpenAI", args={
+                "items": items,
+            })
+            return typing.cast(types.RankingBatchResult, result.cast_to(types, types, stream_types, False, __runtime__))
     def RankEntitiesOllama(self, query: str,k: int,
         baml_options: BamlCallOptions = {},
     ) -> types.RankingResult:
@@ -231,6 +259,20 @@ class BamlSyncClient:
                 "query": query,"k": k,
             })
             return typing.cast(types.RankingResult, result.cast_to(types, types, stream_types, False, __runtime__))
+    def RankEntitiesWithSourcesBatchOpenAI(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> types.RankingBatchResultWithSources:
+        # Check if on_tick is provided
+        if 'on_tick' in baml_options:
+            stream = self.stream.RankEntitiesWithSourcesBatchOpenAI(items=items,
+                baml_options=baml_options)
+            return stream.get_final_response()
+        else:
+            # Original non-streaming code
+            result = self.__options.merge_options(baml_options).call_function_sync(function_name="RankEntitiesWithSourcesBatchOpenAI", args={
+                "items": items,
+            })
+            return typing.cast(types.RankingBatchResultWithSources, result.cast_to(types, types, stream_types, False, __runtime__))
     def RankEntitiesWithSourcesOllama(self, query: str,k: int,
         baml_options: BamlCallOptions = {},
     ) -> types.RankingResultWithSources:
@@ -292,7 +334,7 @@ class BamlStreamClient:
           lambda x: typing.cast(types.BrandMatchResult, x.cast_to(types, types, stream_types, False, __runtime__)),
           ctx,
         )
-    def EvalBrandMatchBatch(self, text: str,brands: typing.List[str],
+    def EvalBrandMatchBatch(self, text: str,brands: typing.List["types.BrandQuery"],
         baml_options: BamlCallOptions = {},
     ) -> baml_py.BamlSyncStream[stream_types.BrandMatchBatchResult, types.BrandMatchBatchResult]:
         ctx, result = self.__options.merge_options(baml_options).create_sync_stream(function_name="EvalBrandMatchBatch", args={
@@ -364,6 +406,30 @@ class BamlStreamClient:
           lambda x: typing.cast(types.RankingResult, x.cast_to(types, types, stream_types, False, __runtime__)),
           ctx,
         )
+    def RankEntitiesBatchOllama(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlSyncStream[stream_types.RankingBatchResult, types.RankingBatchResult]:
+        ctx, result = self.__options.merge_options(baml_options).create_sync_stream(function_name="RankEntitiesBatchOllama", args={
+            "items": items,
+        })
+        return baml_py.BamlSyncStream[stream_types.RankingBatchResult, types.RankingBatchResult](
+          result,
+          lambda x: typing.cast(stream_types.RankingBatchResult, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(types.RankingBatchResult, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
+    def RankEntitiesBatchOpenAI(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlSyncStream[stream_types.RankingBatchResult, types.RankingBatchResult]:
+        ctx, result = self.__options.merge_options(baml_options).create_sync_stream(function_name="RankEntitiesBatchOpenAI", args={
+            "items": items,
+        })
+        return baml_py.BamlSyncStream[stream_types.RankingBatchResult, types.RankingBatchResult](
+          result,
+          lambda x: typing.cast(stream_types.RankingBatchResult, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(types.RankingBatchResult, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
     def RankEntitiesOllama(self, query: str,k: int,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.BamlSyncStream[stream_types.RankingResult, types.RankingResult]:
@@ -388,6 +454,18 @@ class BamlStreamClient:
           lambda x: typing.cast(types.RankingResult, x.cast_to(types, types, stream_types, False, __runtime__)),
           ctx,
         )
+    def RankEntitiesWithSourcesBatchOpenAI(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.BamlSyncStream[stream_types.RankingBatchResultWithSources, types.RankingBatchResultWithSources]:
+        ctx, result = self.__options.merge_options(baml_options).create_sync_stream(function_name="RankEntitiesWithSourcesBatchOpenAI", args={
+            "items": items,
+        })
+        return baml_py.BamlSyncStream[stream_types.RankingBatchResultWithSources, types.RankingBatchResultWithSources](
+          result,
+          lambda x: typing.cast(stream_types.RankingBatchResultWithSources, x.cast_to(types, types, stream_types, True, __runtime__)),
+          lambda x: typing.cast(types.RankingBatchResultWithSources, x.cast_to(types, types, stream_types, False, __runtime__)),
+          ctx,
+        )
     def RankEntitiesWithSourcesOllama(self, query: str,k: int,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.BamlSyncStream[stream_types.RankingResultWithSources, types.RankingResultWithSources]:
@@ -434,7 +512,7 @@ class BamlHttpRequestClient:
             "text": text,"brand_name": brand_name,"brand_aliases": brand_aliases,
         }, mode="request")
         return result
-    def EvalBrandMatchBatch(self, text: str,brands: typing.List[str],
+    def EvalBrandMatchBatch(self, text: str,brands: typing.List["types.BrandQuery"],
         baml_options: BamlCallOptions = {},
     ) -> baml_py.baml_py.HTTPRequest:
         result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="EvalBrandMatchBatch", args={
@@ -476,6 +554,20 @@ class BamlHttpRequestClient:
             "query": query,"k": k,
         }, mode="request")
         return result
+    def RankEntitiesBatchOllama(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="RankEntitiesBatchOllama", args={
+            "items": items,
+        }, mode="request")
+        return result
+    def RankEntitiesBatchOpenAI(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="RankEntitiesBatchOpenAI", args={
+            "items": items,
+        }, mode="request")
+        return result
     def RankEntitiesOllama(self, query: str,k: int,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.baml_py.HTTPRequest:
@@ -490,6 +582,13 @@ class BamlHttpRequestClient:
             "query": query,"k": k,
         }, mode="request")
         return result
+    def RankEntitiesWithSourcesBatchOpenAI(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="RankEntitiesWithSourcesBatchOpenAI", args={
+            "items": items,
+        }, mode="request")
+        return result
     def RankEntitiesWithSourcesOllama(self, query: str,k: int,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.baml_py.HTTPRequest:
@@ -526,7 +625,7 @@ class BamlHttpStreamRequestClient:
             "text": text,"brand_name": brand_name,"brand_aliases": brand_aliases,
         }, mode="stream")
         return result
-    def EvalBrandMatchBatch(self, text: str,brands: typing.List[str],
+    def EvalBrandMatchBatch(self, text: str,brands: typing.List["types.BrandQuery"],
         baml_options: BamlCallOptions = {},
     ) -> baml_py.baml_py.HTTPRequest:
         result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="EvalBrandMatchBatch", args={
@@ -568,6 +667,20 @@ class BamlHttpStreamRequestClient:
             "query": query,"k": k,
         }, mode="stream")
         return result
+    def RankEntitiesBatchOllama(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="RankEntitiesBatchOllama", args={
+            "items": items,
+        }, mode="stream")
+        return result
+    def RankEntitiesBatchOpenAI(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="RankEntitiesBatchOpenAI", args={
+            "items": items,
+        }, mode="stream")
+        return result
     def RankEntitiesOllama(self, query: str,k: int,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.baml_py.HTTPRequest:
@@ -582,6 +695,13 @@ class BamlHttpStreamRequestClient:
             "query": query,"k": k,
         }, mode="stream")
         return result
+    def RankEntitiesWithSourcesBatchOpenAI(self, items: typing.List["types.RankQuery"],
+        baml_options: BamlCallOptions = {},
+    ) -> baml_py.baml_py.HTTPRequest:
+        result = self.__options.merge_options(baml_options).create_http_request_sync(function_name="RankEntitiesWithSourcesBatchOpenAI", args={
+            "items": items,
+        }, mode="stream")
+        return result
     def RankEntitiesWithSourcesOllama(self, query: str,k: int,
         baml_options: BamlCallOptions = {},
     ) -> baml_py.baml_py.HTTPRequest:
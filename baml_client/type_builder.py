@@ -20,7 +20,7 @@ from .globals import DO_NOT_USE_DIRECTLY_UNLESS_YOU_KNOW_WHAT_YOURE_DOING_RUNTIM
 class TypeBuilder(type_builder.TypeBuilder):
     def __init__(self):
         super().__init__(classes=set(
-          ["Answer","AnswerWithSources","BrandMatch","BrandMatchBatchResult","BrandMatchResult","EvalResult","RankingResult","RankingResultWithSources","Resume","SentimentResult","Source",]
+          ["Answer","AnswerWithSources","BrandMatch","BrandMatchBatchResult","BrandMatchResult","BrandQuery","EvalResult","RankQuery","RankingBatchItem","RankingBatchItemWithSources","RankingBatchResult","RankingBatchResultWithSources","RankingResult","RankingResultWithSources","Resume","SentimentResult","Source",]
         ), enums=set(
           ["Sentiment",]
         ), runtime=DO_NOT_USE_DIRECTLY_UNLESS_YOU_KNOW_WHAT_YOURE_DOING_RUNTIME)
@@ -35,7 +35,7 @@ class TypeBuilder(type_builder.TypeBuilder):
 
 
     # #########################################################################
-    # Generated classes 11
+    # Generated classes 17
     # #########################################################################
 
     @property
@@ -58,10 +58,34 @@ class TypeBuilder(type_builder.TypeBuilder):
     def BrandMatchResult(self) -> "BrandMatchResultViewer":
         return BrandMatchResultViewer(self)
 
+    @property
+    def BrandQuery(self) -> "BrandQueryViewer":
+        return BrandQueryViewer(self)
+
     @property
     def EvalResult(self) -> "EvalResultViewer":
         return EvalResultViewer(self)
 
+    @property
+    def RankQuery(self) -> "RankQueryViewer":
+        return RankQueryViewer(self)
+
+    @property
+    def RankingBatchItem(self) -> "RankingBatchItemViewer":
+        return RankingBatchItemViewer(self)
+
+    @property
+    def RankingBatchItemWithSources(self) -> "RankingBatchItemWithSourcesViewer":
+        return RankingBatchItemWithSourcesViewer(self)
+
+    @property
+    def RankingBatchResult(self) -> "RankingBatchResultViewer":
+        return RankingBatchResultViewer(self)
+
+    @property
+    def RankingBatchResultWithSources(self) -> "RankingBatchResultWithSourcesViewer":
+        return RankingBatchResultWithSourcesViewer(self)
+
     @property
     def RankingResult(self) -> "RankingResultViewer":
         return RankingResultViewer(self)
@@ -136,7 +160,7 @@ class SentimentValues:
 
 
 # #########################################################################
-# Generated classes 11
+# Generated classes 17
 # #########################################################################
 
 class AnswerAst:
@@ -378,6 +402,49 @@ class BrandMatchResultProperties:
     
 
 
+class BrandQueryAst:
+    def __init__(self, tb: type_builder.TypeBuilder):
+        _tb = tb._tb # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("BrandQuery")
+        self._properties: typing.Set[str] = set([  "name",  "aliases",  ])
+        self._props = BrandQueryProperties(self._bldr, self._properties)
+
+    def type(self) -> baml_py.FieldType:
+        return self._bldr.field()
+
+    @property
+    def props(self) -> "BrandQueryProperties":
+        return self._props
+
+
+class BrandQueryViewer(BrandQueryAst):
+    def __init__(self, tb: type_builder.TypeBuilder):
+        super().__init__(tb)
+
+    
+    def list_properties(self) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [(name, type_builder.ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
+    
+
+
+class BrandQueryProperties:
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties # type: ignore (we know how to use this private attribute) # noqa: F821
+
+    
+    
+    @property
+    def name(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("name"))
+    
+    @property
+    def aliases(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("aliases"))
+    
+    
+
+
 class EvalResultAst:
     def __init__(self, tb: type_builder.TypeBuilder):
         _tb = tb._tb # type: ignore (we know how to use this private attribute)
@@ -429,6 +496,217 @@ class EvalResultProperties:
     
 
 
+class RankQueryAst:
+    def __init__(self, tb: type_builder.TypeBuilder):
+        _tb = tb._tb # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("RankQuery")
+        self._properties: typing.Set[str] = set([  "index",  "query",  "k",  ])
+        self._props = RankQueryProperties(self._bldr, self._properties)
+
+    def type(self) -> baml_py.FieldType:
+        return self._bldr.field()
+
+    @property
+    def props(self) -> "RankQueryProperties":
+        return self._props
+
+
+class RankQueryViewer(RankQueryAst):
+    def __init__(self, tb: type_builder.TypeBuilder):
+        super().__init__(tb)
+
+    
+    def list_properties(self) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [(name, type_builder.ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
+    
+
+
+class RankQueryProperties:
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties # type: ignore (we know how to use this private attribute) # noqa: F821
+
+    
+    
+    @property
+    def index(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("index"))
+    
+    @property
+    def query(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("query"))
+    
+    @property
+    def k(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("k"))
+    
+    
+
+
+class RankingBatchItemAst:
+    def __init__(self, tb: type_builder.TypeBuilder):
+        _tb = tb._tb # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("RankingBatchItem")
+        self._properties: typing.Set[str] = set([  "index",  "answers",  ])
+        self._props = RankingBatchItemProperties(self._bldr, self._properties)
+
+    def type(self) -> baml_py.FieldType:
+        return self._bldr.field()
+
+    @property
+    def props(self) -> "RankingBatchItemProperties":
+        return self._props
+
+
+class RankingBatchItemViewer(RankingBatchItemAst):
+    def __init__(self, tb: type_builder.TypeBuilder):
+        super().__init__(tb)
+
+    
+    def list_properties(self) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [(name, type_builder.ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
+    
+
+
+class RankingBatchItemProperties:
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties # type: ignore (we know how to use this private attribute) # noqa: F821
+
+    
+    
+    @property
+    def index(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("index"))
+    
+    @property
+    def answers(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("answers"))
+    
+    
+
+
+class RankingBatchItemWithSourcesAst:
+    def __init__(self, tb: type_builder.TypeBuilder):
+        _tb = tb._tb # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("RankingBatchItemWithSources")
+        self._properties: typing.Set[str] = set([  "index",  "answers",  ])
+        self._props = RankingBatchItemWithSourcesProperties(self._bldr, self._properties)
+
+    def type(self) -> baml_py.FieldType:
+        return self._bldr.field()
+
+    @property
+    def props(self) -> "RankingBatchItemWithSourcesProperties":
+        return self._props
+
+
+class RankingBatchItemWithSourcesViewer(RankingBatchItemWithSourcesAst):
+    def __init__(self, tb: type_builder.TypeBuilder):
+        super().__init__(tb)
+
+    
+    def list_properties(self) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [(name, type_builder.ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
+    
+
+
+class RankingBatchItemWithSourcesProperties:
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties # type: ignore (we know how to use this private attribute) # noqa: F821
+
+    
+    
+    @property
+    def index(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("index"))
+    
+    @property
+    def answers(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("answers"))
+    
+    
+
+
+class RankingBatchResultAst:
+    def __init__(self, tb: type_builder.TypeBuilder):
+        _tb = tb._tb # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("RankingBatchResult")
+        self._properties: typing.Set[str] = set([  "results",  ])
+        self._props = RankingBatchResultProperties(self._bldr, self._properties)
+
+    def type(self) -> baml_py.FieldType:
+        return self._bldr.field()
+
+    @property
+    def props(self) -> "RankingBatchResultProperties":
+        return self._props
+
+
+class RankingBatchResultViewer(RankingBatchResultAst):
+    def __init__(self, tb: type_builder.TypeBuilder):
+        super().__init__(tb)
+
+    
+    def list_properties(self) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [(name, type_builder.ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
+    
+
+
+class RankingBatchResultProperties:
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties # type: ignore (we know how to use this private attribute) # noqa: F821
+
+    
+    
+    @property
+    def results(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("results"))
+    
+    
+
+
+class RankingBatchResultWithSourcesAst:
+    def __init__(self, tb: type_builder.TypeBuilder):
+        _tb = tb._tb # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("RankingBatchResultWithSources")
+        self._properties: typing.Set[str] = set([  "results",  ])
+        self._props = RankingBatchResultWithSourcesProperties(self._bldr, self._properties)
+
+    def type(self) -> baml_py.FieldType:
+        return self._bldr.field()
+
+    @property
+    def props(self) -> "RankingBatchResultWithSourcesProperties":
+        return self._props
+
+
+class RankingBatchResultWithSourcesViewer(RankingBatchResultWithSourcesAst):
+    def __init__(self, tb: type_builder.TypeBuilder):
+        super().__init__(tb)
+
+    
+    def list_properties(self) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [(name, type_builder.ClassPropertyViewer(self._bldr.property(name))) for name in self._properties]
+    
+
+
+class RankingBatchResultWithSourcesProperties:
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties # type: ignore (we know how to use this private attribute) # noqa: F821
+
+    
+    
+    @property
+    def results(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("results"))
+    
+    
+
+
 class RankingResultAst:
     def __init__(self, tb: type_builder.TypeBuilder):
         _tb = tb._tb # type: ignore (we know how to use this private attribute)
@@ -31,9 +31,27 @@ type_map = {
     "types.BrandMatchResult": types.BrandMatchResult,
     "stream_types.BrandMatchResult": stream_types.BrandMatchResult,
 
+    "types.BrandQuery": types.BrandQuery,
+    "stream_types.BrandQuery": stream_types.BrandQuery,
+
     "types.EvalResult": types.EvalResult,
     "stream_types.EvalResult": stream_types.EvalResult,
 
+    "types.RankQuery": types.RankQuery,
+    "stream_types.RankQuery": stream_types.RankQuery,
+
+    "types.RankingBatchItem": types.RankingBatchItem,
+    "stream_types.RankingBatchItem": stream_types.RankingBatchItem,
+
+    "types.RankingBatchItemWithSources": types.RankingBatchItemWithSources,
+    "stream_types.RankingBatchItemWithSources": stream_types.RankingBatchItemWithSources,
+
+    "types.RankingBatchResult": types.RankingBatchResult,
+    "stream_types.RankingBatchResult": stream_types.RankingBatchResult,
+
+    "types.RankingBatchResultWithSources": types.RankingBatchResultWithSources,
+    "stream_types.RankingBatchResultWithSources": stream_types.RankingBatchResultWithSources,
+
     "types.RankingResult": types.RankingResult,
     "stream_types.RankingResult": stream_types.RankingResult,
 
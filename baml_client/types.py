@@ -46,7 +46,7 @@ class Sentiment(str, Enum):
     Negative = "Negative"
 
 # #########################################################################
-# Generated classes (11)
+# Generated classes (17)
 # #########################################################################
 
 class Answer(BaseModel):
@@ -75,12 +75,35 @@ class BrandMatchResult(BaseModel):
     matched_alias: typing.Optional[str] = None
     reasoning: str
 
+class BrandQuery(BaseModel):
+    name: str
+    aliases: typing.List[str]
+
 class EvalResult(BaseModel):
     passed: bool
     score: float
     feedback: str
     issues: typing.List[str]
 
+class RankQuery(BaseModel):
+    index: int
+    query: str
+    k: int
+
+class RankingBatchItem(BaseModel):
+    index: int
+    answers: typing.List["Answer"]
+
+class RankingBatchItemWithSources(BaseModel):
+    index: int
+    answers: typing.List["AnswerWithSources"]
+
+class RankingBatchResult(BaseModel):
+    results: typing.List["RankingBatchItem"]
+
+class RankingBatchResultWithSources(BaseModel):
+    results: typing.List["RankingBatchItemWithSources"]
+
 class RankingResult(BaseModel):
     answers: typing.List["Answer"]
 
@@ -9,8 +9,9 @@ from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "src"))
+for path in (str(project_root), str(project_root / "src")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
 
 
 def demo_baml_structure():
@@ -98,15 +99,13 @@ async def simulate_workflow():
         print(f"#{i}: {answer['name']} - {answer['why']}")
 
     print("\nBrand Detection:")
-    from run import BRANDS, match_brand
+    from run import match_brands
 
     mentions_found = 0
     for i, answer in enumerate(mock_ranking_result["answers"]):
-        for brand in BRANDS:
-            alias = match_brand(answer["name"], brand)
-            if alias:
-                mentions_found += 1
-                print(f"Found {brand['name']} at rank #{i+1}")
+        for brand, alias in match_brands(answer["name"]):
+            mentions_found += 1
+            print(f"Found {brand['name']} at rank #{i+1}")
 
     print(f"\nResult: {mentions_found} brand mentions detected")
     return True
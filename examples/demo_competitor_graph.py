@@ -9,46 +9,34 @@ from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "src"))
+for path in (str(project_root), str(project_root / "src")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
 
 from competitor_graph import CompetitorGraphAnalyzer, print_competitor_graph_report
 
 
-def example_1_basic_analysis():
+def example_1_basic_analysis(analyzer):
     """Example 1: Basic competitor graph analysis"""
     print("="*70)
     print("EXAMPLE 1: Basic Competitor Graph Analysis")
     print("="*70 + "\n")
     
-    with CompetitorGraphAnalyzer("llmseo.db") as analyzer:
-        # Extract co-mentions from existing data
-        print("Extracting co-mention relationships...")
-        new_co_mentions = analyzer.extract_co_mentions()
-        print(f"✓ Found {new_co_mentions} new co-mentions\n")
-        
-        # Update aggregated relationships
-        print("Updating competitor relationships...")
-        relationships = analyzer.update_competitor_relationships()
-        print(f"✓ Updated {relationships} relationships\n")
-        
-        # Get the graph
-        graph = analyzer.get_competitor_graph()
-        
-        print(f"Network Overview:")
-        print(f"  Brands: {graph['metadata']['total_nodes']}")
-        print(f"  Relationships: {graph['metadata']['total_edges']}\n")
-        
-        print("Top 5 Strongest Relationships:")
-        for i, edge in enumerate(sorted(graph['edges'], 
-                                       key=lambda x: x['weight'], 
-                                       reverse=True)[:5], 1):
-            print(f"  {i}. {edge['source']} ↔ {edge['target']}")
-            print(f"     Strength: {edge['weight']:.3f}, "
-                  f"Co-mentions: {edge['co_mentions']}")
+    # Get the graph
+    graph = analyzer.graph
+    
+    print(f"Network Overview:")
+    print(f"  Brands: {graph['metadata']['total_nodes']}")
+    print(f"  Relationships: {graph['metadata']['total_edges']}\n")
+    
+    print("Top 5 Strongest Relationships:")
+    for i, edge in enumerate(analyzer.top_edges(5), 1):
+        print(f"  {i}. {edge['source']} ↔ {edge['target']}")
+        print(f"     Strength: {edge['weight']:.3f}, "
+              f"Co-mentions: {edge['co_mentions']}")
 
 
-def example_2_brand_specific():
+def example_2_brand_specific(analyzer):
     """Example 2: Analyze competitors for a specific brand"""
     print("\n" + "="*70)
     print("EXAMPLE 2: Brand-Specific Competitor Analysis")
@@ -56,57 +44,48 @@ def example_2_brand_specific():
     
     brand_name = "YourBrand"  # Change to a brand from your config
     
-    with CompetitorGraphAnalyzer("llmseo.db") as analyzer:
-        analyzer.extract_co_mentions()
-        analyzer.update_competitor_relationships()
-        
-        competitors = analyzer.get_brand_competitors(brand_name, top_n=5)
-        
-        if competitors:
-            print(f"Top 5 Competitors for {brand_name}:\n")
-            for i, comp in enumerate(competitors, 1):
-                print(f"{i}. {comp['name']}")
-                print(f"   Strength Score: {comp['strength']}")
-                print(f"   Co-mentions: {comp['co_mentions']}")
-                print(f"   Avg Rank Distance: {comp['avg_rank_distance']}")
-                print(f"   Relationship Age: {comp['relationship_age_days']} days")
-                print(f"   Last Seen: {comp['last_seen']}\n")
-        else:
-            print(f"No competitors found for {brand_name}")
-            print("Try running: python foundamental.py run")
-
-
-def example_3_temporal_evolution():
+    competitors = analyzer.get_brand_competitors(brand_name, top_n=5)
+    
+    if competitors:
+        print(f"Top 5 Competitors for {brand_name}:\n")
+        for i, comp in enumerate(competitors, 1):
+            print(f"{i}. {comp['name']}")
+            print(f"   Strength Score: {comp['strength']}")
+            print(f"   Co-mentions: {comp['co_mentions']}")
+            print(f"   Avg Rank Distance: {comp['avg_rank_distance']}")
+            print(f"   Relationship Age: {comp['relationship_age_days']} days")
+            print(f"   Last Seen: {comp['last_seen']}\n")
+    else:
+        print(f"No competitors found for {brand_name}")
+        print("Try running: python foundamental.py run")
+
+
+def example_3_temporal_evolution(analyzer):
     """Example 3: Track how relationships evolve over time"""
     print("\n" + "="*70)
     print("EXAMPLE 3: Temporal Evolution Analysis")
     print("="*70 + "\n")
     
-    with CompetitorGraphAnalyzer("llmseo.db") as analyzer:
-        analyzer.extract_co_mentions()
-        
-        # Get 30-day evolution with weekly windows
-        evolution = analyzer.get_temporal_evolution(days=30, window_days=7)
+    # Get 30-day evolution with weekly windows
+    evolution = analyzer.get_temporal_evolution(days=30, window_days=7)
+    
+    if evolution:
+        print(f"Analyzing {len(evolution)} time windows...\n")
         
-        if evolution:
-            print(f"Analyzing {len(evolution)} time windows...\n")
+        for snapshot in evolution:
+            print(f"Week: {snapshot['window_start'][:10]} to "
+                  f"{snapshot['window_end'][:10]}")
+            print(f"  Active Relationships: {snapshot['edge_count']}")
             
-            for snapshot in evolution:
-                print(f"Week: {snapshot['window_start'][:10]} to "
-                      f"{snapshot['window_end'][:10]}")
-                print(f"  Active Relationships: {snapshot['edge_count']}")
-                
-                if snapshot['edges']:
-                    top = sorted(snapshot['edges'], 
-                               key=lambda x: x['count'], 
-                               reverse=True)[:3]
-                    for edge in top:
-                        print(f"    • {edge['source']} ↔ {edge['target']} "
-                              f"({edge['count']} mentions)")
-                print()
-        else:
-            print("Not enough historical data for temporal analysis")
-            print("Run analyses over multiple days to see trends")
+            if snapshot['edges']:
+                # Edges come back ordered by count
+                for edge in snapshot['edges'][:3]:
+                    print(f"    • {edge['source']} ↔ {edge['target']} "
+                          f"({edge['count']} mentions)")
+            print()
+    else:
+        print("Not enough historical data for temporal analysis")
+        print("Run analyses over multiple days to see trends")
 
 
 def example_4_export_for_visualization():
@@ -142,8 +121,14 @@ def example_5_custom_queries():
     
     import sqlite3
     
-    conn = sqlite3.connect("llmseo.db")
+    # Read-only analytical scans: autocommit, bigger page cache, mmap'd reads
+    conn = sqlite3.connect("llmseo.db", isolation_level=None)
     c = conn.cursor()
+    c.executescript('''
+        PRAGMA cache_size = -65536;
+        PRAGMA mmap_size = 268435456;
+        PRAGMA temp_store = MEMORY;
+    ''')
     
     # Query 1: Co-mentions by provider
     print("Co-mentions grouped by provider:\n")
@@ -158,8 +143,7 @@ def example_5_custom_queries():
         ORDER BY total_co_mentions DESC
     ''')
     
-    results = c.fetchall()
-    for provider, total, brands1, brands2 in results:
+    for provider, total, brands1, brands2 in c:
         print(f"  {provider}: {total} co-mentions "
               f"({max(brands1, brands2)} unique brands)")
     
@@ -174,10 +158,10 @@ def example_5_custom_queries():
         GROUP BY brand_name_1
         HAVING occurrences >= 3
         ORDER BY avg_distance ASC
+        LIMIT 5
     ''')
     
-    results = c.fetchall()
-    for brand, avg_dist, count in results[:5]:
+    for brand, avg_dist, count in c:
         print(f"  {brand}: {avg_dist:.2f} average ranks apart "
               f"({count} co-mentions)")
     
@@ -214,9 +198,20 @@ def main():
     
     # Run examples
     try:
-        example_1_basic_analysis()
-        example_2_brand_specific()
-        example_3_temporal_evolution()
+        # Extract and aggregate once, then share the analyzer across examples
+        with CompetitorGraphAnalyzer("llmseo.db") as analyzer:
+            print("Extracting co-mention relationships...")
+            new_co_mentions = analyzer.extract_co_mentions()
+            print(f"✓ Found {new_co_mentions} new co-mentions\n")
+            
+            print("Updating competitor relationships...")
+            relationships = analyzer.update_competitor_relationships()
+            print(f"✓ Updated {relationships} relationships\n")
+            
+            example_1_basic_analysis(analyzer)
+            example_2_brand_specific(analyzer)
+            example_3_temporal_evolution(analyzer)
+        
         example_4_export_for_visualization()
         example_5_custom_queries()
         
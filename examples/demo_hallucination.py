@@ -12,13 +12,16 @@ This is a simplified demo - in production you'd run against your full query set.
 import asyncio
 import json
 import sqlite3
+from collections import Counter
+from operator import itemgetter
 from pathlib import Path
 import sys
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "src"))
+for path in (str(project_root), str(project_root / "src")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
 
 from providers.openai_provider_with_sources import OpenAIProviderWithSources
 from hallucination_filter import (
@@ -27,6 +30,10 @@ from hallucination_filter import (
     create_hallucination_tables
 )
 
+# Unpack answer fields in one call, with the demo's defaults
+_ANSWER_DEFAULTS = {"name": "Unknown", "why": "", "sources": [], "confidence": 0.0}
+_answer_fields = itemgetter("name", "why", "sources", "confidence")
+
 
 async def demo():
     print("="*70)
@@ -67,59 +74,80 @@ async def demo():
     
     answers = result.get("answers", [])
     
-    for idx, answer in enumerate(answers, 1):
-        name = answer.get("name", "Unknown")
-        why = answer.get("why", "")
-        sources = answer.get("sources", [])
-        confidence = answer.get("confidence", 0.0)
-        
-        print(f"\n#{idx} - {name}")
-        print(f"Confidence: {confidence:.2f}")
-        print(f"Reason: {why[:150]}...")
-        
-        if sources:
-            print(f"Sources ({len(sources)}):")
-            for source in sources[:3]:  # Show first 3 sources
-                url = source.get("url", "")
-                title = source.get("title", "")
-                if title:
-                    print(f"  • {title}")
-                    print(f"    {url}")
-                else:
-                    print(f"  • {url}")
-        else:
-            print("⚠️  No sources provided")
-    
-    # Validate sources
-    print("\n" + "="*70)
-    print("SOURCE VALIDATION")
-    print("="*70)
-    
+    # Start validating sources now so the HTTP checks overlap with the
+    # display work below; the results are only needed for scoring
     validator = SourceValidator()
     all_sources = []
     
     for answer in answers:
         all_sources.extend(answer.get("sources", []))
     
-    if all_sources:
-        print(f"\n🔄 Validating {len(all_sources)} URLs...")
-        validation_results = await validator.validate_sources(all_sources)
+    validation_task = None
+    try:
+        if all_sources:
+            validation_task = asyncio.create_task(validator.validate_sources(all_sources))
+    
+        for idx, answer in enumerate(answers, 1):
+            name, why, sources, confidence = _answer_fields({**_ANSWER_DEFAULTS, **answer})
         
-        valid_count = sum(1 for r in validation_results if isinstance(r, dict) and r.get("is_valid"))
-        accessible_count = sum(1 for r in validation_results if isinstance(r, dict) and r.get("is_accessible"))
+            # Build each answer's block and write it in one call
+            lines = [
+                f"\n#{idx} - {name}",
+                f"Confidence: {confidence:.2f}",
+                f"Reason: {why[:150]}...",
+            ]
         
-        print(f"✅ Valid URLs: {valid_count}/{len(all_sources)}")
-        print(f"✅ Accessible URLs: {accessible_count}/{len(all_sources)}")
+            if sources:
+                lines.append(f"Sources ({len(sources)}):")
+                for source in sources[:3]:  # Show first 3 sources
+                    url = source.get("url", "")
+                    title = source.get("title", "")
+                    if title:
+                        lines.append(f"  • {title}")
+                        lines.append(f"    {url}")
+                    else:
+                        lines.append(f"  • {url}")
+            else:
+                lines.append("⚠️  No sources provided")
         
-        # Show any problematic URLs
-        problems = [r for r in validation_results if isinstance(r, dict) and not r.get("is_accessible")]
-        if problems:
-            print(f"\n⚠️  Issues found with {len(problems)} URLs:")
-            for r in problems[:3]:
-                print(f"  • {r['url'][:60]}...")
-                print(f"    Error: {r.get('error', 'Not accessible')}")
-    else:
-        print("\n⚠️  No sources to validate")
+            sys.stdout.write("\n".join(lines) + "\n")
+    
+        # Validate sources
+        print("\n" + "="*70)
+        print("SOURCE VALIDATION")
+        print("="*70)
+    
+        accessible_urls = set()
+    
+        if validation_task is not None:
+            print(f"\n🔄 Validating {len(all_sources)} URLs...")
+            validation_results = await validation_task
+            accessible_urls = {
+                r["url"] for r in validation_results
+                if isinstance(r, dict) and r.get("is_accessible")
+            }
+        
+            valid_count = sum(1 for r in validation_results if isinstance(r, dict) and r.get("is_valid"))
+            accessible_count = sum(1 for r in validation_results if isinstance(r, dict) and r.get("is_accessible"))
+        
+            print(f"✅ Valid URLs: {valid_count}/{len(all_sources)}")
+            print(f"✅ Accessible URLs: {accessible_count}/{len(all_sources)}")
+        
+            # Show any problematic URLs
+            problems = [r for r in validation_results if isinstance(r, dict) and not r.get("is_accessible")]
+            if problems:
+                print(f"\n⚠️  Issues found with {len(problems)} URLs:")
+                for r in problems[:3]:
+                    print(f"  • {r['url'][:60]}...")
+                    print(f"    Error: {r.get('error', 'Not accessible')}")
+        else:
+            print("\n⚠️  No sources to validate")
+    finally:
+        # Don't leave the validation running or its session open if the
+        # display above fails
+        if validation_task is not None and not validation_task.done():
+            validation_task.cancel()
+        await validator.aclose()
     
     # Calculate reliability scores
     print("\n" + "="*70)
@@ -128,68 +156,45 @@ async def demo():
     
     scorer = HallucinationScorer()
     
-    print()
-    for idx, answer in enumerate(answers, 1):
-        name = answer.get("name", "Unknown")
-        sources = answer.get("sources", [])
-        confidence = answer.get("confidence", 0.5)
-        
-        # Check if sources are accessible
-        source_accessible = False
-        if sources:
-            source_urls = [s.get("url", "") for s in sources]
-            for url in source_urls:
-                if url in validator.cache and validator.cache[url].get("is_accessible"):
-                    source_accessible = True
-                    break
-        
-        # Calculate reliability
+    # Score every answer once; display and summary both read from this
+    # (unscored answers are treated as 0.5 confidence here)
+    scored = []
+    for answer in answers:
+        name, _, sources, confidence = _answer_fields(
+            {**_ANSWER_DEFAULTS, "confidence": 0.5, **answer})
+        source_accessible = any(s.get("url", "") in accessible_urls for s in sources)
         score_result = scorer.calculate_reliability_score(
             has_source=len(sources) > 0,
             source_accessible=source_accessible,
             confidence=confidence,
             source_count=len(sources)
         )
-        
-        # Display with emoji based on risk
-        risk_emoji = {
-            "low": "🟢",
-            "medium": "🟡", 
-            "high": "🔴"
-        }
-        
-        emoji = risk_emoji.get(score_result["risk_level"], "⚪")
-        
-        print(f"{emoji} #{idx} - {name}")
-        print(f"   Reliability Score: {score_result['reliability_score']:.2f}")
-        print(f"   Risk Level: {score_result['risk_level'].upper()}")
-        print(f"   Has Sources: {len(sources) > 0} ({len(sources)} sources)")
-        print(f"   Accessible: {source_accessible}")
-        print(f"   Confidence: {confidence:.2f}")
-        print()
+        scored.append((name, sources, source_accessible, confidence, score_result))
     
-    # Summary
-    risk_counts = {"low": 0, "medium": 0, "high": 0}
-    for answer in answers:
-        sources = answer.get("sources", [])
-        confidence = answer.get("confidence", 0.5)
-        
-        source_accessible = False
-        if sources:
-            source_urls = [s.get("url", "") for s in sources]
-            for url in source_urls:
-                if url in validator.cache and validator.cache[url].get("is_accessible"):
-                    source_accessible = True
-                    break
+    risk_counts = Counter(score_result["risk_level"] for *_, score_result in scored)
+    
+    # Display with emoji based on risk
+    risk_emoji = {
+        "low": "🟢",
+        "medium": "🟡", 
+        "high": "🔴"
+    }
+    
+    print()
+    for idx, (name, sources, source_accessible, confidence, score_result) in enumerate(scored, 1):
+        emoji = risk_emoji.get(score_result["risk_level"], "⚪")
         
-        score_result = scorer.calculate_reliability_score(
-            has_source=len(sources) > 0,
-            source_accessible=source_accessible,
-            confidence=confidence,
-            source_count=len(sources)
+        sys.stdout.write(
+            f"{emoji} #{idx} - {name}\n"
+            f"   Reliability Score: {score_result['reliability_score']:.2f}\n"
+            f"   Risk Level: {score_result['risk_level'].upper()}\n"
+            f"   Has Sources: {len(sources) > 0} ({len(sources)} sources)\n"
+            f"   Accessible: {source_accessible}\n"
+            f"   Confidence: {confidence:.2f}\n"
+            "\n"
         )
-        risk_counts[score_result["risk_level"]] += 1
     
+    # Summary
     print("="*70)
     print("SUMMARY")
     print("="*70)
@@ -2,37 +2,24 @@
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
-from sentiment_analyzer import main as sentiment_analysis
-from analyze import main as analyze_results
-from run import main as run_analysis
-from run_with_sources import main as run_analysis_with_sources
-from hallucination_filter import main as hallucination_analysis
-from competitor_graph import main as competitor_graph_analysis
 import argparse
-import asyncio
 
-def main():
-    parser = argparse.ArgumentParser(
-        description='LLM SEO Brand Visibility Tracker',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  %(prog)s run                        # Run brand analysis
-  %(prog)s run --with-sources         # Run with hallucination filter
-  %(prog)s analyze --report           # View brand report  
-  %(prog)s analyze --compare          # Compare providers
-  %(prog)s analyze --graph            # View competitor graph
-  %(prog)s analyze --graph --brand YourBrand  # Competitor analysis for specific brand
-  %(prog)s analyze --export out.json  # Export to JSON
-  %(prog)s analyze --export-graph graph.json  # Export competitor graph to JSON
-  %(prog)s sentiment --analyze        # Analyze brand sentiment
-  %(prog)s hallucination --analyze    # Analyze hallucination risks
-  %(prog)s hallucination --report     # View hallucination report
-        """)
+# Subcommand modules are imported inside their branches below: they pull in
+# the BAML client, aiohttp and the providers, which --help never needs.
+
+
+def _run_async(coro):
+    """Run a coroutine on uvloop when it's installed, else asyncio's default loop"""
+    import asyncio
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    return asyncio.run(coro, loop_factory=loop_factory)
 
-    subparsers = parser.add_subparsers(
-        dest='command', help='Available commands')
 
+def _add_run_parser(subparsers):
     run_parser = subparsers.add_parser(
         'run', help='Run brand visibility analysis')
     run_parser.add_argument(
@@ -41,6 +28,8 @@ Examples:
         '--with-sources', action='store_true', 
         help='Enable hallucination filter (request sources and confidence)')
 
+
+def _add_analyze_parser(subparsers):
     analyze_parser = subparsers.add_parser('analyze', help='Analyze results')
     analyze_parser.add_argument(
         '--db', default='llmseo.db', help='Database file path')
@@ -59,6 +48,8 @@ Examples:
         '--min-strength', type=float, default=0.0,
         help='Minimum relationship strength for graph (0.0-1.0)')
 
+
+def _add_sentiment_parser(subparsers):
     sentiment_parser = subparsers.add_parser(
         'sentiment', help='Analyze brand sentiment')
     sentiment_parser.add_argument(
@@ -67,7 +58,9 @@ Examples:
         '--analyze', action='store_true', help='Run sentiment analysis')
     sentiment_parser.add_argument(
         '--report', action='store_true', help='Show sentiment report')
-    
+
+
+def _add_hallucination_parser(subparsers):
     hallucination_parser = subparsers.add_parser(
         'hallucination', help='Hallucination filter analysis')
     hallucination_parser.add_argument(
@@ -79,6 +72,50 @@ Examples:
     hallucination_parser.add_argument(
         '--verify-urls', action='store_true', 
         help='Verify URL accessibility (slower)')
+    hallucination_parser.add_argument(
+        '--verbose', action='store_true',
+        help='Print the score of every mention during analysis')
+
+
+# Subparser builders, keyed by command name, in help order
+SUBCOMMAND_PARSERS = {
+    'run': _add_run_parser,
+    'analyze': _add_analyze_parser,
+    'sentiment': _add_sentiment_parser,
+    'hallucination': _add_hallucination_parser,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='LLM SEO Brand Visibility Tracker',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s run                        # Run brand analysis
+  %(prog)s run --with-sources         # Run with hallucination filter
+  %(prog)s analyze --report           # View brand report  
+  %(prog)s analyze --compare          # Compare providers
+  %(prog)s analyze --graph            # View competitor graph
+  %(prog)s analyze --graph --brand YourBrand  # Competitor analysis for specific brand
+  %(prog)s analyze --export out.json  # Export to JSON
+  %(prog)s analyze --export-graph graph.json  # Export competitor graph to JSON
+  %(prog)s sentiment --analyze        # Analyze brand sentiment
+  %(prog)s hallucination --analyze    # Analyze hallucination risks
+  %(prog)s hallucination --report     # View hallucination report
+        """)
+
+    subparsers = parser.add_subparsers(
+        dest='command', help='Available commands')
+
+    # Only build the subparser being invoked; help and unknown commands
+    # still get the full list
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    if command in SUBCOMMAND_PARSERS:
+        SUBCOMMAND_PARSERS[command](subparsers)
+    else:
+        for add_parser in SUBCOMMAND_PARSERS.values():
+            add_parser(subparsers)
 
     args = parser.parse_args()
 
@@ -87,9 +124,11 @@ Examples:
         print(f"Starting LLM SEO brand analysis {mode_str}...")
         try:
             if args.with_sources:
-                asyncio.run(run_analysis_with_sources(with_sources=True))
+                from run_with_sources import main as run_analysis_with_sources
+                _run_async(run_analysis_with_sources(with_sources=True))
             else:
-                asyncio.run(run_analysis())
+                from run import main as run_analysis
+                _run_async(run_analysis())
         except KeyboardInterrupt:
             print("\n Analysis interrupted by user")
         except Exception as e:
@@ -98,76 +137,41 @@ Examples:
     elif args.command == 'analyze':
         # Handle competitor graph analysis
         if args.graph or args.export_graph:
-            graph_args = ['competitor_graph.py']
-            if args.db != 'llmseo.db':
-                graph_args.extend(['--db', args.db])
-            if args.export_graph:
-                graph_args.extend(['--export', args.export_graph])
-                if args.min_strength > 0.0:
-                    graph_args.extend(['--min-strength', str(args.min_strength)])
-            else:
-                graph_args.append('--report')
-                if args.brand:
-                    graph_args.extend(['--brand', args.brand])
-            
-            original_argv = sys.argv
-            sys.argv = graph_args
-            try:
-                competitor_graph_analysis()
-            finally:
-                sys.argv = original_argv
+            from competitor_graph import run as competitor_graph_analysis
+            competitor_graph_analysis(
+                db=args.db,
+                report=True,
+                brand=args.brand,
+                export_file=args.export_graph,
+                min_strength=args.min_strength
+            )
         else:
             # Standard analysis
-            analyze_args = ['analyze.py']
-            if args.db != 'llmseo.db':
-                analyze_args.extend(['--db', args.db])
-            if args.export:
-                analyze_args.extend(['--export', args.export])
-            if args.report:
-                analyze_args.append('--report')
-            if args.compare:
-                analyze_args.append('--compare')
-
-            original_argv = sys.argv
-            sys.argv = analyze_args
-            try:
-                analyze_results()
-            finally:
-                sys.argv = original_argv
+            from analyze import run as analyze_results
+            analyze_results(
+                db=args.db,
+                export=args.export,
+                report=args.report,
+                compare=args.compare
+            )
 
     elif args.command == 'sentiment':
-        sentiment_args = ['sentiment_analyzer.py']
-        if args.db != 'llmseo.db':
-            sentiment_args.extend(['--db', args.db])
-        if args.analyze:
-            sentiment_args.append('--analyze')
-        if args.report:
-            sentiment_args.append('--report')
-
-        original_argv = sys.argv
-        sys.argv = sentiment_args
-        try:
-            asyncio.run(sentiment_analysis())
-        finally:
-            sys.argv = original_argv
+        from sentiment_analyzer import run as sentiment_analysis
+        _run_async(sentiment_analysis(
+            db=args.db,
+            analyze=args.analyze,
+            report=args.report
+        ))
     
     elif args.command == 'hallucination':
-        hallucination_args = ['hallucination_filter.py']
-        if args.db != 'llmseo.db':
-            hallucination_args.extend(['--db', args.db])
-        if args.analyze:
-            hallucination_args.append('--analyze')
-        if args.report:
-            hallucination_args.append('--report')
-        if args.verify_urls:
-            hallucination_args.append('--verify-urls')
-
-        original_argv = sys.argv
-        sys.argv = hallucination_args
-        try:
-            asyncio.run(hallucination_analysis())
-        finally:
-            sys.argv = original_argv
+        from hallucination_filter import run as hallucination_analysis
+        _run_async(hallucination_analysis(
+            db=args.db,
+            analyze=args.analyze,
+            report=args.report,
+            verify_urls=args.verify_urls,
+            verbose=args.verbose
+        ))
 
     else:
         parser.print_help()
@@ -4,8 +4,9 @@ Environment Setup for LLM SEO
 Quick setup script to prepare the environment for testing
 """
 
+import asyncio
 import os
-import subprocess
+import shutil
 import sys
 
 
@@ -19,18 +20,26 @@ def check_python_version():
     return True
 
 
-def install_dependencies():
+async def install_dependencies():
     """Install required dependencies"""
-    print("📦 Installing dependencies...")
-    try:
-        subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"],
-                       check=True, capture_output=True)
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "pip", "install", "-r", "requirements.txt",
+        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+    stdout, stderr = await proc.communicate()
+    if proc.returncode == 0:
         print("Dependencies installed successfully")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"Failed to install dependencies: {e}")
-        print("Try: pip install -r requirements.txt")
-        return False
+    # pip's output is captured so it doesn't interleave with the other
+    # checks; show it now that it's needed
+    output = stdout.decode(errors="replace").rstrip()
+    if output:
+        print(output)
+    print(f"Failed to install dependencies: pip exited with status {proc.returncode}")
+    lines = stderr.decode(errors="replace").strip().splitlines()
+    if lines:
+        print(lines[-1])
+    print("Try: pip install -r requirements.txt")
+    return False
 
 
 def setup_env_file():
@@ -41,9 +50,7 @@ def setup_env_file():
 
     if os.path.exists(".env.example"):
         print("Creating .env from .env.example...")
-        with open(".env.example", "r") as src, open(".env", "w") as dst:
-            content = src.read()
-            dst.write(content)
+        shutil.copyfile(".env.example", ".env")
 
         print("Please edit .env file and add your API keys:")
         print("   - OPENAI_API_KEY (required for OpenAI provider)")
@@ -70,23 +77,41 @@ def check_baml_client():
         return False
 
 
-def main():
-    print("LLM SEO Environment Setup")
-    print("=" * 40)
+async def run_checks():
+    """Run the setup checks, overlapping pip install with the local ones"""
+    all_passed = True
 
-    checks = [
-        ("Python Version", check_python_version),
-        ("Dependencies", install_dependencies),
+    print("\n Python Version...")
+    if not check_python_version():
+        all_passed = False
+
+    # pip is network-bound and takes by far the longest, so start it first and
+    # do the local file checks while it runs
+    print("\n📦 Installing dependencies in the background...")
+    pip_task = asyncio.ensure_future(install_dependencies())
+
+    loop = asyncio.get_running_loop()
+    for check_name, check_func in [
         ("Environment File", setup_env_file),
         ("BAML Client", check_baml_client),
-    ]
-
-    all_passed = True
-    for check_name, check_func in checks:
+    ]:
         print(f"\n {check_name}...")
-        if not check_func():
+        if not await loop.run_in_executor(None, check_func):
             all_passed = False
 
+    print("\n Dependencies...")
+    if not await pip_task:
+        all_passed = False
+
+    return all_passed
+
+
+def main():
+    print("LLM SEO Environment Setup")
+    print("=" * 40)
+
+    all_passed = asyncio.run(run_checks())
+
     print(f"\n{'='*40}")
     if all_passed:
         print("Environment setup complete!")
@@ -5,129 +5,326 @@ Analyze brand visibility and ranking across different LLM providers
 # Import Required Packages
 import sqlite3
 import json
+import os
+import hashlib
+import pickle
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from pathlib import Path
 from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
 import argparse
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
 
-def get_brand_rankings(db_path="llmseo.db"):
-    """Get brand ranking analysis"""
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
 
-    c.execute('''
-        SELECT 
-            m.brand_name,
-            m.alias_used,
-            m.rank_position,
-            r.provider_name,
-            r.model_name,
-            r.query_id,
-            m.explanation
-        FROM mentions m
-        JOIN responses r ON m.response_id = r.id
-        ORDER BY m.brand_name, r.provider_name, m.rank_position
+def connect(db_path="llmseo.db"):
+    """
+    Open the database tuned for read-heavy report queries. Reports never
+    write: the report indexes are created by the writers' create_tables
+    """
+    conn = sqlite3.connect(db_path)
+    # WAL lets reports read while `run` is writing; mmap and a larger page
+    # cache cut read syscalls on the join/sort scans
+    conn.executescript('''
+        PRAGMA journal_mode = WAL;
+        PRAGMA mmap_size = 268435456;
+        PRAGMA cache_size = -65536;
+        PRAGMA temp_store = MEMORY;
     ''')
+    return conn
+
+
+class _LazyConnection:
+    """
+    A connection that is only opened (and tuned) on first use, so a run whose
+    reports are all served from the disk cache never touches the database
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._conn = None
+
+    def __getattr__(self, name):
+        if self._conn is None:
+            self._conn = connect(self.db_path)
+        return getattr(self._conn, name)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+@contextmanager
+def _connection(db_path, conn=None):
+    """Use the caller's connection if given, otherwise open and close one"""
+    if conn is not None:
+        yield conn
+        return
+    conn = connect(db_path)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
 
-    mentions = c.fetchall()
+CACHE_DIR = Path.home() / ".cache" / "foundamental"
 
-    c.execute('SELECT DISTINCT query_id FROM responses WHERE query_id IS NOT NULL')
-    query_ids = [row[0] for row in c.fetchall()]
+# Bump when a cached function's result shape changes; changes to the report
+# SQL are picked up automatically (see _cache_version)
+CACHE_VERSION = 2
 
-    conn.close()
 
+def _file_stamp(path):
+    """(mtime_ns, size) of a file, or None if it doesn't exist"""
     try:
-        import json
-        import os
-        config_path = "config.json"
-        if os.path.exists(config_path):
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _cache_version():
+    """Code version folded into every cache stamp, so upgrades never read stale results"""
+    sql = _SQL_PROVIDER_COMPARISON
+    return (CACHE_VERSION, hashlib.sha256(sql.encode()).hexdigest()[:16])
+
+
+def _cache_file(name, path):
+    """The single cache file for a function and a database/config path"""
+    digest = hashlib.sha256(os.path.abspath(path).encode()).hexdigest()[:16]
+    return CACHE_DIR / f"{name}-{digest}.pkl"
+
+
+def _load_cached(cache_file, stamp):
+    """The cached value if the file was written for this stamp, else None"""
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_stamp, value = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, ValueError, TypeError):
+        return None
+    return value if cached_stamp == stamp else None
+
+
+def _store_cached(cache_file, stamp, value):
+    """Overwrite the cache file, so each function/path keeps exactly one"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix('.tmp')
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((stamp, value), f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def disk_cached(func):
+    """
+    Cache a report function's result on disk, one file per function and
+    database, stamped with the code version and the current state of the
+    database and config.json. Any write to either (including a WAL database's
+    -wal file) changes the stamp, so stale results are never served; the next
+    result overwrites the file.
+    """
+    @wraps(func)
+    def wrapper(db_path="llmseo.db", conn=None):
+        stamp = (
+            _cache_version(), _file_stamp(db_path),
+            _file_stamp(db_path + "-wal"), _file_stamp("config.json")
+        )
+        cache_file = _cache_file(func.__name__, db_path)
+
+        # Stored as (stamp, result), so a cached None can't be told from a miss
+        hit = _load_cached(cache_file, stamp)
+        if hit is not None:
+            return hit[0]
+
+        result = func(db_path, conn=conn)
+        _store_cached(cache_file, stamp, (result,))
+        return result
+
+    return wrapper
+
+
+def load_query_map(config_path="config.json"):
+    """Map query ids to their text from config.json (parsed once per file version)"""
+    return _parse_query_map(config_path, _file_stamp(config_path))
+
+
+@lru_cache(maxsize=4)
+def _parse_query_map(config_path, stamp):
+    try:
+        if stamp is not None:
+            # Keep the parsed map on disk too, so large configs aren't
+            # re-parsed by every new process until config.json changes
+            cache_file = _cache_file('query_map', config_path)
+            disk_stamp = (CACHE_VERSION, stamp)
+            hit = _load_cached(cache_file, disk_stamp)
+            if hit is not None:
+                return hit
+
             with open(config_path, 'r') as f:
                 config = json.load(f)
             query_map = {q['id']: q['text'] for q in config['queries']}
-        else:
-            query_map = {
-                1: "Best vector database for RAG",
-                2: "Top enterprise chatbots for internal knowledge"
-            }
-    except:
-        query_map = {}
-
-    brand_data = defaultdict(lambda: defaultdict(list))
-
-    for row in mentions:
-        brand_name, alias_used, rank, provider, model, query_id, explanation = row
-        query_text = query_map.get(query_id, f"Query {query_id}")
-        brand_data[brand_name][f"{provider}_{model}"].append({
-            'query': query_text,
-            'rank': rank,
-            'alias_used': alias_used,
-            'explanation': explanation
-        })
-
-    return dict(brand_data)
-
-
-def print_brand_report(db_path="llmseo.db"):
-    """Print a comprehensive brand visibility report"""
-    print("LLM SEO Brand Visibility Report\n" + "="*50)
 
-    brand_data = get_brand_rankings(db_path)
+            _store_cached(cache_file, disk_stamp, query_map)
+            return query_map
+        return {
+            1: "Best vector database for RAG",
+            2: "Top enterprise chatbots for internal knowledge"
+        }
+    except Exception:
+        return {}
+
+
+# Report queries live at module level so every call passes the identical
+# string and sqlite3's per-connection statement cache reuses the prepared plan
+_SQL_BRAND_MENTIONS = '''
+    WITH q(id, text) AS ({values_sql})
+    SELECT 
+        m.brand_name,
+        m.alias_used,
+        m.rank_position,
+        r.provider_name || '_' || r.model_name AS provider_model,
+        COALESCE(q.text, 'Query ' || COALESCE(r.query_id, 'None')) AS query,
+        m.explanation
+    FROM mentions m
+    JOIN responses r ON m.response_id = r.id
+    LEFT JOIN q ON q.id = r.query_id
+    ORDER BY m.brand_name, r.provider_name, r.model_name, m.rank_position
+'''
+
+_SQL_PROVIDER_COMPARISON = '''
+    SELECT 
+        r.provider_name,
+        r.model_name,
+        COALESCE(SUM(m.mention_count), 0) as total_mentions,
+        SUM(m.rank_sum) * 1.0 / SUM(m.ranked_count) as avg_rank,
+        COUNT(*) as total_responses,
+        SUM(r.error_message IS NULL) as successful_responses,
+        100.0 * SUM(r.error_message IS NULL) / COUNT(*) as success_rate
+    FROM responses r
+    LEFT JOIN (
+        SELECT 
+            response_id,
+            COUNT(*) as mention_count,
+            SUM(rank_position) as rank_sum,
+            COUNT(rank_position) as ranked_count
+        FROM mentions
+        GROUP BY response_id
+    ) m ON r.id = m.response_id
+    GROUP BY r.provider_name, r.model_name
+    ORDER BY total_mentions DESC
+'''
+
+
+def iter_brand_mentions(db_path="llmseo.db", conn=None):
+    """
+    Yield mention rows ordered by brand, provider and model, then rank.
+    Rows are sqlite3.Row objects with brand_name, alias_used, rank_position,
+    provider_model, query and explanation.
+    """
+    query_map = load_query_map()
+
+    # Resolve query text in SQL through a VALUES CTE built from the config
+    if query_map:
+        values_sql = 'VALUES ' + ', '.join(['(?, ?)'] * len(query_map))
+        params = [item for pair in query_map.items() for item in pair]
+    else:
+        values_sql = 'SELECT NULL, NULL WHERE 0'
+        params = []
+
+    with _connection(db_path, conn) as conn:
+        c = conn.cursor()
+        c.row_factory = sqlite3.Row
+        yield from c.execute(_SQL_BRAND_MENTIONS.format(values_sql=values_sql), params)
+
+
+def _group_mentions(rows):
+    """Group ordered mention rows into (brand, provider_model, rows) runs"""
+    for brand_name, brand_rows in groupby(rows, key=itemgetter('brand_name')):
+        yield brand_name, groupby(brand_rows, key=itemgetter('provider_model'))
+
+
+def get_brand_rankings(db_path="llmseo.db", conn=None):
+    """
+    Get brand ranking analysis
+
+    Not disk cached: the report and export stream the same rows from
+    iter_brand_mentions instead of building this dict.
+    """
+    # Rows arrive grouped by brand then provider/model, so no re-bucketing
+    return {
+        brand_name: {
+            provider_model: [
+                {
+                    'query': row['query'],
+                    'rank': row['rank_position'],
+                    'alias_used': row['alias_used'],
+                    'explanation': row['explanation']
+                }
+                for row in rows
+            ]
+            for provider_model, rows in providers
+        }
+        for brand_name, providers in _group_mentions(iter_brand_mentions(db_path, conn))
+    }
 
-    if not brand_data:
-        print("No brand mentions found in database")
-        return
 
-    for brand_name, providers in brand_data.items():
+def print_brand_report(db_path="llmseo.db", conn=None):
+    """Print a comprehensive brand visibility report"""
+    print("LLM SEO Brand Visibility Report\n" + "="*50)
+
+    # Stream straight from the cursor; only one provider/model group is held
+    # in memory at a time
+    found = False
+    for brand_name, providers in _group_mentions(iter_brand_mentions(db_path, conn)):
+        found = True
         print(f"\n{brand_name}")
         print("-" * (len(brand_name) + 4))
 
-        for provider_model, mentions in providers.items():
+        for provider_model, mentions in providers:
             provider, model = provider_model.split("_", 1)
             print(f"\n{provider.upper()} ({model})")
 
-            # Group by query
+            # Group by query (mentions are already in rank order)
             query_groups = defaultdict(list)
             for mention in mentions:
                 query_groups[mention['query']].append(mention)
 
             for query, query_mentions in query_groups.items():
                 print(f"Query: {query}")
-                for mention in sorted(query_mentions, key=lambda x: x['rank']):
+                for mention in query_mentions:
                     print(
-                        f"      #{mention['rank']} - {mention['alias_used']}")
+                        f"      #{mention['rank_position']} - {mention['alias_used']}")
                     if mention['explanation']:
                         print(f"           {mention['explanation'][:100]}...")
 
+    if not found:
+        print("No brand mentions found in database")
 
-def get_provider_comparison(db_path="llmseo.db"):
-    """Compare performance across providers"""
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-
-    c.execute('''
-        SELECT 
-            r.provider_name,
-            r.model_name,
-            COUNT(DISTINCT m.id) as total_mentions,
-            AVG(m.rank_position) as avg_rank,
-            COUNT(DISTINCT r.id) as total_responses,
-            COUNT(DISTINCT CASE WHEN r.error_message IS NULL THEN r.id END) as successful_responses
-        FROM responses r
-        LEFT JOIN mentions m ON r.id = m.response_id
-        GROUP BY r.provider_name, r.model_name
-        ORDER BY total_mentions DESC
-    ''')
-
-    results = c.fetchall()
-    conn.close()
 
-    return results
+@disk_cached
+def get_provider_comparison(db_path="llmseo.db", conn=None):
+    """Compare performance across providers"""
+    # Mentions are pre-aggregated per response so the outer GROUP BY sees one
+    # row per response and needs no COUNT(DISTINCT ...)
+    with _connection(db_path, conn) as conn:
+        return conn.execute(_SQL_PROVIDER_COMPARISON).fetchall()
 
 
-def print_provider_comparison(db_path="llmseo.db"):
+def print_provider_comparison(db_path="llmseo.db", conn=None):
     """Print provider comparison report"""
     print("\nProvider Performance Comparison\n" + "="*40)
 
-    results = get_provider_comparison(db_path)
+    results = get_provider_comparison(db_path, conn)
 
     if not results:
         print("No provider data found")
@@ -137,40 +334,87 @@ def print_provider_comparison(db_path="llmseo.db"):
     print("-" * 70)
 
     for row in results:
-        provider, model, mentions, avg_rank, total_resp, success_resp = row
-        success_rate = (success_resp / total_resp *
-                        100) if total_resp > 0 else 0
+        provider, model, mentions, avg_rank, total_resp, success_resp, success_rate = row
         avg_rank_str = f"{avg_rank:.1f}" if avg_rank else "N/A"
 
         print(
             f"{provider:<15} {model:<15} {mentions:<10} {avg_rank_str:<10} {success_rate:.1f}%")
 
 
-def export_to_json(db_path="llmseo.db", output_file="llm_seo_results.json"):
-    """Export results to JSON file"""
-    brand_data = get_brand_rankings(db_path)
-    provider_data = get_provider_comparison(db_path)
-
-    export_data = {
-        "brand_rankings": brand_data,
-        "provider_performance": [
-            {
+def _dumps(obj):
+    """Serialize one JSON value to bytes, via orjson when available"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def export_to_json(db_path="llmseo.db", output_file="llm_seo_results.json", conn=None):
+    """
+    Export results to JSON file
+
+    The output is written as the cursor is read, one provider/model mention
+    list per line, so memory stays flat regardless of database size.
+    """
+    with open(output_file, 'wb') as f:
+        f.write(b'{\n  "brand_rankings": {')
+
+        for i, (brand_name, providers) in enumerate(
+                _group_mentions(iter_brand_mentions(db_path, conn))):
+            f.write(b',\n    ' if i else b'\n    ')
+            f.write(_dumps(brand_name) + b': {')
+
+            for j, (provider_model, rows) in enumerate(providers):
+                f.write(b',\n      ' if j else b'\n      ')
+                f.write(_dumps(provider_model) + b': ')
+                f.write(_dumps([
+                    {
+                        'query': row['query'],
+                        'rank': row['rank_position'],
+                        'alias_used': row['alias_used'],
+                        'explanation': row['explanation']
+                    }
+                    for row in rows
+                ]))
+
+            f.write(b'\n    }')
+
+        f.write(b'\n  },\n  "provider_performance": [')
+
+        for i, row in enumerate(get_provider_comparison(db_path, conn)):
+            f.write(b',\n    ' if i else b'\n    ')
+            f.write(_dumps({
                 "provider": row[0],
                 "model": row[1],
                 "total_mentions": row[2],
                 "avg_rank": row[3],
                 "total_responses": row[4],
-                "successful_responses": row[5]
-            } for row in provider_data
-        ]
-    }
+                "successful_responses": row[5],
+                "success_rate": row[6]
+            }))
 
-    with open(output_file, 'w') as f:
-        json.dump(export_data, f, indent=2)
+        f.write(b'\n  ]\n}\n')
 
     print(f"Results exported to {output_file}")
 
 
+def run(db='llmseo.db', export=None, report=False, compare=False):
+    """Run the analysis; with no options, show both the brand report and provider comparison"""
+    # One connection shared by every report requested in this invocation,
+    # opened only if some report actually has to query
+    conn = _LazyConnection(db)
+    try:
+        if export:
+            export_to_json(db, export, conn)
+
+        if report or (not export and not compare):
+            print_brand_report(db, conn)
+
+        if compare or (not export and not report):
+            print_provider_comparison(db, conn)
+    finally:
+        conn.close()
+
+
 def main():
     parser = argparse.ArgumentParser(description='Analyze LLM SEO results')
     parser.add_argument('--db', default='llmseo.db', help='Database file path')
@@ -181,15 +425,7 @@ def main():
                         help='Show provider comparison')
 
     args = parser.parse_args()
-
-    if args.export:
-        export_to_json(args.db, args.export)
-
-    if args.report or (not args.export and not args.compare):
-        print_brand_report(args.db)
-
-    if args.compare or (not args.export and not args.report):
-        print_provider_comparison(args.db)
+    run(**vars(args))
 
 
 if __name__ == "__main__":
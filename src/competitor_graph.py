@@ -9,9 +9,18 @@ import sqlite3
 import json
 import csv
 from collections import defaultdict, Counter
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, Iterator
 from datetime import datetime, timedelta
+from functools import cached_property
+from itertools import groupby
+from operator import itemgetter
 import argparse
+import atexit
+import math
+import os
+import zlib
+import importlib.util
+from contextlib import contextmanager
 
 # Optional dependencies for graph export formats
 try:
@@ -22,20 +31,112 @@ except ImportError:
     HAS_NUMPY = False
 
 try:
-    import networkx as nx
-    HAS_NETWORKX = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    nx = None
-    HAS_NETWORKX = False
+    orjson = None
+    HAS_ORJSON = False
 
-try:
-    import torch
-    from torch_geometric.data import Data as PyGData
-    HAS_TORCH_GEOMETRIC = True
-except ImportError:
-    torch = None
-    PyGData = None
-    HAS_TORCH_GEOMETRIC = False
+# networkx and torch are the slow imports and only their own exports use them,
+# so just check availability here and import on first use (see _import_* below)
+nx = None
+HAS_NETWORKX = importlib.util.find_spec("networkx") is not None
+
+torch = None
+PyGData = None
+HAS_TORCH_GEOMETRIC = (importlib.util.find_spec("torch") is not None and
+                       importlib.util.find_spec("torch_geometric") is not None)
+
+
+def _import_networkx():
+    """Import networkx into module globals on first use"""
+    global nx
+    if nx is None:
+        import networkx
+        nx = networkx
+
+
+def _import_torch_geometric():
+    """Import torch and torch_geometric into module globals on first use"""
+    global torch, PyGData
+    if PyGData is None:
+        import torch as _torch
+        from torch_geometric.data import Data
+        torch, PyGData = _torch, Data
+
+
+def _dumps(obj) -> bytes:
+    """Serialize one JSON value to bytes, via orjson when available"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes written by _dumps"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# One connection per database file, shared by every analyzer in the process so
+# the reports and exports of a single run don't each reopen and re-tune it
+_CONNECTIONS: Dict[str, sqlite3.Connection] = {}
+
+
+def _get_conn(db_path: str) -> sqlite3.Connection:
+    """Return the shared, tuned connection for a database file"""
+    key = os.path.abspath(db_path)
+    conn = _CONNECTIONS.get(key)
+    if conn is None:
+        # Autocommit; bulk writes open their own transaction (see _transaction).
+        # The shared connection sees every graph query, so keep more of them prepared
+        conn = sqlite3.connect(db_path, isolation_level=None, cached_statements=512)
+        # WAL lets reports read while a run writes and only fsyncs at
+        # checkpoints; the rest trades a little durability for fewer syscalls
+        conn.executescript('''
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA cache_size = -65536;
+            PRAGMA mmap_size = 268435456;
+        ''')
+        _CONNECTIONS[key] = conn
+    return conn
+
+
+@atexit.register
+def _close_connections():
+    while _CONNECTIONS:
+        _, conn = _CONNECTIONS.popitem()
+        conn.close()
+
+
+def ensure_co_mentions_unique_index(conn: sqlite3.Connection) -> None:
+    """
+    Add the one-row-per-(response, pair) unique index to co_mentions, first
+    dropping the duplicate and self-pair rows older runs could record
+    """
+    c = conn.cursor()
+    c.execute('''SELECT 1 FROM sqlite_master 
+                WHERE type = 'index' AND name = 'ux_co_mentions_resp_pair' ''')
+    if c.fetchone():
+        return
+    
+    c.execute('''DELETE FROM co_mentions
+                WHERE brand_id_1 = brand_id_2
+                   OR id NOT IN (SELECT MIN(id) FROM co_mentions
+                                 GROUP BY response_id, brand_id_1, brand_id_2)''')
+    if c.rowcount > 0:
+        # Relationships were aggregated from the removed rows, so have the
+        # next update rebuild them
+        c.execute('''SELECT 1 FROM sqlite_master 
+                    WHERE type = 'table' AND name = 'graph_meta' ''')
+        if c.fetchone():
+            c.execute('''DELETE FROM graph_meta 
+                        WHERE key = 'last_update_co_mention_id' ''')
+    c.execute('''CREATE UNIQUE INDEX ux_co_mentions_resp_pair 
+                ON co_mentions(response_id, brand_id_1, brand_id_2)''')
 
 
 class CompetitorGraphAnalyzer:
@@ -46,13 +147,33 @@ class CompetitorGraphAnalyzer:
         self.conn = None
     
     def __enter__(self):
-        self.conn = sqlite3.connect(self.db_path)
+        self.conn = _get_conn(self.db_path)
         self._ensure_tables()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.conn:
-            self.conn.close()
+        # The connection is shared through _get_conn and closed at exit
+        self.conn = None
+    
+    @contextmanager
+    def _transaction(self):
+        """Run a block of writes as one explicit transaction"""
+        self.conn.execute('BEGIN')
+        try:
+            yield
+        except BaseException:
+            self.conn.execute('ROLLBACK')
+            raise
+        self.conn.execute('COMMIT')
+    
+    def _get_meta(self, key: str):
+        row = self.conn.execute('SELECT value FROM graph_meta WHERE key = ?',
+                                (key,)).fetchone()
+        return row[0] if row else None
+    
+    def _set_meta(self, key: str, value) -> None:
+        self.conn.execute('INSERT OR REPLACE INTO graph_meta (key, value) VALUES (?, ?)',
+                          (key, value))
     
     def _ensure_tables(self):
         """Create co-mention tracking tables if they don't exist"""
@@ -78,7 +199,6 @@ class CompetitorGraphAnalyzer:
         
         # Table for aggregated competitor relationships over time
         c.execute('''CREATE TABLE IF NOT EXISTS competitor_relationships (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
             brand_id_1 INTEGER,
             brand_id_2 INTEGER,
             brand_name_1 TEXT,
@@ -91,11 +211,61 @@ class CompetitorGraphAnalyzer:
             PRIMARY KEY (brand_id_1, brand_id_2)
         ) WITHOUT ROWID''')
         
+        # High-water marks for incremental maintenance: the last responses id
+        # scanned for co-mentions and the last co_mentions id folded into
+        # competitor_relationships
+        c.execute('''CREATE TABLE IF NOT EXISTS graph_meta (
+            key TEXT PRIMARY KEY,
+            value REAL
+        ) WITHOUT ROWID''')
+        
         # Index for efficient querying
         c.execute('''CREATE INDEX IF NOT EXISTS idx_co_mentions_brands 
                     ON co_mentions(brand_id_1, brand_id_2)''')
-        c.execute('''CREATE INDEX IF NOT EXISTS idx_co_mentions_timestamp 
-                    ON co_mentions(timestamp)''')
+        ensure_co_mentions_unique_index(self.conn)
+        # Covers the temporal window scans (filter on timestamp, group by pair)
+        c.execute('''CREATE INDEX IF NOT EXISTS idx_co_ts_pair 
+                    ON co_mentions(timestamp, brand_id_1, brand_id_2, rank_distance)''')
+        c.execute('''CREATE INDEX IF NOT EXISTS idx_co_mentions_provider 
+                    ON co_mentions(provider_name)''')
+        c.execute('''CREATE INDEX IF NOT EXISTS idx_co_mentions_brand_name 
+                    ON co_mentions(brand_name_1, rank_distance)''')
+        # Covering index for the strength-ordered graph/edge scans, and one per
+        # name column for get_brand_competitors
+        c.execute('''CREATE INDEX IF NOT EXISTS idx_rel_strength 
+                    ON competitor_relationships(strength_score DESC, brand_id_1, brand_id_2,
+                        brand_name_1, brand_name_2, co_mention_count, avg_rank_distance,
+                        first_seen, last_seen)''')
+        c.execute('''CREATE INDEX IF NOT EXISTS idx_rel_name1 
+                    ON competitor_relationships(brand_name_1, strength_score DESC)''')
+        c.execute('''CREATE INDEX IF NOT EXISTS idx_rel_name2 
+                    ON competitor_relationships(brand_name_2, strength_score DESC)''')
+        
+        # Serialized get_competitor_graph results, keyed by min_strength
+        c.execute('''CREATE TABLE IF NOT EXISTS graph_cache (
+            min_strength REAL PRIMARY KEY,
+            payload BLOB,
+            generated_at REAL
+        ) WITHOUT ROWID''')
+        
+        # Covering index for the mentions self-join in extract_co_mentions, so
+        # both sides are index-only; ANALYZE once when it's first created so
+        # the planner prefers it over idx_mentions_response
+        c.execute('''SELECT 
+                        EXISTS (SELECT 1 FROM sqlite_master 
+                                WHERE type = 'table' AND name = 'mentions'),
+                        EXISTS (SELECT 1 FROM sqlite_master 
+                                WHERE type = 'index' AND name = 'idx_mentions_resp_brand')
+                    ''')
+        has_mentions, has_index = c.fetchone()
+        if has_mentions and not has_index:
+            c.execute('''CREATE INDEX idx_mentions_resp_brand 
+                        ON mentions(response_id, brand_id, rank_position, brand_name)''')
+            c.execute('ANALYZE')
+        
+        # Superseded by the covering indexes above
+        c.execute('DROP INDEX IF EXISTS idx_co_mentions_timestamp')
+        c.execute('DROP INDEX IF EXISTS idx_relationships_strength')
         
         self.conn.commit()
     
@@ -106,124 +276,139 @@ class CompetitorGraphAnalyzer:
         """
         c = self.conn.cursor()
         
-        # Find all responses with multiple brand mentions
-        c.execute('''
-            SELECT 
-                m1.response_id,
-                m1.brand_id,
-                m1.brand_name,
-                m1.rank_position,
-                m2.brand_id,
-                m2.brand_name,
-                m2.rank_position,
-                r.query_id,
-                r.provider_name,
-                r.model_name,
-                r.timestamp
-            FROM mentions m1
-            JOIN mentions m2 ON m1.response_id = m2.response_id 
-                AND m1.brand_id < m2.brand_id
-            JOIN responses r ON m1.response_id = r.id
-            WHERE r.error_message IS NULL
-            ORDER BY r.timestamp DESC
-        ''')
-        
-        co_mentions = c.fetchall()
-        
-        if not co_mentions:
-            return 0
-        
-        # Check which ones are already recorded
-        c.execute('SELECT MAX(id) FROM co_mentions')
-        last_id = c.fetchone()[0] or 0
-        
-        new_count = 0
-        
-        for row in co_mentions:
-            (response_id, brand_id_1, brand_name_1, rank_1,
-             brand_id_2, brand_name_2, rank_2,
-             query_id, provider, model, timestamp) = row
-            
-            rank_distance = abs(rank_1 - rank_2)
+        with self._transaction():
+            # Only responses added since the last extraction can add pairs
+            last_id = self._get_meta('last_extract_response_id') or 0
+            c.execute('SELECT MAX(id) FROM responses')
+            max_id = c.fetchone()[0]
+            if max_id is None or max_id <= last_id:
+                return 0
             
-            # Check if this co-mention already exists
+            # Pair up brands mentioned in the same response and insert them in
+            # one statement; the unique index skips pairs already recorded
             c.execute('''
-                SELECT id FROM co_mentions 
-                WHERE response_id = ? 
-                AND brand_id_1 = ? 
-                AND brand_id_2 = ?
-            ''', (response_id, brand_id_1, brand_id_2))
+                INSERT OR IGNORE INTO co_mentions 
+                (response_id, brand_id_1, brand_id_2, 
+                 brand_name_1, brand_name_2, rank_1, rank_2, 
+                 rank_distance, query_id, provider_name, 
+                 model_name, timestamp)
+                SELECT 
+                    m1.response_id,
+                    m1.brand_id,
+                    m2.brand_id,
+                    m1.brand_name,
+                    m2.brand_name,
+                    m1.rank_position,
+                    m2.rank_position,
+                    ABS(m1.rank_position - m2.rank_position),
+                    r.query_id,
+                    r.provider_name,
+                    r.model_name,
+                    r.timestamp
+                FROM mentions m1
+                JOIN mentions m2 ON m1.response_id = m2.response_id 
+                    AND m1.brand_id < m2.brand_id
+                JOIN responses r ON m1.response_id = r.id
+                WHERE r.error_message IS NULL
+                    AND m1.response_id > ? AND m1.response_id <= ?
+            ''', (last_id, max_id))
+            new_count = c.rowcount
             
-            if not c.fetchone():
-                c.execute('''
-                    INSERT INTO co_mentions 
-                    (response_id, brand_id_1, brand_id_2, 
-                     brand_name_1, brand_name_2, rank_1, rank_2, 
-                     rank_distance, query_id, provider_name, 
-                     model_name, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (response_id, brand_id_1, brand_id_2,
-                      brand_name_1, brand_name_2, rank_1, rank_2,
-                      rank_distance, query_id, provider, model, timestamp))
-                new_count += 1
+            self._set_meta('last_extract_response_id', max_id)
         
-        self.conn.commit()
         return new_count
     
-    def update_competitor_relationships(self):
+    def update_competitor_relationships(self, rebuild: bool = False) -> int:
         """
         Update aggregated competitor relationships based on co-mentions
         Calculates strength scores based on frequency and rank proximity
-        """
-        c = self.conn.cursor()
-        
-        # Clear existing relationships
-        c.execute('DELETE FROM competitor_relationships')
         
-        # Aggregate co-mention data
-        c.execute('''
-            SELECT 
-                brand_id_1,
-                brand_id_2,
-                brand_name_1,
-                brand_name_2,
-                COUNT(*) as co_mention_count,
-                AVG(rank_distance) as avg_rank_distance,
-                MIN(timestamp) as first_seen,
-                MAX(timestamp) as last_seen
-            FROM co_mentions
-            GROUP BY brand_id_1, brand_id_2
-        ''')
+        Only co-mentions recorded since the last update are aggregated and
+        merged into the existing relationships.
         
-        relationships = c.fetchall()
+        Args:
+            rebuild: Discard the existing relationships and recompute them
+                from every co-mention
+            
+        Returns:
+            Number of relationships created or updated
+        """
+        c = self.conn.cursor()
         
-        for row in relationships:
-            (brand_id_1, brand_id_2, brand_name_1, brand_name_2,
-             co_mention_count, avg_rank_distance, first_seen, last_seen) = row
+        with self._transaction():
+            last_id = self._get_meta('last_update_co_mention_id')
+            
+            # Without a recorded position, existing rows can't be merged into safely
+            if rebuild or last_id is None:
+                c.execute('DELETE FROM competitor_relationships')
+                self._invalidate_graph()
+                last_id = 0
             
-            # Calculate strength score
-            # Higher frequency = stronger relationship
-            # Lower rank distance = stronger relationship
-            # Normalize: frequency (0-1) * proximity_factor (0-1)
-            max_distance = 10  # Assume max distance is 10
-            proximity_factor = 1 - min(avg_rank_distance, max_distance) / max_distance
+            c.execute('SELECT MAX(id) FROM co_mentions')
+            max_id = c.fetchone()[0]
+            if max_id is None or max_id <= last_id:
+                return 0
             
-            # Simple strength calculation - can be enhanced
-            strength_score = (min(co_mention_count / 10, 1.0) * 0.6 + 
-                            proximity_factor * 0.4)
+            self._invalidate_graph()
             
+            # Aggregate the new co-mentions and merge them in the same statement.
+            # Higher frequency = stronger relationship, lower rank distance =
+            # stronger relationship: frequency (capped at 10 co-mentions) weighs
+            # 0.6 and proximity (distance capped at 10) weighs 0.4. On conflict the
+            # SET expressions see the old row, so counts and averages are combined
+            # before rescoring.
             c.execute('''
                 INSERT INTO competitor_relationships
                 (brand_id_1, brand_id_2, brand_name_1, brand_name_2,
                  co_mention_count, avg_rank_distance, first_seen, 
                  last_seen, strength_score)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (brand_id_1, brand_id_2, brand_name_1, brand_name_2,
-                  co_mention_count, avg_rank_distance, first_seen,
-                  last_seen, strength_score))
+                SELECT 
+                    brand_id_1,
+                    brand_id_2,
+                    brand_name_1,
+                    brand_name_2,
+                    COUNT(*) as co_mention_count,
+                    AVG(rank_distance) as avg_rank_distance,
+                    MIN(timestamp) as first_seen,
+                    MAX(timestamp) as last_seen,
+                    MIN(COUNT(*) / 10.0, 1.0) * 0.6 +
+                        (1 - MIN(AVG(rank_distance), 10) / 10.0) * 0.4 as strength_score
+                FROM co_mentions
+                WHERE id > ? AND id <= ?
+                GROUP BY brand_id_1, brand_id_2
+                ON CONFLICT (brand_id_1, brand_id_2) DO UPDATE SET
+                    co_mention_count = co_mention_count + excluded.co_mention_count,
+                    avg_rank_distance = 
+                        (avg_rank_distance * co_mention_count +
+                         excluded.avg_rank_distance * excluded.co_mention_count) /
+                        (co_mention_count + excluded.co_mention_count),
+                    first_seen = MIN(first_seen, excluded.first_seen),
+                    last_seen = MAX(last_seen, excluded.last_seen),
+                    strength_score = 
+                        MIN((co_mention_count + excluded.co_mention_count) / 10.0, 1.0) * 0.6 +
+                        (1 - MIN((avg_rank_distance * co_mention_count +
+                                  excluded.avg_rank_distance * excluded.co_mention_count) /
+                                 (co_mention_count + excluded.co_mention_count), 10) / 10.0) * 0.4
+            ''', (last_id, max_id))
+            relationship_count = c.rowcount
+            
+            self._set_meta('last_update_co_mention_id', max_id)
+        
+        # Refresh planner statistics now that both tables have grown, so the
+        # temporal window scans keep choosing index range scans; the sampling
+        # limit keeps this cheap on large tables
+        self.conn.executescript('''
+            PRAGMA analysis_limit = 1000;
+            ANALYZE co_mentions;
+            ANALYZE competitor_relationships;
+        ''')
         
-        self.conn.commit()
-        return len(relationships)
+        return relationship_count
+    
+    def _invalidate_graph(self) -> None:
+        """Drop cached graphs once relationships change"""
+        self.conn.execute('DELETE FROM graph_cache')
+        self.__dict__.pop('graph', None)
     
     def get_competitor_graph(self, brand_id: Optional[int] = None, 
                             min_strength: float = 0.0) -> Dict[str, Any]:
@@ -237,6 +422,59 @@ class CompetitorGraphAnalyzer:
         Returns:
             Dictionary with nodes and edges for graph visualization
         """
+        if brand_id is not None:
+            return self._build_competitor_graph(brand_id, min_strength)
+        
+        # Whole-graph results are cached per min_strength until the next
+        # update_competitor_relationships
+        c = self.conn.cursor()
+        c.execute('SELECT payload FROM graph_cache WHERE min_strength = ?',
+                  (min_strength,))
+        row = c.fetchone()
+        if row:
+            try:
+                return _loads(zlib.decompress(row[0]))
+            except (zlib.error, ValueError):
+                # Unreadable payload (e.g. written by an older version); rebuild
+                pass
+        
+        graph = self._build_competitor_graph(None, min_strength)
+        c.execute('''INSERT OR REPLACE INTO graph_cache 
+                    (min_strength, payload, generated_at) VALUES (?, ?, ?)''',
+                  (min_strength, zlib.compress(_dumps(graph)),
+                   datetime.now().timestamp()))
+        return graph
+    
+    def _build_competitor_graph(self, brand_id: Optional[int],
+                                min_strength: float) -> Dict[str, Any]:
+        """Query and format the competitor graph (see get_competitor_graph)"""
+        edge_list = list(self.iter_edges(min_strength, brand_id))
+        # Distinct, sorted node names come straight from SQLite
+        nodes = [{"id": node, "label": node}
+                 for node in self.iter_nodes(min_strength, brand_id)]
+        
+        return {
+            "nodes": nodes,
+            "edges": edge_list,
+            "metadata": {
+                "total_nodes": len(nodes),
+                "total_edges": len(edge_list),
+                "min_strength_filter": min_strength
+            }
+        }
+    
+    def iter_edges(self, min_strength: float = 0.0,
+                   brand_id: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream competitor graph edges, strongest first
+        
+        Args:
+            min_strength: Minimum strength score to include
+            brand_id: Filter by specific brand (None = all brands)
+            
+        Yields:
+            Edge dictionaries, formatted straight off the cursor
+        """
         c = self.conn.cursor()
         
         # Build query based on filters
@@ -249,6 +487,8 @@ class CompetitorGraphAnalyzer:
         
         where_sql = ' AND '.join(where_clauses)
         
+        # Timestamps are formatted as local ISO strings by SQLite rather than
+        # through a datetime object per row
         c.execute(f'''
             SELECT 
                 brand_name_1,
@@ -256,45 +496,94 @@ class CompetitorGraphAnalyzer:
                 co_mention_count,
                 avg_rank_distance,
                 strength_score,
-                first_seen,
-                last_seen
+                strftime('%Y-%m-%dT%H:%M:%S', first_seen, 'unixepoch', 'localtime'),
+                strftime('%Y-%m-%dT%H:%M:%S', last_seen, 'unixepoch', 'localtime')
             FROM competitor_relationships
             WHERE {where_sql}
             ORDER BY strength_score DESC
         ''', params)
         
-        edges = c.fetchall()
+        c.arraysize = 1000
+        for (brand1, brand2, count, avg_dist, strength,
+             first_seen, last_seen) in c:
+            yield {
+                "source": brand1,
+                "target": brand2,
+                "weight": strength,
+                "co_mentions": count,
+                "avg_distance": round(avg_dist, 2),
+                "first_seen": first_seen,
+                "last_seen": last_seen
+            }
+    
+    def iter_nodes(self, min_strength: float = 0.0,
+                   brand_id: Optional[int] = None) -> Iterator[str]:
+        """
+        Stream the names of brands on the edges iter_edges would return,
+        deduplicated and sorted by SQLite
+        """
+        c = self.conn.cursor()
         
-        # Build nodes set
-        nodes = set()
-        edge_list = []
+        where_sql = 'strength_score >= ?'
+        params = [min_strength]
         
-        for row in edges:
-            (brand1, brand2, count, avg_dist, strength, 
-             first_seen, last_seen) = row
-            
-            nodes.add(brand1)
-            nodes.add(brand2)
+        if brand_id is not None:
+            where_sql += ' AND (brand_id_1 = ? OR brand_id_2 = ?)'
+            params.extend([brand_id, brand_id])
+        
+        c.execute(f'''
+            SELECT brand_name_1 FROM competitor_relationships 
+            WHERE {where_sql}
+            UNION
+            SELECT brand_name_2 FROM competitor_relationships 
+            WHERE {where_sql}
+            ORDER BY 1
+        ''', params * 2)
+        
+        for (name,) in c:
+            yield name
+    
+    @cached_property
+    def graph(self) -> Dict[str, Any]:
+        """Full competitor graph, cached until relationships are next updated"""
+        return self.get_competitor_graph()
+    
+    def top_edges(self, n: int = 5, min_strength: float = 0.0) -> List[Dict[str, Any]]:
+        """
+        Get the strongest competitor relationships
+        
+        Args:
+            n: Number of edges to return
+            min_strength: Minimum strength score to include
             
-            edge_list.append({
+        Returns:
+            List of edge dictionaries sorted by strength, strongest first
+        """
+        c = self.conn.cursor()
+        
+        c.execute('''
+            SELECT 
+                brand_name_1,
+                brand_name_2,
+                co_mention_count,
+                avg_rank_distance,
+                strength_score
+            FROM competitor_relationships
+            WHERE strength_score >= ?
+            ORDER BY strength_score DESC
+            LIMIT ?
+        ''', (min_strength, n))
+        
+        return [
+            {
                 "source": brand1,
                 "target": brand2,
                 "weight": strength,
                 "co_mentions": count,
-                "avg_distance": round(avg_dist, 2),
-                "first_seen": datetime.fromtimestamp(first_seen).isoformat(),
-                "last_seen": datetime.fromtimestamp(last_seen).isoformat()
-            })
-        
-        return {
-            "nodes": [{"id": node, "label": node} for node in sorted(nodes)],
-            "edges": edge_list,
-            "metadata": {
-                "total_nodes": len(nodes),
-                "total_edges": len(edge_list),
-                "min_strength_filter": min_strength
+                "avg_distance": round(avg_dist, 2)
             }
-        }
+            for brand1, brand2, count, avg_dist, strength in c.fetchall()
+        ]
     
     def get_temporal_evolution(self, days: int = 30, 
                                window_days: int = 7) -> List[Dict[str, Any]]:
@@ -306,55 +595,58 @@ class CompetitorGraphAnalyzer:
             window_days: Rolling window size in days
             
         Returns:
-            List of time-windowed graph snapshots
+            List of time-windowed graph snapshots, edges ordered by count
         """
+        return list(self.iter_temporal_evolution(days, window_days))
+    
+    def iter_temporal_evolution(self, days: int = 30,
+                                window_days: int = 7) -> Iterator[Dict[str, Any]]:
+        """Stream the snapshots of get_temporal_evolution one window at a time"""
         c = self.conn.cursor()
         
         # Get timestamp range
         now = datetime.now().timestamp()
         start_time = (datetime.now() - timedelta(days=days)).timestamp()
         
-        snapshots = []
-        current_time = start_time
         window_seconds = window_days * 86400
+        # The last window may run past now, as with the per-window queries
+        window_count = math.ceil((now - start_time) / window_seconds)
+        end_time = start_time + window_count * window_seconds
         
-        while current_time < now:
-            window_start = current_time
-            window_end = current_time + window_seconds
+        # One scan over the whole range, bucketed into windows in SQL
+        c.execute('''
+            SELECT 
+                CAST((timestamp - ?) / ? AS INTEGER) as bucket,
+                brand_name_1,
+                brand_name_2,
+                COUNT(*) as count,
+                AVG(rank_distance) as avg_distance
+            FROM co_mentions
+            WHERE timestamp >= ? AND timestamp < ?
+            GROUP BY bucket, brand_id_1, brand_id_2
+            ORDER BY bucket, count DESC
+        ''', (start_time, window_seconds, start_time, end_time))
+        
+        for bucket, rows in groupby(c, key=itemgetter(0)):
+            window_start = start_time + bucket * window_seconds
+            window_end = window_start + window_seconds
             
-            c.execute('''
-                SELECT 
-                    brand_name_1,
-                    brand_name_2,
-                    COUNT(*) as count,
-                    AVG(rank_distance) as avg_distance
-                FROM co_mentions
-                WHERE timestamp >= ? AND timestamp < ?
-                GROUP BY brand_id_1, brand_id_2
-            ''', (window_start, window_end))
-            
-            results = c.fetchall()
-            
-            if results:
-                edges = []
-                for brand1, brand2, count, avg_dist in results:
-                    edges.append({
-                        "source": brand1,
-                        "target": brand2,
-                        "count": count,
-                        "avg_distance": round(avg_dist, 2)
-                    })
-                
-                snapshots.append({
-                    "window_start": datetime.fromtimestamp(window_start).isoformat(),
-                    "window_end": datetime.fromtimestamp(window_end).isoformat(),
-                    "edges": edges,
-                    "edge_count": len(edges)
-                })
+            edges = [
+                {
+                    "source": brand1,
+                    "target": brand2,
+                    "count": count,
+                    "avg_distance": round(avg_dist, 2)
+                }
+                for _, brand1, brand2, count, avg_dist in rows
+            ]
             
-            current_time += window_seconds
-        
-        return snapshots
+            yield {
+                "window_start": datetime.fromtimestamp(window_start).isoformat(),
+                "window_end": datetime.fromtimestamp(window_end).isoformat(),
+                "edges": edges,
+                "edge_count": len(edges)
+            }
     
     def get_brand_competitors(self, brand_name: str, 
                              top_n: int = 5) -> List[Dict[str, Any]]:
@@ -370,19 +662,29 @@ class CompetitorGraphAnalyzer:
         """
         c = self.conn.cursor()
         
+        # One indexed half per name column; an OR across both would scan
         c.execute('''
             SELECT 
-                CASE 
-                    WHEN brand_name_1 = ? THEN brand_name_2
-                    ELSE brand_name_1
-                END as competitor,
+                brand_name_2 as competitor,
                 co_mention_count,
                 avg_rank_distance,
                 strength_score,
                 first_seen,
-                last_seen
+                last_seen,
+                strftime('%Y-%m-%dT%H:%M:%S', last_seen, 'unixepoch', 'localtime')
             FROM competitor_relationships
-            WHERE brand_name_1 = ? OR brand_name_2 = ?
+            WHERE brand_name_1 = ?
+            UNION ALL
+            SELECT 
+                brand_name_1 as competitor,
+                co_mention_count,
+                avg_rank_distance,
+                strength_score,
+                first_seen,
+                last_seen,
+                strftime('%Y-%m-%dT%H:%M:%S', last_seen, 'unixepoch', 'localtime')
+            FROM competitor_relationships
+            WHERE brand_name_2 = ? AND brand_name_1 != ?
             ORDER BY strength_score DESC
             LIMIT ?
         ''', (brand_name, brand_name, brand_name, top_n))
@@ -391,14 +693,14 @@ class CompetitorGraphAnalyzer:
         
         competitors = []
         for row in results:
-            competitor, count, avg_dist, strength, first, last = row
+            competitor, count, avg_dist, strength, first, last, last_iso = row
             competitors.append({
                 "name": competitor,
                 "co_mentions": count,
                 "avg_rank_distance": round(avg_dist, 2),
                 "strength": round(strength, 3),
                 "relationship_age_days": round((last - first) / 86400, 1),
-                "last_seen": datetime.fromtimestamp(last).isoformat()
+                "last_seen": last_iso
             })
         
         return competitors
@@ -421,6 +723,7 @@ class CompetitorGraphAnalyzer:
             raise ImportError(
                 "NetworkX is required for this feature. Install with: pip install networkx"
             )
+        _import_networkx()
         
         # Get graph data
         graph_data = self.get_competitor_graph(min_strength=min_strength)
@@ -472,6 +775,7 @@ class CompetitorGraphAnalyzer:
                 "PyTorch Geometric is required for this feature. "
                 "Install with: pip install torch torch-geometric"
             )
+        _import_torch_geometric()
         
         # Get graph data
         graph_data = self.get_competitor_graph(min_strength=min_strength)
@@ -619,13 +923,15 @@ def print_competitor_graph_report(db_path: str = "llmseo.db",
         relationships_count = analyzer.update_competitor_relationships()
         print(f"✓ Updated {relationships_count} competitor relationships\n")
         
-        if relationships_count == 0:
+        # Updates are incremental, so a zero count on a re-run doesn't mean the
+        # graph is empty; go by what's stored
+        graph = analyzer.get_competitor_graph(min_strength=0.0)
+        if graph['metadata']['total_edges'] == 0:
             print("No competitor relationships found.")
             print("Brands need to be mentioned together in responses to build the graph.")
             return
         
         # Overall network statistics
-        graph = analyzer.get_competitor_graph(min_strength=0.0)
         print(f"NETWORK STATISTICS")
         print("-" * 70)
         print(f"Total Brands: {graph['metadata']['total_nodes']}")
@@ -634,9 +940,7 @@ def print_competitor_graph_report(db_path: str = "llmseo.db",
         # Top relationships
         print(f"\nSTRONGEST COMPETITOR RELATIONSHIPS")
         print("-" * 70)
-        top_edges = sorted(graph['edges'], key=lambda x: x['weight'], reverse=True)[:10]
-        
-        for i, edge in enumerate(top_edges, 1):
+        for i, edge in enumerate(analyzer.top_edges(10), 1):
             print(f"{i}. {edge['source']} ↔ {edge['target']}")
             print(f"   Strength: {edge['weight']:.3f} | "
                   f"Co-mentions: {edge['co_mentions']} | "
@@ -669,10 +973,7 @@ def print_competitor_graph_report(db_path: str = "llmseo.db",
                 print(f"\n{snapshot['window_start'][:10]} to {snapshot['window_end'][:10]}")
                 print(f"  Active Relationships: {snapshot['edge_count']}")
                 if snapshot['edge_count'] > 0:
-                    top_3 = sorted(snapshot['edges'], 
-                                  key=lambda x: x['count'], 
-                                  reverse=True)[:3]
-                    for edge in top_3:
+                    for edge in snapshot['edges'][:3]:
                         print(f"    • {edge['source']} ↔ {edge['target']} "
                               f"({edge['count']} mentions)")
         else:
@@ -689,24 +990,45 @@ def export_competitor_graph(db_path: str = "llmseo.db",
         analyzer.extract_co_mentions()
         analyzer.update_competitor_relationships()
         
-        # Get graph data
-        graph = analyzer.get_competitor_graph(min_strength=min_strength)
-        evolution = analyzer.get_temporal_evolution(days=90, window_days=7)
-        
-        export_data = {
-            "graph": graph,
-            "temporal_evolution": evolution,
-            "generated_at": datetime.now().isoformat(),
-            "min_strength_threshold": min_strength
-        }
-        
-        with open(output_file, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        # Written as the cursors are read, one node/edge/window per line, so
+        # the graph is never held in memory as a whole
+        node_count = edge_count = window_count = 0
+        with open(output_file, 'wb') as f:
+            f.write(b'{\n  "graph": {\n    "nodes": [')
+            for node in analyzer.iter_nodes(min_strength):
+                f.write(b',\n      ' if node_count else b'\n      ')
+                f.write(_dumps({"id": node, "label": node}))
+                node_count += 1
+            
+            f.write(b'\n    ],\n    "edges": [')
+            for edge in analyzer.iter_edges(min_strength):
+                f.write(b',\n      ' if edge_count else b'\n      ')
+                f.write(_dumps(edge))
+                edge_count += 1
+            
+            f.write(b'\n    ],\n    "metadata": ')
+            f.write(_dumps({
+                "total_nodes": node_count,
+                "total_edges": edge_count,
+                "min_strength_filter": min_strength
+            }))
+            
+            f.write(b'\n  },\n  "temporal_evolution": [')
+            for snapshot in analyzer.iter_temporal_evolution(days=90, window_days=7):
+                f.write(b',\n    ' if window_count else b'\n    ')
+                f.write(_dumps(snapshot))
+                window_count += 1
+            
+            f.write(b'\n  ],\n  "generated_at": ')
+            f.write(_dumps(datetime.now().isoformat()))
+            f.write(b',\n  "min_strength_threshold": ')
+            f.write(_dumps(min_strength))
+            f.write(b'\n}\n')
         
         print(f"✓ Competitor graph exported to {output_file}")
-        print(f"  Nodes: {graph['metadata']['total_nodes']}")
-        print(f"  Edges: {graph['metadata']['total_edges']}")
-        print(f"  Time Windows: {len(evolution)}")
+        print(f"  Nodes: {node_count}")
+        print(f"  Edges: {edge_count}")
+        print(f"  Time Windows: {window_count}")
 
 
 def export_networkx(db_path: str = "llmseo.db",
@@ -849,6 +1171,29 @@ def export_adjacency_matrix(db_path: str = "llmseo.db",
             print("Install NumPy with: pip install numpy")
 
 
+def run(db: str = "llmseo.db", report: bool = False, brand: Optional[str] = None,
+        export_file: Optional[str] = None, networkx_file: Optional[str] = None,
+        pyg_file: Optional[str] = None, adjacency_file: Optional[str] = None,
+        min_strength: float = 0.0, include_node_features: bool = True,
+        weighted: bool = True):
+    """Run a single export, or the competitor graph report if no export is requested"""
+    if export_file:
+        export_competitor_graph(db, export_file, min_strength)
+    elif networkx_file:
+        export_networkx(db, networkx_file, min_strength)
+    elif pyg_file:
+        export_pyg(db, pyg_file, min_strength, 
+                  include_node_features=include_node_features)
+    elif adjacency_file:
+        export_adjacency_matrix(db, adjacency_file, 
+                               min_strength, weighted=weighted)
+    elif report or brand:
+        print_competitor_graph_report(db, brand)
+    else:
+        # Default: show report
+        print_competitor_graph_report(db)
+
+
 def main():
     """Main CLI for competitor graph analysis"""
     parser = argparse.ArgumentParser(
@@ -874,22 +1219,18 @@ def main():
                        help='Use binary adjacency matrix (adjacency export only)')
     
     args = parser.parse_args()
-    
-    if args.export:
-        export_competitor_graph(args.db, args.export, args.min_strength)
-    elif args.export_networkx:
-        export_networkx(args.db, args.export_networkx, args.min_strength)
-    elif args.export_pyg:
-        export_pyg(args.db, args.export_pyg, args.min_strength, 
-                  include_node_features=not args.no_node_features)
-    elif args.export_adjacency:
-        export_adjacency_matrix(args.db, args.export_adjacency, 
-                               args.min_strength, weighted=not args.binary)
-    elif args.report or args.brand:
-        print_competitor_graph_report(args.db, args.brand)
-    else:
-        # Default: show report
-        print_competitor_graph_report(args.db)
+    run(
+        db=args.db,
+        report=args.report,
+        brand=args.brand,
+        export_file=args.export,
+        networkx_file=args.export_networkx,
+        pyg_file=args.export_pyg,
+        adjacency_file=args.export_adjacency,
+        min_strength=args.min_strength,
+        include_node_features=not args.no_node_features,
+        weighted=not args.binary
+    )
 
 
 if __name__ == "__main__":
@@ -9,35 +9,257 @@ This module provides tools to:
 """
 
 import re
+import sys
 import asyncio
 import aiohttp
 import sqlite3
 import time
 from typing import List, Dict, Any, Optional
-from urllib.parse import urlparse
-from collections import defaultdict
+from urllib.parse import urlsplit
+from collections import OrderedDict, defaultdict
+
+# Optional dependency for batch scoring
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+# Cheap pre-check that rejects anything that can't be an http(s) URL before
+# it gets parsed
+_URL_FAST_RE = re.compile(r'^https?://\S+$', re.IGNORECASE)
+
+# HEAD responses that may just mean the server doesn't support HEAD
+HEAD_REJECTED_STATUSES = frozenset({403, 405, 501})
+
+# Errors from network conditions rather than the URL itself (timeouts, DNS
+# and connection failures, a host already marked unreachable this run). They
+# are cached for the run but never persisted, so one blip doesn't mark a
+# whole domain inaccessible for ttl_hours
+TRANSIENT_ERROR_PREFIXES = ("Timeout", "Client error", "Connection error", "Host unreachable")
+
+# Risk levels in the order of the risk codes used by batch scoring
+RISK_LEVELS = ("low", "medium", "high")
+
+if HAS_NUMPY:
+    # Lower bounds of the medium and low risk bands, and code -> level lookup
+    _RISK_THRESHOLDS = np.array([0.4, 0.7])
+    _RISK_LEVEL_ARRAY = np.array(RISK_LEVELS)
+
+
+class _TTLCache:
+    """Size-bounded LRU mapping whose entries expire after a fixed TTL"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (expires_at, value)
+    
+    def __contains__(self, key) -> bool:
+        entry = self._data.get(key)
+        if entry is None:
+            return False
+        if entry[0] <= time.monotonic():
+            del self._data[key]
+            return False
+        return True
+    
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._data.move_to_end(key)
+        return self._data[key][1]
+    
+    def __setitem__(self, key, value):
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def update(self, items: Dict):
+        for key, value in items.items():
+            self[key] = value
 
 
 class SourceValidator:
     """Validates URLs and sources provided by LLMs"""
     
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, max_concurrency: int = 64,
+                 cache_db: Optional[str] = "url_validation.db", ttl_hours: float = 24,
+                 cache_size: int = 10_000):
         self.timeout = timeout
-        self.cache = {}  # Cache validation results
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_concurrency = max_concurrency
+        # Caps in-flight checks across every caller, not just one batch, so
+        # overlapping validate_sources/validate_url calls can't stack up
+        # thousands of concurrent requests
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.ttl_seconds = ttl_hours * 3600
+        # In-memory results, bounded so long runs over large corpora don't grow
+        # without limit and expiring on the same schedule as the persistent cache
+        self.cache = _TTLCache(maxsize=cache_size, ttl=self.ttl_seconds)
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Pending checks by URL, so concurrent lookups share one request
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Hosts that couldn't be connected to at all during this validator's life
+        self._unreachable_hosts = set()
         
-    async def validate_url(self, url: str) -> Dict[str, Any]:
+        # Persistent cache shared across runs (None disables it)
+        self.cache_db = cache_db
+        if self.cache_db:
+            self._ensure_cache_table()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the validator's pooled session, creating it on first use, so
+        every check reuses kept-alive connections and cached DNS lookups
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=self._timeout,
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_concurrency, limit_per_host=10, ttl_dns_cache=300)
+            )
+        return self._session
+    
+    async def aclose(self):
+        """Close the pooled session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+    
+    def _ensure_cache_table(self):
+        """Create the persistent URL validation cache if it doesn't exist"""
+        conn = sqlite3.connect(self.cache_db)
+        c = conn.cursor()
+        c.execute('''CREATE TABLE IF NOT EXISTS url_validation (
+            url TEXT PRIMARY KEY,
+            is_valid INTEGER,
+            is_accessible INTEGER,
+            status_code INTEGER,
+            content_type TEXT,
+            error TEXT,
+            checked_at REAL
+        )''')
+        c.execute('''CREATE INDEX IF NOT EXISTS idx_url_validation_checked_at 
+                    ON url_validation(checked_at)''')
+        conn.commit()
+        conn.close()
+    
+    def _load_cached(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch still-fresh validation results for the given URLs"""
+        cutoff = time.time() - self.ttl_seconds
+        found = {}
+        
+        conn = sqlite3.connect(self.cache_db)
+        c = conn.cursor()
+        # Stay under SQLite's bound-parameter limit
+        for i in range(0, len(urls), 500):
+            chunk = urls[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            c.execute(f'''
+                SELECT url, is_valid, is_accessible, status_code, content_type, error
+                FROM url_validation
+                WHERE url IN ({placeholders}) AND checked_at > ?
+            ''', (*chunk, cutoff))
+            for url, is_valid, is_accessible, status_code, content_type, error in c:
+                found[url] = {
+                    "url": url,
+                    "is_valid": bool(is_valid),
+                    "is_accessible": bool(is_accessible),
+                    "status_code": status_code,
+                    "content_type": content_type,
+                    "error": error
+                }
+        conn.close()
+        return found
+    
+    def _store_cached(self, results: List[Dict[str, Any]]):
+        """Upsert fresh validation results into the persistent cache"""
+        now = time.time()
+        conn = sqlite3.connect(self.cache_db)
+        conn.executemany('''
+            INSERT OR REPLACE INTO url_validation
+            (url, is_valid, is_accessible, status_code, content_type, error, checked_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', [
+            (r["url"], r["is_valid"], r["is_accessible"], r["status_code"],
+             r["content_type"], r["error"], now)
+            for r in results
+        ])
+        conn.commit()
+        conn.close()
+        
+    async def validate_url(
+        self,
+        url: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Dict[str, Any]:
         """
         Validate if a URL is accessible and returns basic metadata
         
         Args:
             url: The URL to validate
+            session: Session to issue requests on (the validator's own if omitted)
+            semaphore: Semaphore bounding in-flight requests (the validator's
+                own if omitted)
             
         Returns:
             Dictionary with validation results
         """
         if url in self.cache:
             return self.cache[url]
-            
+        
+        # Brands share domains, so the same URL is often requested again
+        # before its first check finishes; those callers wait on that check
+        # instead of issuing their own
+        task = self._inflight.get(url)
+        if task is None:
+            # Its own task, so a caller that gets cancelled only stops waiting
+            # and the check carries on for everyone else
+            task = asyncio.get_running_loop().create_task(
+                self._validate_and_cache(url, session, semaphore))
+            self._inflight[url] = task
+            task.add_done_callback(lambda done: self._inflight_done(url, done))
+        return await asyncio.shield(task)
+    
+    def _inflight_done(self, url: str, task: asyncio.Task):
+        """Forget a finished shared check"""
+        if self._inflight.get(url) is task:
+            del self._inflight[url]
+        # Mark the exception retrieved in case every caller stopped waiting
+        if not task.cancelled():
+            task.exception()
+    
+    async def _validate_and_cache(
+        self,
+        url: str,
+        session: Optional[aiohttp.ClientSession],
+        semaphore: Optional[asyncio.Semaphore]
+    ) -> Dict[str, Any]:
+        """Validate a URL and remember the result in memory"""
+        result = await self._validate_uncached(url, session, semaphore)
+        self.cache[url] = result
+        return result
+    
+    async def _validate_uncached(
+        self,
+        url: str,
+        session: Optional[aiohttp.ClientSession],
+        semaphore: Optional[asyncio.Semaphore]
+    ) -> Dict[str, Any]:
+        """Run the format and accessibility checks for a single URL"""
         result = {
             "url": url,
             "is_valid": False,
@@ -48,37 +270,43 @@ class SourceValidator:
         }
         
         # Basic URL format validation
+        if not _URL_FAST_RE.match(url):
+            result["error"] = "Invalid URL format"
+            return result
         try:
-            parsed = urlparse(url)
-            if not all([parsed.scheme, parsed.netloc]):
+            parts = urlsplit(url)
+            if not parts.netloc:
                 result["error"] = "Invalid URL format"
-                self.cache[url] = result
                 return result
+            host = parts.hostname
             result["is_valid"] = True
-        except Exception as e:
+        except ValueError as e:
             result["error"] = f"Parse error: {str(e)}"
-            self.cache[url] = result
             return result
         
         # Check URL accessibility
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.head(
-                    url, 
-                    timeout=aiohttp.ClientTimeout(total=self.timeout),
-                    allow_redirects=True
-                ) as response:
-                    result["is_accessible"] = response.status < 400
-                    result["status_code"] = response.status
-                    result["content_type"] = response.headers.get("Content-Type")
+            if session is None:
+                session = await self._get_session()
+            async with semaphore or self._semaphore:
+                # Checked once the slot is ours, so URLs queued behind a
+                # failing host benefit too
+                if host in self._unreachable_hosts:
+                    result["error"] = f"Host unreachable: {host}"
+                    return result
+                await self._check_url(session, url, result)
         except asyncio.TimeoutError:
             result["error"] = "Timeout"
+        except aiohttp.ClientConnectorError as e:
+            # DNS failures, refused connections and bad certificates hold for
+            # every URL on the host, so later ones skip the network
+            self._unreachable_hosts.add(host)
+            result["error"] = f"Client error: {str(e)}"
         except aiohttp.ClientError as e:
             result["error"] = f"Client error: {str(e)}"
-        except Exception as e:
-            result["error"] = f"Unexpected error: {str(e)}"
+        except OSError as e:
+            result["error"] = f"Connection error: {str(e)}"
         
-        self.cache[url] = result
         return result
     
     async def validate_sources(self, sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -91,15 +319,64 @@ class SourceValidator:
         Returns:
             List of validation results
         """
-        tasks = []
-        for source in sources:
-            if "url" in source and source["url"]:
-                tasks.append(self.validate_url(source["url"]))
+        urls = [source["url"] for source in sources if source.get("url")]
         
-        if not tasks:
+        if not urls:
             return []
+        
+        # Only hit the network for URLs missing from both caches. Results are
+        # collected locally since a batch larger than the cache evicts its own
+        # earliest entries
+        outcomes = {}
+        misses = []
+        for url in dict.fromkeys(urls):
+            if url in self.cache:
+                outcomes[url] = self.cache[url]
+            else:
+                misses.append(url)
+        if misses and self.cache_db:
+            loaded = self._load_cached(misses)
+            self.cache.update(loaded)
+            outcomes.update(loaded)
+            misses = [url for url in misses if url not in loaded]
+        
+        if misses:
+            # The pooled session is shared across batches so connections and
+            # DNS lookups are reused, with in-flight requests capped by the
+            # validator's semaphore
+            session = await self._get_session()
+            results = await asyncio.gather(
+                *(self.validate_url(url, session) for url in misses),
+                return_exceptions=True
+            )
+            outcomes.update(zip(misses, results))
             
-        return await asyncio.gather(*tasks, return_exceptions=True)
+            if self.cache_db:
+                self._store_cached([
+                    r for r in results
+                    if isinstance(r, dict) and not
+                    (r["error"] or "").startswith(TRANSIENT_ERROR_PREFIXES)
+                ])
+        
+        return [outcomes[url] for url in urls]
+    
+    async def _check_url(self, session: aiohttp.ClientSession, url: str, result: Dict[str, Any]):
+        """Issue a HEAD request, falling back to GET for servers that reject HEAD"""
+        async with session.head(url, timeout=self._timeout, allow_redirects=True) as response:
+            status = response.status
+            content_type = response.headers.get("Content-Type")
+        
+        # Many CDNs answer HEAD with 403/405/501 while serving GET fine; ask
+        # for a single byte and leave the body unread
+        if status in HEAD_REJECTED_STATUSES:
+            async with session.get(url, headers={"Range": "bytes=0-0"},
+                                   timeout=self._timeout, allow_redirects=True) as response:
+                status = response.status
+                content_type = response.headers.get("Content-Type")
+        
+        result["is_accessible"] = status < 400
+        result["status_code"] = status
+        result["content_type"] = content_type
 
 
 class HallucinationScorer:
@@ -111,6 +388,11 @@ class HallucinationScorer:
             "source_accessible": 0.3,
             "confidence_score": 0.4
         }
+        # Scoring constants unpacked once rather than looked up on every call
+        self._w_has = self.weights["has_source"]
+        self._w_sa = self.weights["source_accessible"]
+        self._w_conf = self.weights["confidence_score"]
+        self._max_possible = sum(self.weights.values()) + 0.1  # Include max multi-source bonus
     
     def calculate_reliability_score(
         self, 
@@ -136,21 +418,20 @@ class HallucinationScorer:
         
         # Source availability bonus
         if has_source:
-            score += self.weights["has_source"]
+            score += self._w_has
             # Extra credit for multiple sources
             if source_count > 1:
                 score += min(0.1, 0.02 * (source_count - 1))
         
         # Source accessibility bonus
         if source_accessible:
-            score += self.weights["source_accessible"]
+            score += self._w_sa
         
         # Confidence score
-        score += self.weights["confidence_score"] * confidence
+        score += self._w_conf * confidence
         
         # Normalize to 0-1 range
-        max_possible = sum(self.weights.values()) + 0.1  # Include max multi-source bonus
-        normalized_score = min(1.0, score / max_possible)
+        normalized_score = min(1.0, score / self._max_possible)
         
         # Determine hallucination risk
         if normalized_score >= 0.7:
@@ -169,6 +450,61 @@ class HallucinationScorer:
             "source_count": source_count
         }
     
+    def calculate_reliability_scores_batch(
+        self,
+        has_source: "np.ndarray",
+        source_accessible: "np.ndarray",
+        confidence: "np.ndarray",
+        source_count: "np.ndarray"
+    ) -> Dict[str, Any]:
+        """
+        Vectorized calculate_reliability_score over many claims at once
+        
+        Args:
+            has_source: Boolean array, whether each claim has source(s)
+            source_accessible: Boolean array, whether any source is accessible
+            confidence: Float array of self-reported confidences (0-1)
+            source_count: Integer array of source counts
+            
+        Returns:
+            Dictionary with reliability_score (float array), risk_code (int
+            array indexing RISK_LEVELS), risk_level (string array) and
+            risk_counts (counts per RISK_LEVELS)
+            
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        if not HAS_NUMPY:
+            raise ImportError(
+                "NumPy is required for this feature. Install with: pip install numpy"
+            )
+        
+        has_source = np.asarray(has_source, dtype=bool)
+        source_accessible = np.asarray(source_accessible, dtype=bool)
+        confidence = np.asarray(confidence, dtype=np.float64)
+        source_count = np.asarray(source_count, dtype=np.float64)
+        
+        # Terms are added in the same order as the scalar version so both
+        # produce bit-identical scores
+        multi_source_bonus = np.minimum(0.1, 0.02 * np.maximum(0, source_count - 1))
+        score = np.where(has_source, self._w_has + multi_source_bonus, 0.0)
+        score = score + np.where(source_accessible, self._w_sa, 0.0)
+        score = score + self._w_conf * confidence
+        
+        normalized = np.minimum(1.0, score / self._max_possible)
+        
+        # Branchless classification: counting the thresholds at or below each
+        # score maps >= 0.7 to 0 (low), >= 0.4 to 1 (medium), else 2 (high)
+        risk_code = len(RISK_LEVELS) - 1 - np.searchsorted(
+            _RISK_THRESHOLDS, normalized, side="right")
+        
+        return {
+            "reliability_score": normalized,
+            "risk_code": risk_code,
+            "risk_level": _RISK_LEVEL_ARRAY[risk_code],
+            "risk_counts": np.bincount(risk_code, minlength=len(RISK_LEVELS))
+        }
+    
     def analyze_response_quality(self, mentions: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Analyze overall quality of an LLM response based on all mentions
@@ -235,6 +571,7 @@ def create_hallucination_tables(conn):
         timestamp REAL,
         FOREIGN KEY (mention_id) REFERENCES mentions (id)
     )''')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_sources_mention ON sources(mention_id)')
     
     # Table for hallucination scores
     c.execute('''CREATE TABLE IF NOT EXISTS hallucination_scores (
@@ -249,6 +586,11 @@ def create_hallucination_tables(conn):
         timestamp REAL,
         FOREIGN KEY (mention_id) REFERENCES mentions (id)
     )''')
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_hallucination_scores_mention 
+                ON hallucination_scores(mention_id)''')
+    # Serves the report's high-risk listing (filter and order) without a sort
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_hallucination_scores_risk 
+                ON hallucination_scores(risk_level, reliability_score)''')
     
     # Table for response quality metrics
     c.execute('''CREATE TABLE IF NOT EXISTS response_quality (
@@ -267,135 +609,325 @@ def create_hallucination_tables(conn):
     conn.commit()
 
 
-async def analyze_hallucinations(db_path: str = "llmseo.db", verify_urls: bool = True):
+# Responses per unit of work passed through the analyze_hallucinations pipeline
+PIPELINE_BLOCK = 200
+# Concurrent validate-and-score workers in analyze_hallucinations
+PIPELINE_WORKERS = 8
+# Responses scored per transaction in analyze_hallucinations
+COMMIT_EVERY = 1000
+
+
+def _iter_response_blocks(conn: sqlite3.Connection, block_size: int):
     """
-    Analyze existing responses for potential hallucinations
-    
-    Args:
-        db_path: Path to SQLite database
-        verify_urls: Whether to verify URL accessibility (can be slow)
+    Yield the responses to analyze in blocks of (response_id, mentions) pairs,
+    each mention carrying the URLs of its sources
     """
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    
-    create_hallucination_tables(conn)
-    
-    print("Analyzing responses for hallucination risks...\n")
-    
-    # Get all responses with their mentions and sources
-    c.execute('''
+    # Responses, mentions and sources in one pass, streamed off the cursor;
+    # a mention appears once per source in the join, and rows for the same
+    # response and mention are adjacent thanks to the ORDER BY
+    c = conn.execute('''
         SELECT 
             r.id as response_id,
             m.id as mention_id,
             m.brand_name,
             r.provider_name,
             r.model_name,
-            r.query_id
+            r.query_id,
+            s.url
         FROM responses r
         LEFT JOIN mentions m ON r.id = m.response_id
+        LEFT JOIN sources s ON s.mention_id = m.id
         WHERE r.error_message IS NULL
-        ORDER BY r.id, m.rank_position
+        ORDER BY r.id, m.rank_position, m.id, s.id
     ''')
     
-    responses = c.fetchall()
+    block = []
+    current_response = None
+    mention = None
+    for response_id, mention_id, brand_name, provider, model, query_id, url in c:
+        if response_id != current_response:
+            if len(block) == block_size:
+                yield block
+                block = []
+            current_response = response_id
+            mentions = []
+            block.append((response_id, mentions))
+            mention = None
+        if mention_id is None:
+            continue
+        if mention is None or mention["mention_id"] != mention_id:
+            mention = {
+                "mention_id": mention_id,
+                "brand_name": brand_name,
+                "provider": provider,
+                "model": model,
+                "query_id": query_id,
+                "urls": []
+            }
+            mentions.append(mention)
+        if url is not None:
+            mention["urls"].append(url)
+    
+    if block:
+        yield block
+
+
+def _score_claims(scorer: HallucinationScorer, claims: List[tuple]):
+    """
+    Score (mention_id, has_source, source_accessible, confidence, source_count)
+    claims, vectorized when NumPy is available
     
-    if not responses:
-        print("No responses found to analyze")
-        conn.close()
-        return
+    Returns:
+        Parallel lists of reliability scores and risk levels, one per claim
+    """
+    if not claims:
+        return [], []
+    
+    if HAS_NUMPY:
+        _, has_sources, accessibles, confidences, counts = zip(*claims)
+        batch = scorer.calculate_reliability_scores_batch(
+            np.array(has_sources), np.array(accessibles),
+            np.array(confidences), np.array(counts)
+        )
+        return batch["reliability_score"].tolist(), batch["risk_level"].tolist()
+    
+    reliability_scores = []
+    risk_levels = []
+    for _, has_source, source_accessible, confidence, source_count in claims:
+        score_result = scorer.calculate_reliability_score(
+            has_source=has_source,
+            source_accessible=source_accessible,
+            confidence=confidence,
+            source_count=source_count
+        )
+        reliability_scores.append(score_result["reliability_score"])
+        risk_levels.append(score_result["risk_level"])
+    return reliability_scores, risk_levels
+
+
+async def analyze_hallucinations(db_path: str = "llmseo.db", verify_urls: bool = True,
+                                 verbose: bool = False):
+    """
+    Analyze existing responses for potential hallucinations
+    
+    Runs as a pipeline so database reads and writes overlap with URL
+    validation: a reader streams blocks of responses, workers validate their
+    sources and score the mentions, and a single writer stores the scores.
+    
+    Args:
+        db_path: Path to SQLite database
+        verify_urls: Whether to verify URL accessibility (can be slow)
+        verbose: Whether to print the score of every mention
+    """
+    # Autocommit; the scoring inserts below manage their own transactions
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    # WAL only fsyncs at checkpoints and lets reports read during the run;
+    # NORMAL sync is plenty for a re-runnable analysis job
+    conn.executescript('''
+        PRAGMA journal_mode = WAL;
+        PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA cache_size = -65536;
+    ''')
+    c = conn.cursor()
+    
+    create_hallucination_tables(conn)
+    
+    print("Analyzing responses for hallucination risks...\n")
+    
+    # Scores from earlier runs stay in the table, so response quality is
+    # aggregated only over the rows this run inserts
+    c.execute('SELECT COALESCE(MAX(id), 0) FROM hallucination_scores')
+    last_score_id = c.fetchone()[0]
     
-    # Group by response_id
-    response_groups = defaultdict(list)
-    for row in responses:
-        response_id = row[0]
-        response_groups[response_id].append({
-            "mention_id": row[1],
-            "brand_name": row[2],
-            "provider": row[3],
-            "model": row[4],
-            "query_id": row[5]
-        })
-    
-    validator = SourceValidator() if verify_urls else None
     scorer = HallucinationScorer()
+    validator = SourceValidator(cache_db=db_path) if verify_urls else None
     
-    total_analyzed = 0
+    # Bounded so the reader only runs a few blocks ahead of the workers
+    block_queue = asyncio.Queue(maxsize=PIPELINE_WORKERS * 2)
+    result_queue = asyncio.Queue(maxsize=PIPELINE_WORKERS * 2)
     
-    for response_id, mentions in response_groups.items():
-        print(f"Analyzing Response #{response_id}")
-        
-        mention_scores = []
-        
-        for mention in mentions:
-            if mention["mention_id"] is None:
-                continue
-                
-            mention_id = mention["mention_id"]
-            
-            # Check if sources exist for this mention
-            c.execute('SELECT url FROM sources WHERE mention_id = ?', (mention_id,))
-            sources = c.fetchall()
-            
-            has_source = len(sources) > 0
-            source_accessible = False
-            
-            # Validate sources if requested
-            if verify_urls and sources and validator:
+    totals = {"responses": 0, "mentions": 0}
+    
+    async def read_blocks():
+        # Own connection, so the open read doesn't interleave with the
+        # writer's transactions on conn
+        read_conn = sqlite3.connect(db_path)
+        try:
+            for block in _iter_response_blocks(read_conn, PIPELINE_BLOCK):
+                await block_queue.put(block)
+        finally:
+            read_conn.close()
+        # Only on success: if another task failed, the task group is cancelling
+        # the workers and these puts could wait on a full queue forever
+        for _ in range(PIPELINE_WORKERS):
+            await block_queue.put(None)
+    
+    async def score_blocks():
+        while (block := await block_queue.get()) is not None:
+            accessible_urls = set()
+            if validator is not None:
+                urls = list(dict.fromkeys(
+                    url for _, mentions in block for mention in mentions
+                    for url in mention["urls"]))
                 validation_results = await validator.validate_sources(
-                    [{"url": s[0]} for s in sources]
+                    [{"url": url} for url in urls]
                 )
-                source_accessible = any(
-                    r.get("is_accessible", False) for r in validation_results
-                    if isinstance(r, dict)
-                )
-            
-            # For now, use a default confidence if not stored
-            # In production, this would come from the LLM response
-            confidence = 0.7 if has_source else 0.5
+                accessible_urls = {
+                    r["url"] for r in validation_results
+                    if isinstance(r, dict) and r.get("is_accessible", False)
+                }
             
-            # Calculate reliability score
-            score_result = scorer.calculate_reliability_score(
-                has_source=has_source,
-                source_accessible=source_accessible,
-                confidence=confidence,
-                source_count=len(sources)
-            )
+            claims = []
+            for _, mentions in block:
+                for mention in mentions:
+                    sources = mention["urls"]
+                    has_source = len(sources) > 0
+                    claims.append((
+                        mention["mention_id"],
+                        has_source,
+                        any(url in accessible_urls for url in sources),
+                        # For now, use a default confidence if not stored
+                        # In production, this would come from the LLM response
+                        0.7 if has_source else 0.5,
+                        len(sources)
+                    ))
             
-            # Store hallucination score
-            c.execute('''INSERT INTO hallucination_scores 
-                        (mention_id, confidence_score, reliability_score, risk_level,
-                         has_source, source_accessible, source_count, timestamp)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
-                     (mention_id, confidence, score_result["reliability_score"],
-                      score_result["risk_level"], has_source, source_accessible,
-                      len(sources), time.time()))
+            await result_queue.put((block, claims, _score_claims(scorer, claims)))
+        await result_queue.put(None)
+    
+    async def write_scores():
+        # Rows are buffered and written with executemany in large transactions
+        # rather than one statement and journal sync per row, flushing
+        # periodically so a huge backfill doesn't hold the lock throughout
+        score_rows = []
+        
+        def flush():
+            c.execute('BEGIN')
+            try:
+                c.executemany('''INSERT INTO hallucination_scores 
+                                (mention_id, confidence_score, reliability_score, risk_level,
+                                 has_source, source_accessible, source_count, timestamp)
+                                VALUES (?, ?, ?, ?, ?, ?, ?, ?)''', score_rows)
+                c.execute('COMMIT')
+            except BaseException:
+                c.execute('ROLLBACK')
+                raise
+            score_rows.clear()
+        
+        unflushed_responses = 0
+        finished_workers = 0
+        while finished_workers < PIPELINE_WORKERS:
+            item = await result_queue.get()
+            if item is None:
+                finished_workers += 1
+                continue
             
-            mention_scores.append(score_result)
+            block, claims, (reliability_scores, risk_levels) = item
+            now = time.time()
+            score_rows.extend(
+                (mention_id, confidence, reliability, risk_level,
+                 has_source, source_accessible, source_count, now)
+                for (mention_id, has_source, source_accessible, confidence, source_count),
+                    reliability, risk_level in zip(claims, reliability_scores, risk_levels)
+            )
             
-            print(f"  - {mention['brand_name']}: "
-                  f"Reliability={score_result['reliability_score']:.2f}, "
-                  f"Risk={score_result['risk_level']}")
+            # Per-mention output is opt-in and written once per block, since
+            # formatting and printing every line dominates on large datasets
+            if verbose:
+                scored = zip(reliability_scores, risk_levels)
+                lines = []
+                for response_id, mentions in block:
+                    lines.append(f"Analyzing Response #{response_id}")
+                    for mention in mentions:
+                        reliability, risk_level = next(scored)
+                        lines.append(f"  - {mention['brand_name']}: "
+                                     f"Reliability={reliability:.2f}, Risk={risk_level}")
+                sys.stdout.write("\n".join(lines) + "\n")
             
-            total_analyzed += 1
-        
-        # Calculate overall response quality
-        quality = scorer.analyze_response_quality(mention_scores)
+            totals["mentions"] += len(claims)
+            totals["responses"] += len(block)
+            unflushed_responses += len(block)
+            if unflushed_responses >= COMMIT_EVERY:
+                flush()
+                unflushed_responses = 0
         
-        c.execute('''INSERT INTO response_quality
-                    (response_id, avg_reliability, high_risk_count, medium_risk_count,
-                     low_risk_count, total_mentions, overall_quality, timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
-                 (response_id, quality["avg_reliability"], quality["high_risk_count"],
-                  quality["medium_risk_count"], quality["low_risk_count"],
-                  quality["total_mentions"], quality["overall_quality"], time.time()))
-        
-        print(f"  Overall Quality: {quality['overall_quality']} "
-              f"(Avg Reliability: {quality['avg_reliability']:.2f})\n")
+        flush()
     
-    conn.commit()
+    try:
+        async with asyncio.TaskGroup() as tasks:
+            tasks.create_task(read_blocks())
+            for _ in range(PIPELINE_WORKERS):
+                tasks.create_task(score_blocks())
+            tasks.create_task(write_scores())
+    except ExceptionGroup as group:
+        # Surface the failure itself rather than the task group's wrapper
+        raise group.exceptions[0]
+    finally:
+        if validator is not None:
+            await validator.aclose()
+    
+    if not totals["responses"]:
+        print("No responses found to analyze")
+        conn.close()
+        return
+    
+    # Aggregate every response's quality in one set-based statement, with
+    # the same thresholds as HallucinationScorer.analyze_response_quality
+    quality_timestamp = time.time()
+    c.execute('BEGIN')
+    c.execute('''
+        INSERT INTO response_quality
+            (response_id, avg_reliability, high_risk_count, medium_risk_count,
+             low_risk_count, total_mentions, overall_quality, timestamp)
+        WITH per_response AS (
+            SELECT 
+                r.id as response_id,
+                COALESCE(AVG(hs.reliability_score), 0.0) as avg_reliability,
+                COALESCE(SUM(hs.risk_level = 'high'), 0) as high_risk_count,
+                COALESCE(SUM(hs.risk_level = 'medium'), 0) as medium_risk_count,
+                COALESCE(SUM(hs.risk_level = 'low'), 0) as low_risk_count,
+                COUNT(hs.id) as total_mentions
+            FROM responses r
+            LEFT JOIN mentions m ON r.id = m.response_id
+            LEFT JOIN hallucination_scores hs ON hs.mention_id = m.id AND hs.id > ?
+            WHERE r.error_message IS NULL
+            GROUP BY r.id
+        )
+        SELECT 
+            response_id, avg_reliability, high_risk_count, medium_risk_count,
+            low_risk_count, total_mentions,
+            CASE
+                WHEN total_mentions = 0 THEN 'poor'
+                WHEN avg_reliability >= 0.7 AND high_risk_count = 0 THEN 'excellent'
+                WHEN avg_reliability >= 0.5 AND high_risk_count <= 1 THEN 'good'
+                WHEN avg_reliability >= 0.3 THEN 'fair'
+                ELSE 'poor'
+            END,
+            ?
+        FROM per_response
+    ''', (last_score_id, quality_timestamp))
+    c.execute('COMMIT')
+    
+    c.execute('''
+        SELECT overall_quality, COUNT(*)
+        FROM response_quality
+        WHERE timestamp = ?
+        GROUP BY overall_quality
+        ORDER BY COUNT(*) DESC
+    ''', (quality_timestamp,))
+    print("Response quality: " + ", ".join(f"{quality}={count}" for quality, count in c))
+    
+    # Refresh planner statistics so the report's joins use the indexes
+    c.executescript('''
+        PRAGMA analysis_limit=1000;
+        ANALYZE hallucination_scores;
+        ANALYZE response_quality;
+        ANALYZE sources;
+    ''')
     conn.close()
     
-    print(f"✓ Analyzed {total_analyzed} mentions across {len(response_groups)} responses")
+    print(f"✓ Analyzed {totals['mentions']} mentions across {totals['responses']} responses")
 
 
 def print_hallucination_report(db_path: str = "llmseo.db"):
@@ -510,6 +1042,16 @@ def print_hallucination_report(db_path: str = "llmseo.db"):
     conn.close()
 
 
+async def run(db: str = "llmseo.db", analyze: bool = False, report: bool = False,
+              verify_urls: bool = False, verbose: bool = False):
+    """Run hallucination analysis and/or the report (report by default)"""
+    if analyze:
+        await analyze_hallucinations(db, verify_urls=verify_urls, verbose=verbose)
+    
+    if report or (not analyze):
+        print_hallucination_report(db)
+
+
 async def main():
     """Main function for hallucination analysis"""
     import argparse
@@ -520,14 +1062,11 @@ async def main():
     parser.add_argument('--report', action='store_true', help='Show hallucination report')
     parser.add_argument('--verify-urls', action='store_true', 
                        help='Verify URL accessibility (slower)')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Print the score of every mention during analysis')
     
     args = parser.parse_args()
-    
-    if args.analyze:
-        await analyze_hallucinations(args.db, verify_urls=args.verify_urls)
-    
-    if args.report or (not args.analyze):
-        print_hallucination_report(args.db)
+    await run(**vars(args))
 
 
 if __name__ == "__main__":
@@ -6,7 +6,14 @@ Uses cheap models (GPT-5 nano or Ollama) to evaluate brand mentions,
 output quality, and other test criteria.
 """
 import asyncio
-from typing import Optional, List, Dict, Any
+import hashlib
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import sys
@@ -17,7 +24,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from baml_client.async_client import b
-from baml_client.types import BrandMatchResult, EvalResult, BrandMatchBatchResult
+from baml_client.types import BrandMatchResult, EvalResult, BrandMatchBatchResult, BrandQuery
 
 
 class EvaluatorBackend(Enum):
@@ -33,6 +40,52 @@ class EvaluationConfig:
     confidence_threshold: float = 0.7  # Minimum confidence for a match
     fallback_to_regex: bool = True  # Use regex as fallback if LLM fails
     cache_results: bool = True  # Cache evaluation results
+    cache_max: int = 10_000  # Most results kept; least recently used go first
+    batch_max: int = 1  # Brands per text packed into one batch call (1 disables)
+    batch_wait_ms: float = 10  # How long a brand waits for others on the same text
+    cache_db: Optional[str] = None  # SQLite file to keep results across runs (opt-in)
+    cache_ttl_days: float = 30  # Age at which a stored result is re-evaluated
+    breaker_threshold: int = 5  # Consecutive LLM failures that open the circuit
+    breaker_cooldown_s: float = 30  # How long an open circuit skips the LLM
+
+
+def _whole_words(terms: List[str]) -> "re.Pattern":
+    """Case-insensitive pattern matching any of the terms as whole words"""
+    # Longest first, so a longer alias wins over its own prefix
+    alternation = "|".join(
+        re.escape(term) for term in sorted(terms, key=len, reverse=True))
+    # Lookarounds rather than \b, which fails next to names like "C++"
+    return re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _brand_patterns(brand_name: str, aliases: tuple):
+    """Compiled name and alias patterns for a brand, built once per brand"""
+    alias_terms = [alias for alias in aliases if alias]
+    return (
+        _whole_words([brand_name]) if brand_name else None,
+        _whole_words(alias_terms) if alias_terms else None,
+        # Matched text back to the alias as configured; first listed wins
+        {alias.lower(): alias for alias in reversed(alias_terms)}
+    )
+
+
+def _matched_alias(
+    matched_text: Optional[str],
+    brand_name: str,
+    aliases: List[str]
+) -> Optional[str]:
+    """Configured name or alias found in a batch match's quoted text, if any"""
+    if not matched_text:
+        return None
+    name_pattern, alias_pattern, alias_lookup = _brand_patterns(
+        brand_name, tuple(aliases))
+    if name_pattern is not None and name_pattern.search(matched_text):
+        return brand_name
+    m = alias_pattern.search(matched_text) if alias_pattern is not None else None
+    if m:
+        return alias_lookup.get(m.group().lower(), m.group())
+    return None
 
 
 class LLMEvaluator:
@@ -45,11 +98,137 @@ class LLMEvaluator:
     
     def __init__(self, config: Optional[EvaluationConfig] = None):
         self.config = config or EvaluationConfig()
-        self._cache: Dict[str, Any] = {}
+        self._cache: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._cache_max = self.config.cache_max or 10_000
+        # LLM calls currently running, keyed like the cache, so concurrent
+        # identical evaluations share one call
+        self._inflight: Dict[bytes, asyncio.Task] = {}
+        # Brand matches waiting to be sent as one batch call, per text
+        self._pending: Dict[str, List[Tuple[str, List[str], asyncio.Future]]] = {}
+        self._flush_handles: Dict[str, asyncio.TimerHandle] = {}
+        self._batch_tasks = set()
+        
+        # Circuit breaker: after repeated failures, skip the LLM for a while
+        self._consecutive_failures = 0
+        self._breaker_open_until = 0.0
+        
+        # Persistent cache shared across runs. Its connection is opened on
+        # first use and only touched from one worker thread, so lookups and
+        # stores don't block the event loop (see _run_db)
+        self.cache_db = self.config.cache_db if self.config.cache_results else None
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_executor: Optional[ThreadPoolExecutor] = None
+    
+    def _cache_key(self, *args) -> bytes:
+        """
+        Generate cache key from arguments.
+        
+        A 128-bit BLAKE2 digest of the arguments' reprs: unlike hash() it is
+        stable across processes, and collisions are negligible.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        # The persistent cache outlives the backend choice, so key on it too
+        for arg in (self.config.backend.value, *args):
+            h.update(repr(arg).encode("utf-8"))
+            h.update(b"\x00")
+        return h.digest()
+    
+    def _breaker_open(self) -> bool:
+        """Whether recent failures mean the LLM shouldn't be called right now"""
+        return time.monotonic() < self._breaker_open_until
+    
+    def _record_outcome(self, ok: bool):
+        """Track consecutive LLM failures, opening the circuit at the threshold"""
+        if ok:
+            self._consecutive_failures = 0
+            return
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= self.config.breaker_threshold:
+            self._breaker_open_until = time.monotonic() + self.config.breaker_cooldown_s
+            self._consecutive_failures = 0
+    
+    def _remember(self, cache_key: bytes, result: BrandMatchResult):
+        """Add a result to the in-memory LRU, evicting the oldest if full"""
+        self._cache[cache_key] = result
+        if len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False)
+    
+    def _db_conn(self) -> sqlite3.Connection:
+        """The persistent cache connection, opened on first use"""
+        if self._db is None:
+            self._db = sqlite3.connect(self.cache_db)
+            self._ensure_cache_table()
+        return self._db
+    
+    def _db_thread(self) -> ThreadPoolExecutor:
+        """The single worker thread every persistent cache access runs on"""
+        if self._db_executor is None:
+            self._db_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="llm-eval-cache")
+        return self._db_executor
+    
+    async def _run_db(self, fn, *args):
+        """Run a persistent cache operation off the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._db_thread(), fn, *args)
+    
+    def close(self):
+        """Close the persistent cache connection and its worker thread"""
+        if self._db_executor is None:
+            return
+        self._db_executor.submit(self._close_db).result()
+        self._db_executor.shutdown()
+        self._db_executor = None
+    
+    def _close_db(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+    
+    def _ensure_cache_table(self):
+        """Create the persistent evaluation cache if it doesn't exist"""
+        self._db.execute('''CREATE TABLE IF NOT EXISTS eval_cache (
+            key BLOB PRIMARY KEY,
+            is_match INTEGER,
+            confidence REAL,
+            matched_alias TEXT,
+            reasoning TEXT,
+            created_at REAL
+        )''')
+        self._db.commit()
+    
+    def _load_cached(self, cache_key: bytes) -> Optional[BrandMatchResult]:
+        """Fetch a brand match stored by this or an earlier run, if still fresh"""
+        cutoff = time.time() - self.config.cache_ttl_days * 86400
+        
+        row = self._db_conn().execute('''
+            SELECT is_match, confidence, matched_alias, reasoning
+            FROM eval_cache
+            WHERE key = ? AND created_at > ?
+        ''', (cache_key, cutoff)).fetchone()
+        if row is None:
+            return None
+        
+        from baml_client.types import BrandMatchResult as BrandMatchResultType
+        
+        is_match, confidence, matched_alias, reasoning = row
+        return BrandMatchResultType(
+            is_match=bool(is_match),
+            confidence=confidence,
+            matched_alias=matched_alias,
+            reasoning=reasoning
+        )
     
-    def _cache_key(self, *args) -> str:
-        """Generate cache key from arguments"""
-        return str(hash(args))
+    def _store_cached(self, cache_key: bytes, result: BrandMatchResult):
+        """Upsert a fresh brand match into the persistent cache"""
+        conn = self._db_conn()
+        conn.execute('''
+            INSERT OR REPLACE INTO eval_cache
+            (key, is_match, confidence, matched_alias, reasoning, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (cache_key, result.is_match, result.confidence,
+              result.matched_alias, result.reasoning, time.time()))
+        conn.commit()
     
     async def match_brand(
         self,
@@ -76,38 +255,245 @@ class LLMEvaluator:
             BrandMatchResult with match status, confidence, and reasoning
         """
         aliases = brand_aliases or []
+        # Alias order doesn't change the answer, so it doesn't change the key
+        cache_key = self._cache_key(text, brand_name, tuple(sorted(aliases)))
         
         # Check cache first
-        if self.config.cache_results:
-            cache_key = self._cache_key(text, brand_name, tuple(aliases))
-            if cache_key in self._cache:
-                return self._cache[cache_key]
+        if self.config.cache_results and cache_key in self._cache:
+            self._cache.move_to_end(cache_key)
+            return self._cache[cache_key]
+        if self.cache_db:
+            result = await self._run_db(self._load_cached, cache_key)
+            if result is not None:
+                self._remember(cache_key, result)
+                return result
+        
+        # Don't pay for a round trip that is expected to fail
+        if self._breaker_open():
+            if self.config.fallback_to_regex:
+                return self._fallback_match(text, brand_name, aliases)
+            raise RuntimeError(
+                f"{self.config.backend.value} evaluator is failing; "
+                f"skipping LLM calls for {self.config.breaker_cooldown_s}s")
         
+        try:
+            return await self._match_brand_shared(
+                cache_key, text, brand_name, aliases)
+            
+        except Exception as e:
+            # Fallback to simple matching if configured
+            if self.config.fallback_to_regex:
+                return self._fallback_match(text, brand_name, aliases)
+            raise e
+    
+    async def _match_brand_shared(
+        self,
+        cache_key: bytes,
+        text: str,
+        brand_name: str,
+        aliases: List[str]
+    ) -> BrandMatchResult:
+        """
+        Run the LLM brand match, joining an identical call already in flight
+        instead of issuing a second one
+        """
+        task = self._inflight.get(cache_key)
+        if task is None:
+            # Its own task, so a caller that gets cancelled only stops waiting
+            # and the call carries on for everyone else
+            task = asyncio.get_running_loop().create_task(
+                self._match_brand_call(cache_key, text, brand_name, aliases))
+            self._inflight[cache_key] = task
+            task.add_done_callback(
+                lambda done: self._inflight_done(cache_key, done))
+        return await asyncio.shield(task)
+    
+    def _inflight_done(self, cache_key: bytes, task: asyncio.Task):
+        """Forget a finished shared call"""
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+        # Mark the exception retrieved in case every caller stopped waiting
+        if not task.cancelled():
+            task.exception()
+    
+    async def _match_brand_call(
+        self,
+        cache_key: bytes,
+        text: str,
+        brand_name: str,
+        aliases: List[str]
+    ) -> BrandMatchResult:
+        """Make the LLM brand match call and cache its result"""
+        # A batch call serves several keys, so it records its own outcome once
+        # (see _resolve_brand_batch) rather than once per brand here
+        batched = (self.config.backend == EvaluatorBackend.OPENAI and
+                   self.config.batch_max > 1)
         try:
             if self.config.backend == EvaluatorBackend.OPENAI:
-                result = await b.EvalBrandMatch(
-                    text=text,
-                    brand_name=brand_name,
-                    brand_aliases=aliases
-                )
+                if batched:
+                    result = await self._match_brand_batched(
+                        text, brand_name, aliases)
+                else:
+                    result = await b.EvalBrandMatch(
+                        text=text,
+                        brand_name=brand_name,
+                        brand_aliases=aliases
+                    )
             else:  # Ollama
                 result = await b.EvalBrandMatchOllama(
                     text=text,
                     brand_name=brand_name,
                     brand_aliases=aliases
                 )
-            
-            # Cache result
-            if self.config.cache_results:
-                self._cache[cache_key] = result
-            
-            return result
-            
+        except Exception:
+            if not batched:
+                self._record_outcome(False)
+            raise
+        
+        if not batched:
+            self._record_outcome(True)
+        
+        # Cache result
+        if self.config.cache_results:
+            self._remember(cache_key, result)
+        if self.cache_db:
+            await self._run_db(self._store_cached, cache_key, result)
+        
+        return result
+    
+    async def _match_brand_batched(
+        self,
+        text: str,
+        brand_name: str,
+        aliases: List[str]
+    ) -> BrandMatchResult:
+        """
+        Queue a brand for the next EvalBrandMatchBatch call on this text and
+        wait for its result.
+        
+        Brands for the same text are collected until batch_max are pending
+        or batch_wait_ms has passed since the first one arrived, so N
+        concurrent match_brand calls on one text cost a single LLM call.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(text, [])
+        pending.append((brand_name, aliases, future))
+        
+        if len(pending) >= self.config.batch_max:
+            self._flush_brands(text)
+        elif text not in self._flush_handles:
+            self._flush_handles[text] = loop.call_later(
+                self.config.batch_wait_ms / 1000, self._flush_brands, text)
+        
+        return await future
+    
+    def _flush_brands(self, text: str):
+        """Dispatch every brand pending for this text as one batch"""
+        handle = self._flush_handles.pop(text, None)
+        if handle is not None:
+            handle.cancel()
+        
+        batch = self._pending.pop(text, [])
+        if not batch:
+            return
+        
+        # Keep a reference so the task isn't garbage collected mid-flight
+        task = asyncio.get_running_loop().create_task(
+            self._run_brand_batch(text, batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _run_brand_batch(
+        self,
+        text: str,
+        batch: List[Tuple[str, List[str], asyncio.Future]]
+    ):
+        """Resolve each queued brand's future from a single batch call"""
+        try:
+            await self._resolve_brand_batch(text, batch)
+        except BaseException as e:
+            # Every caller must hear back, including on cancellation
+            for _, _, future in batch:
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+    
+    async def _resolve_brand_batch(
+        self,
+        text: str,
+        batch: List[Tuple[str, List[str], asyncio.Future]]
+    ):
+        # One entry per brand, carrying every alias any caller asked about
+        brand_aliases: Dict[str, List[str]] = {}
+        for brand_name, aliases, _ in batch:
+            known = brand_aliases.setdefault(brand_name, [])
+            known.extend(a for a in aliases if a not in known)
+        try:
+            result = await b.EvalBrandMatchBatch(
+                text=text,
+                brands=[
+                    BrandQuery(name=name, aliases=aliases)
+                    for name, aliases in brand_aliases.items()
+                ]
+            )
+        except Exception:
+            self._record_outcome(False)
+            raise
+        self._record_outcome(True)
+        
+        from baml_client.types import BrandMatchResult as BrandMatchResultType
+        
+        by_name = {match.brand_name: match for match in result.matches}
+        missing = []
+        for brand_name, aliases, future in batch:
+            if future.done():
+                continue
+            match = by_name.get(brand_name)
+            if match is None:
+                missing.append((brand_name, aliases, future))
+                continue
+            future.set_result(BrandMatchResultType(
+                is_match=match.is_match,
+                confidence=match.confidence,
+                matched_alias=_matched_alias(
+                    match.matched_text, brand_name, aliases),
+                reasoning=match.reasoning
+            ))
+        
+        # Brands the model left out of the batch are checked on their own,
+        # all at once
+        await asyncio.gather(*(
+            self._resolve_single(text, brand_name, aliases, future)
+            for brand_name, aliases, future in missing))
+    
+    async def _resolve_single(
+        self,
+        text: str,
+        brand_name: str,
+        aliases: List[str],
+        future: asyncio.Future
+    ):
+        """Resolve one queued brand's future with its own EvalBrandMatch call"""
+        try:
+            result = await b.EvalBrandMatch(
+                text=text,
+                brand_name=brand_name,
+                brand_aliases=aliases
+            )
         except Exception as e:
-            # Fallback to simple matching if configured
-            if self.config.fallback_to_regex:
-                return self._fallback_match(text, brand_name, aliases)
-            raise e
+            self._record_outcome(False)
+            if not future.done():
+                future.set_exception(e)
+            return
+        self._record_outcome(True)
+        if not future.done():
+            future.set_result(result)
     
     async def match_brands_batch(
         self,
@@ -127,13 +513,24 @@ class LLMEvaluator:
         Returns:
             List of match results for each brand
         """
-        brand_names = [b["name"] for b in brands]
+        brand_queries = [
+            BrandQuery(name=b["name"], aliases=list(b.get("aliases", [])))
+            for b in brands
+        ]
         
         try:
-            result = await b.EvalBrandMatchBatch(
-                text=text,
-                brands=brand_names
-            )
+            if self._breaker_open():
+                raise RuntimeError(
+                    f"{self.config.backend.value} evaluator is failing")
+            try:
+                result = await b.EvalBrandMatchBatch(
+                    text=text,
+                    brands=brand_queries
+                )
+            except Exception:
+                self._record_outcome(False)
+                raise
+            self._record_outcome(True)
             
             # Map results back to brand info
             matches = []
@@ -228,15 +625,16 @@ class LLMEvaluator:
         aliases: List[str]
     ) -> BrandMatchResult:
         """
-        Fallback to simple case-insensitive matching.
+        Fallback to simple case-insensitive whole-word matching.
         Used when LLM evaluation fails.
         """
         from baml_client.types import BrandMatchResult as BrandMatchResultType
         
-        text_lower = text.lower()
+        name_pattern, alias_pattern, alias_lookup = _brand_patterns(
+            brand_name, tuple(aliases))
         
         # Check main brand name
-        if brand_name.lower() in text_lower:
+        if name_pattern is not None and name_pattern.search(text):
             return BrandMatchResultType(
                 is_match=True,
                 confidence=1.0,
@@ -245,14 +643,15 @@ class LLMEvaluator:
             )
         
         # Check aliases
-        for alias in aliases:
-            if alias.lower() in text_lower:
-                return BrandMatchResultType(
-                    is_match=True,
-                    confidence=0.9,
-                    matched_alias=alias,
-                    reasoning=f"Alias match found: {alias} (fallback)"
-                )
+        m = alias_pattern.search(text) if alias_pattern is not None else None
+        if m:
+            alias = alias_lookup.get(m.group().lower(), m.group())
+            return BrandMatchResultType(
+                is_match=True,
+                confidence=0.9,
+                matched_alias=alias,
+                reasoning=f"Alias match found: {alias} (fallback)"
+            )
         
         return BrandMatchResultType(
             is_match=False,
@@ -262,8 +661,15 @@ class LLMEvaluator:
         )
     
     def clear_cache(self):
-        """Clear the evaluation cache"""
+        """Clear the evaluation cache, including results kept on disk"""
         self._cache.clear()
+        if self.cache_db:
+            self._db_thread().submit(self._clear_db).result()
+    
+    def _clear_db(self):
+        conn = self._db_conn()
+        conn.execute('DELETE FROM eval_cache')
+        conn.commit()
 
 
 # Convenience function for quick brand matching
@@ -382,4 +788,10 @@ async def demo():
 
 
 if __name__ == "__main__":
-    asyncio.run(demo())
+    # uvloop is optional; it speeds up the I/O-bound event loop when present
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    asyncio.run(demo(), loop_factory=loop_factory)
@@ -1,6 +1,7 @@
 # Import Required Packages
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 
 class LLMProvider(ABC):
@@ -9,6 +10,9 @@ class LLMProvider(ABC):
     """
     name: str
 
+    # Queries packed into one request by rank_batch; 1 means one rank() each
+    batch_size: int = 1
+
     @abstractmethod
     async def rank(self, query: str, top_k: int, **kwargs) -> Dict[str, Any]:
         """
@@ -24,3 +28,46 @@ class LLMProvider(ABC):
             (format: {"answers": [{"name": str, "why": str}, ...]})
         """
         pass
+
+    async def rank_batch(
+        self,
+        queries: List[Dict[str, Any]],
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> List[Any]:
+        """
+        Rank several queries, batch_size of them per request, concurrently.
+
+        Args:
+            queries (List[Dict[str, Any]]): Queries with "text" and "k" keys.
+            semaphore (Optional[asyncio.Semaphore]): Bounds requests in flight.
+
+        Returns:
+            List[Any]: One result per query, in order, in the same format as
+            rank(). A query whose request failed gets the exception instead.
+        """
+        size = max(1, self.batch_size)
+        chunks = [queries[i:i + size] for i in range(0, len(queries), size)]
+
+        async def run_chunk(chunk):
+            if semaphore is None:
+                return await self._rank_chunk(chunk)
+            async with semaphore:
+                return await self._rank_chunk(chunk)
+
+        chunk_results = await asyncio.gather(
+            *(run_chunk(chunk) for chunk in chunks), return_exceptions=True)
+
+        results = []
+        for chunk, outcome in zip(chunks, chunk_results):
+            if isinstance(outcome, BaseException):
+                results.extend([outcome] * len(chunk))
+            else:
+                results.extend(outcome)
+        return results
+
+    async def _rank_chunk(self, chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Rank one chunk of queries. Providers with a batched prompt override
+        this; the default issues a rank() per query.
+        """
+        return [await self.rank(q["text"], q["k"]) for q in chunk]
@@ -0,0 +1,97 @@
+# Import Required Packages
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+class RankBatcher:
+    """
+    Adaptive micro-batcher for provider rank() calls.
+
+    Concurrent calls to submit() are collected until either max_batch
+    queries are pending or max_wait_ms has elapsed since the first one
+    arrived, then handed to process_batch as a single list. Each caller
+    awaits its own future, so results are routed back per query. When no
+    batch is in flight a query is sent straight away, so sequential callers
+    never wait for company that isn't coming.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Tuple[str, int]]], Awaitable[List[Dict[str, Any]]]],
+        max_batch: int = 32,
+        max_wait_ms: float = 10
+    ):
+        self.process_batch = process_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._pending: List[Tuple[str, int, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+        # Batches dispatched whose results haven't been handed out yet
+        self._in_flight = 0
+
+    async def submit(self, query: str, k: int) -> Dict[str, Any]:
+        """
+        Queue a query for the next batch and wait for its result.
+
+        Args:
+            query (str): The input query string.
+            k (int): The number of top results to return.
+
+        Returns:
+            Dict[str, Any]: The ranked results for this query.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((query, k, future))
+
+        if len(self._pending) >= self.max_batch or not self._in_flight:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self):
+        """Dispatch everything pending as one batch"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        # Keep a reference so the task isn't garbage collected mid-flight
+        self._in_flight += 1
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[str, int, asyncio.Future]]):
+        try:
+            try:
+                results = await self.process_batch([(query, k) for query, k, _ in batch])
+                if len(results) != len(batch):
+                    raise RuntimeError(
+                        f"process_batch returned {len(results)} results "
+                        f"for {len(batch)} queries")
+            finally:
+                # Before resolving anyone, so a caller's next submit sees us idle
+                self._in_flight -= 1
+        except BaseException as e:
+            # Every caller must hear back, including on cancellation
+            for _, _, future in batch:
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
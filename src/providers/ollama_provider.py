@@ -1,25 +1,51 @@
 # Import Required Packages
 from .base import LLMProvider
 from baml_client.async_client import b
+from baml_client.types import RankQuery
 
 
 class OllamaProvider(LLMProvider):
     name = "ollama"
 
-    def __init__(self, model="llama3"):
+    def __init__(self, model="llama3", batch_size=4):
         self.model = model
+        self.batch_size = batch_size
 
     async def rank(self, query: str, k: int, **kw):
         # Use BAML's Ollama-specific ranking function
         result = await b.RankEntitiesOllama(query=query, k=k)
+        return self._to_dict(result.answers)
 
-        # Convert BAML RankingResult to the expected format
+    async def _rank_chunk(self, chunk):
+        # A lone query goes through the regular single-query function
+        if len(chunk) == 1:
+            return [await self.rank(chunk[0]["text"], chunk[0]["k"])]
+
+        # Use BAML's batched ranking function
+        batch = await b.RankEntitiesBatchOllama(items=[
+            RankQuery(index=i, query=q["text"], k=q["k"])
+            for i, q in enumerate(chunk)
+        ])
+        by_index = {item.index: item.answers for item in batch.results}
+
+        results = []
+        for i, q in enumerate(chunk):
+            if i in by_index:
+                results.append(self._to_dict(by_index[i]))
+            else:
+                # Model dropped this query from the batch; retry it on its own
+                results.append(await self.rank(q["text"], q["k"]))
+        return results
+
+    @staticmethod
+    def _to_dict(answers):
+        # Convert BAML Answer list to the expected format
         return {
             "answers": [
                 {
                     "name": answer.name,
                     "why": answer.why
                 }
-                for answer in result.answers
+                for answer in answers
             ]
         }
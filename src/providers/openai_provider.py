@@ -2,6 +2,7 @@
 import os
 from .base import LLMProvider
 from baml_client.async_client import b
+from baml_client.types import RankQuery
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -10,8 +11,9 @@ load_dotenv()
 class OpenAIProvider(LLMProvider):
     name = "openai"
 
-    def __init__(self, model="gpt-5-nano-2025-08-07"):
+    def __init__(self, model="gpt-5-nano-2025-08-07", batch_size=8):
         self.model = model
+        self.batch_size = batch_size
 
         # Ensure API key is available
         if "OPENAI_API_KEY" not in os.environ:
@@ -21,14 +23,38 @@ class OpenAIProvider(LLMProvider):
     async def rank(self, query: str, k: int, **kw):
         # Use BAML's OpenAI-specific ranking function
         result = await b.RankEntitiesOpenAI(query=query, k=k)
+        return self._to_dict(result.answers)
 
-        # Convert BAML RankingResult to the expected format
+    async def _rank_chunk(self, chunk):
+        # A lone query goes through the regular single-query function
+        if len(chunk) == 1:
+            return [await self.rank(chunk[0]["text"], chunk[0]["k"])]
+
+        # Use BAML's batched ranking function
+        batch = await b.RankEntitiesBatchOpenAI(items=[
+            RankQuery(index=i, query=q["text"], k=q["k"])
+            for i, q in enumerate(chunk)
+        ])
+        by_index = {item.index: item.answers for item in batch.results}
+
+        results = []
+        for i, q in enumerate(chunk):
+            if i in by_index:
+                results.append(self._to_dict(by_index[i]))
+            else:
+                # Model dropped this query from the batch; retry it on its own
+                results.append(await self.rank(q["text"], q["k"]))
+        return results
+
+    @staticmethod
+    def _to_dict(answers):
+        # Convert BAML Answer list to the expected format
         return {
             "answers": [
                 {
                     "name": answer.name,
                     "why": answer.why
                 }
-                for answer in result.answers
+                for answer in answers
             ]
         }
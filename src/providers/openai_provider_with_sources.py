@@ -1,7 +1,9 @@
 # Import Required Packages
 import os
 from .base import LLMProvider
+from .batcher import RankBatcher
 from baml_client.async_client import b
+from baml_client.types import RankQuery
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -11,7 +13,7 @@ class OpenAIProviderWithSources(LLMProvider):
     """OpenAI provider that requests sources and confidence scores"""
     name = "openai"
 
-    def __init__(self, model="gpt-5-nano-2025-08-07"):
+    def __init__(self, model="gpt-5-nano-2025-08-07", max_batch=32, max_wait_ms=10):
         self.model = model
 
         # Ensure API key is available
@@ -19,11 +21,40 @@ class OpenAIProviderWithSources(LLMProvider):
             raise ValueError(
                 "OPENAI_API_KEY not found in environment variables.")
 
+        # Concurrent rank() calls are coalesced into a single batched request
+        self._batcher = RankBatcher(
+            self._rank_batch, max_batch=max_batch, max_wait_ms=max_wait_ms)
+
     async def rank(self, query: str, k: int, **kw):
-        # Use BAML's OpenAI-specific ranking function with sources
-        result = await b.RankEntitiesWithSourcesOpenAI(query=query, k=k)
+        return await self._batcher.submit(query, k)
+
+    async def _rank_batch(self, items):
+        # A lone query goes through the regular single-query function
+        if len(items) == 1:
+            query, k = items[0]
+            result = await b.RankEntitiesWithSourcesOpenAI(query=query, k=k)
+            return [self._to_dict(result.answers)]
+
+        # Use BAML's batched ranking function with sources
+        batch = await b.RankEntitiesWithSourcesBatchOpenAI(items=[
+            RankQuery(index=i, query=query, k=k)
+            for i, (query, k) in enumerate(items)
+        ])
+        by_index = {item.index: item.answers for item in batch.results}
+
+        results = []
+        for i, (query, k) in enumerate(items):
+            if i in by_index:
+                results.append(self._to_dict(by_index[i]))
+            else:
+                # Model dropped this query from the batch; retry it on its own
+                result = await b.RankEntitiesWithSourcesOpenAI(query=query, k=k)
+                results.append(self._to_dict(result.answers))
+        return results
 
-        # Convert BAML RankingResultWithSources to the expected format
+    @staticmethod
+    def _to_dict(answers):
+        # Convert BAML AnswerWithSources list to the expected format
         return {
             "answers": [
                 {
@@ -39,6 +70,6 @@ class OpenAIProviderWithSources(LLMProvider):
                     ],
                     "confidence": answer.confidence
                 }
-                for answer in result.answers
+                for answer in answers
             ]
         }
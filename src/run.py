@@ -8,11 +8,15 @@ import os
 from pathlib import Path
 from providers.openai_provider import OpenAIProvider
 from providers.ollama_provider import OllamaProvider
+from run_common import match_brand, build_brand_index, normalize_name, dumps_response
 
 # LLM Evaluator for semantic brand matching
 USE_LLM_MATCHING = os.getenv("USE_LLM_MATCHING", "false").lower() == "true"
 _llm_evaluator = None
 
+# Provider ranking requests allowed in flight at once, to stay under rate limits
+RANK_CONCURRENCY = int(os.getenv("RANK_CONCURRENCY", "32"))
+
 
 def get_llm_evaluator():
     """Lazy initialization of LLM evaluator"""
@@ -23,7 +27,11 @@ def get_llm_evaluator():
         _llm_evaluator = LLMEvaluator(EvaluationConfig(
             backend=backend,
             confidence_threshold=float(os.getenv("LLM_EVAL_THRESHOLD", "0.7")),
-            fallback_to_regex=True
+            fallback_to_regex=True,
+            # Reuse brand matches from earlier runs when a cache file is given
+            cache_db=os.getenv("LLM_EVAL_CACHE_DB") or None,
+            # Brands checked against one answer per LLM call (1 = one call each)
+            batch_max=int(os.getenv("LLM_EVAL_BATCH_MAX", "1"))
         ))
     return _llm_evaluator
 
@@ -51,24 +59,27 @@ config = load_config()
 BRANDS = config["brands"]
 QUERIES = config["queries"]
 
+# Queries packed into each ranking request, per provider name (optional in
+# config.json, e.g. "rank_batch_size": {"openai": 8, "ollama": 4})
+RANK_BATCH_SIZE = config.get("rank_batch_size", {})
+
 PROVIDERS = [
-    OpenAIProvider(model="gpt-5-nano-2025-08-07"),
-    OllamaProvider(model="llama3"),
+    OpenAIProvider(model="gpt-5-nano-2025-08-07",
+                   batch_size=RANK_BATCH_SIZE.get("openai", 8)),
+    OllamaProvider(model="llama3",
+                   batch_size=RANK_BATCH_SIZE.get("ollama", 4)),
 ]
 
 
-def match_brand(name: str, brand):
+BRAND_INDEX = build_brand_index(BRANDS)
+
+
+def match_brands(name: str, index=None):
     """
-    Simple exact-match brand matching (regex-based).
-    For semantic matching, use match_brand_llm instead.
+    Exact-match an answer against all brands at once.
+    Returns a list of (brand, alias) pairs, in BRANDS order.
     """
-    target = name.lower()
-    if brand["name"].lower() == target:
-        return brand["name"]
-    for alias in brand["aliases"]:
-        if alias.lower() == target:
-            return alias
-    return None
+    return (BRAND_INDEX if index is None else index).get(normalize_name(name), [])
 
 
 async def match_brand_llm(name: str, brand):
@@ -101,6 +112,9 @@ def create_tables(conn):
     """Create database tables if they don't exist"""
     c = conn.cursor()
 
+    # WAL is persistent, so setting it here lets analyze read while runs write
+    c.execute('PRAGMA journal_mode = WAL')
+
     c.execute('''CREATE TABLE IF NOT EXISTS responses (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         query_id INTEGER,
@@ -150,11 +164,25 @@ def create_tables(conn):
         error_count INTEGER
     )''')
 
+    # Indexes for the mentions/responses joins and report grouping in analyze.py
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_mentions_response 
+                ON mentions(response_id)''')
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_mentions_brand_rank 
+                ON mentions(brand_name, rank_position)''')
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_responses_provider 
+                ON responses(provider_name, model_name)''')
+
     conn.commit()
 
 
 async def main():
     conn = sqlite3.connect("llmseo.db")
+    # The whole run is one transaction committed at the end; WAL (set in
+    # create_tables) plus NORMAL sync keeps that to a single cheap fsync
+    conn.executescript('''
+        PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+    ''')
     c = conn.cursor()
 
     create_tables(conn)
@@ -183,30 +211,67 @@ async def main():
     print(f"Starting LLM SEO analysis with {len(PROVIDERS)} providers and {len(QUERIES)} queries...")
     print(f"Match method: {match_method.upper()}")
 
+    # Every provider's queries go out concurrently, packed several to a
+    # request and bounded by the semaphore; results are then stored serially
+    # on the one connection
+    semaphore = asyncio.Semaphore(RANK_CONCURRENCY)
+    provider_results = await asyncio.gather(
+        *(provider.rank_batch(QUERIES, semaphore) for provider in PROVIDERS))
+    results = (res for batch in provider_results for res in batch)
+
+    # LLM brand matching is the only async work left, so run all of it
+    # concurrently now; the loop below then just stores rows, without
+    # awaiting between writes
+    llm_matches = {}
+    if USE_LLM_MATCHING:
+        keys = list(dict.fromkeys(
+            (a.get("name", ""), brand_idx)
+            for batch in provider_results for res in batch
+            if not isinstance(res, BaseException)
+            for a in res.get("answers", [])
+            for brand_idx in range(len(BRANDS))))
+
+        async def bounded_match(name, brand):
+            async with semaphore:
+                return await match_brand_llm(name, brand)
+
+        matched = await asyncio.gather(
+            *(bounded_match(name, BRANDS[brand_idx]) for name, brand_idx in keys),
+            return_exceptions=True)
+        llm_matches = dict(zip(keys, matched))
+
     for provider_idx, provider in enumerate(PROVIDERS):
         print(f"Provider {provider_idx + 1}/{len(PROVIDERS)}: {provider.name}")
 
         for query_idx, q in enumerate(QUERIES):
             print(f"Query {query_idx + 1}/{len(QUERIES)}: {q['text'][:50]}...")
 
+            res = next(results)
             try:
-                res = await provider.rank(q["text"], q["k"])
+                if isinstance(res, BaseException):
+                    raise res
                 answers = res.get("answers", [])
-                raw = json.dumps(res)
+                raw = dumps_response(res)
                 c.execute('''INSERT INTO responses (query_id, provider_name, model_name, raw_response, timestamp)
                             VALUES (?, ?, ?, ?, ?)''',
                           (q["id"], provider.name, getattr(provider, 'model', 'unknown'),
                            raw, time.time()))
                 response_id = c.lastrowid
-                mentions_found = 0
+                mention_rows = []
                 for idx, a in enumerate(answers):
                     answer_name = a.get("name", "")
                     answer_why = a.get("why", "")
+                    # One index lookup finds every brand this answer names exactly
+                    exact_matches = {} if USE_LLM_MATCHING else {
+                        id(brand): alias for brand, alias in match_brands(answer_name)}
 
-                    for brand in BRANDS:
+                    for brand_idx, brand in enumerate(BRANDS):
                         # Use LLM matching if enabled, otherwise regex
                         if USE_LLM_MATCHING:
-                            alias, confidence, reasoning = await match_brand_llm(answer_name, brand)
+                            match = llm_matches[(answer_name, brand_idx)]
+                            if isinstance(match, BaseException):
+                                raise match
+                            alias, confidence, reasoning = match
                             eval_stats["total_evaluations"] += 1
                             if confidence:
                                 eval_stats["confidence_sum"] += confidence
@@ -215,25 +280,26 @@ async def main():
                                 elif confidence < 0.5:
                                     eval_stats["low_confidence_count"] += 1
                         else:
-                            alias = match_brand(answer_name, brand)
+                            alias = exact_matches.get(id(brand))
                             confidence = 1.0 if alias else 0.0
                             reasoning = "Exact match" if alias else None
                         
                         if alias:
-                            mentions_found += 1
-                            c.execute('''INSERT INTO mentions 
-                                        (response_id, brand_id, brand_name, alias_used, rank_position, 
-                                         explanation, timestamp, match_method, match_confidence, match_reasoning)
-                                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-                                      (response_id, brand["id"], brand["name"], alias,
-                                       idx + 1, answer_why, time.time(), match_method, confidence, reasoning))
+                            mention_rows.append(
+                                (response_id, brand["id"], brand["name"], alias,
+                                 idx + 1, answer_why, time.time(), match_method, confidence, reasoning))
 
                             if USE_LLM_MATCHING:
                                 print(f"Found {brand['name']} (as '{alias}') at rank #{idx + 1} [confidence: {confidence:.2f}]")
                             else:
                                 print(f"Found {brand['name']} (as '{alias}') at rank #{idx + 1}")
 
-                if mentions_found == 0:
+                c.executemany('''INSERT INTO mentions 
+                                 (response_id, brand_id, brand_name, alias_used, rank_position, 
+                                  explanation, timestamp, match_method, match_confidence, match_reasoning)
+                                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''', mention_rows)
+
+                if not mention_rows:
                     print(f"No brand mentions found in top {q['k']} results")
 
                 success_count += 1
@@ -265,6 +331,8 @@ async def main():
 
     conn.commit()
     conn.close()
+    if _llm_evaluator is not None:
+        _llm_evaluator.close()
 
     duration = run_completed - run_started
     print(f"\n Analysis Complete!")
@@ -279,4 +347,10 @@ async def main():
     print(f"   Database: llmseo.db")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional; it speeds up the I/O-bound event loop when present
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    asyncio.run(main(), loop_factory=loop_factory)
@@ -0,0 +1,60 @@
+# Import Required Packages
+"""
+Brand matching and response serialization shared by run.py and
+run_with_sources.py, so the two pipelines can't drift apart.
+"""
+import json
+from functools import lru_cache
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+
+def normalize_name(name: str) -> str:
+    """Case-fold a name for exact, case-insensitive brand matching"""
+    return name.casefold()
+
+
+@lru_cache(maxsize=1024)
+def brand_terms(brand_name: str, aliases: tuple):
+    """Normalized name/alias lookup for a brand, built once per brand"""
+    terms = {}
+    for term in (brand_name,) + aliases:
+        terms.setdefault(normalize_name(term), term)
+    return terms
+
+
+@lru_cache(maxsize=8192)
+def _match_brand_cached(target: str, brand_name: str, aliases: tuple):
+    return brand_terms(brand_name, aliases).get(target)
+
+
+def match_brand(name: str, brand):
+    """
+    Simple exact-match brand matching (regex-based).
+    For semantic matching, use run.match_brand_llm instead.
+    """
+    return _match_brand_cached(normalize_name(name), brand["name"], tuple(brand["aliases"]))
+
+
+def build_brand_index(brands):
+    """
+    Map every normalized brand name/alias to the brands it identifies.
+    Built once so an answer can be matched against all brands in one lookup.
+    """
+    index = {}
+    for brand in brands:
+        for term, alias in brand_terms(brand["name"], tuple(brand["aliases"])).items():
+            index.setdefault(term, []).append((brand, alias))
+    return index
+
+
+def dumps_response(obj) -> str:
+    """Serialize a provider response to JSON text, via orjson when available"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
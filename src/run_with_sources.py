@@ -12,11 +12,14 @@ import time
 import json
 import sqlite3
 import os
+from itertools import combinations
 from pathlib import Path
 from providers.openai_provider import OpenAIProvider
 from providers.ollama_provider import OllamaProvider
 from providers.openai_provider_with_sources import OpenAIProviderWithSources
 from providers.ollama_provider_with_sources import OllamaProviderWithSources
+from run_common import build_brand_index, normalize_name, dumps_response
+from competitor_graph import ensure_co_mentions_unique_index
 import sys
 
 
@@ -53,16 +56,6 @@ def get_providers(with_sources=False):
         ]
 
 
-def match_brand(name: str, brand):
-    target = name.lower()
-    if brand["name"].lower() == target:
-        return brand["name"]
-    for alias in brand["aliases"]:
-        if alias.lower() == target:
-            return alias
-    return None
-
-
 def extract_co_mentions_for_response(conn, response_id, mentioned_brands, 
                                      query_id, provider_name, model_name, timestamp):
     """
@@ -81,35 +74,31 @@ def extract_co_mentions_for_response(conn, response_id, mentioned_brands,
         return 0
     
     c = conn.cursor()
-    co_mentions_added = 0
     
-    # Create co-mention pairs (ensuring brand_id_1 < brand_id_2)
-    for i in range(len(mentioned_brands)):
-        for j in range(i + 1, len(mentioned_brands)):
-            brand1 = mentioned_brands[i]
-            brand2 = mentioned_brands[j]
-            
-            # Ensure consistent ordering
-            if brand1[0] < brand2[0]:
-                b1_id, b1_name, b1_rank = brand1
-                b2_id, b2_name, b2_rank = brand2
-            else:
-                b2_id, b2_name, b2_rank = brand1
-                b1_id, b1_name, b1_rank = brand2
+    def co_mention_rows():
+        # Create co-mention pairs (ensuring brand_id_1 < brand_id_2)
+        for brand1, brand2 in combinations(mentioned_brands, 2):
+            if brand1[0] == brand2[0]:
+                # Same brand matched by two answers; not a competitor pair
+                continue
+            if brand1[0] > brand2[0]:
+                brand1, brand2 = brand2, brand1
+            b1_id, b1_name, b1_rank = brand1
+            b2_id, b2_name, b2_rank = brand2
             
-            rank_distance = abs(b1_rank - b2_rank)
-            
-            c.execute('''
-                INSERT INTO co_mentions 
-                (response_id, brand_id_1, brand_id_2, brand_name_1, brand_name_2,
-                 rank_1, rank_2, rank_distance, query_id, provider_name, 
-                 model_name, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (response_id, b1_id, b2_id, b1_name, b2_name,
-                  b1_rank, b2_rank, rank_distance, query_id,
-                  provider_name, model_name, timestamp))
-            
-            co_mentions_added += 1
+            yield (response_id, b1_id, b2_id, b1_name, b2_name,
+                   b1_rank, b2_rank, abs(b1_rank - b2_rank), query_id,
+                   provider_name, model_name, timestamp)
+    
+    # One prepared statement bound per pair in C
+    c.executemany('''
+        INSERT OR IGNORE INTO co_mentions 
+        (response_id, brand_id_1, brand_id_2, brand_name_1, brand_name_2,
+         rank_1, rank_2, rank_distance, query_id, provider_name, 
+         model_name, timestamp)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', co_mention_rows())
+    co_mentions_added = c.rowcount
     
     return co_mentions_added
 
@@ -118,6 +107,9 @@ def create_tables(conn):
     """Create database tables if they don't exist"""
     c = conn.cursor()
 
+    # WAL is persistent, so setting it here lets analyze read while runs write
+    c.execute('PRAGMA journal_mode = WAL')
+
     c.execute('''CREATE TABLE IF NOT EXISTS responses (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         query_id INTEGER,
@@ -199,7 +191,6 @@ def create_tables(conn):
     )''')
     
     c.execute('''CREATE TABLE IF NOT EXISTS competitor_relationships (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
         brand_id_1 INTEGER,
         brand_id_2 INTEGER,
         brand_name_1 TEXT,
@@ -212,6 +203,17 @@ def create_tables(conn):
         PRIMARY KEY (brand_id_1, brand_id_2)
     ) WITHOUT ROWID''')
 
+    # One row per response and pair, so INSERT OR IGNORE skips repeats
+    ensure_co_mentions_unique_index(conn)
+
+    # Indexes for the mentions/responses joins and report grouping in analyze.py
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_mentions_response 
+                ON mentions(response_id)''')
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_mentions_brand_rank 
+                ON mentions(brand_name, rank_position)''')
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_responses_provider 
+                ON responses(provider_name, model_name)''')
+
     conn.commit()
 
 
@@ -224,6 +226,8 @@ async def main(with_sources=False):
     """
     config = load_config()
     BRANDS = config["brands"]
+    # Case-folded name/alias lookup, built once and shared by every answer
+    BRAND_INDEX = build_brand_index(BRANDS)
     QUERIES = config["queries"]
     PROVIDERS = get_providers(with_sources=with_sources)
     
@@ -255,7 +259,7 @@ async def main(with_sources=False):
             try:
                 res = await provider.rank(q["text"], q["k"])
                 answers = res.get("answers", [])
-                raw = json.dumps(res)
+                raw = dumps_response(res)
                 
                 current_timestamp = time.time()
                 
@@ -274,37 +278,36 @@ async def main(with_sources=False):
                     answer_sources = a.get("sources", [])
                     answer_confidence = a.get("confidence", None)
 
-                    for brand in BRANDS:
-                        alias = match_brand(answer_name, brand)
-                        if alias:
-                            mentions_found += 1
-                            rank_position = idx + 1
-                            
-                            # Track for co-mention analysis
-                            mentioned_brands.append((brand["id"], brand["name"], rank_position))
-                            
-                            # Insert mention
-                            c.execute('''INSERT INTO mentions 
-                                        (response_id, brand_id, brand_name, alias_used, rank_position, explanation, timestamp)
-                                        VALUES (?, ?, ?, ?, ?, ?, ?)''',
-                                      (response_id, brand["id"], brand["name"], alias,
-                                       rank_position, answer_why, current_timestamp))
-                            mention_id = c.lastrowid
+                    # One hashed lookup finds every brand this answer names
+                    for brand, alias in BRAND_INDEX.get(normalize_name(answer_name), []):
+                        mentions_found += 1
+                        rank_position = idx + 1
+                        
+                        # Track for co-mention analysis
+                        mentioned_brands.append((brand["id"], brand["name"], rank_position))
+                        
+                        # Insert mention
+                        c.execute('''INSERT INTO mentions 
+                                    (response_id, brand_id, brand_name, alias_used, rank_position, explanation, timestamp)
+                                    VALUES (?, ?, ?, ?, ?, ?, ?)''',
+                                  (response_id, brand["id"], brand["name"], alias,
+                                   rank_position, answer_why, current_timestamp))
+                        mention_id = c.lastrowid
+                        
+                        # Insert sources if available
+                        if with_sources and answer_sources:
+                            for source in answer_sources:
+                                c.execute('''INSERT INTO sources
+                                            (mention_id, url, title, description, timestamp)
+                                            VALUES (?, ?, ?, ?, ?)''',
+                                         (mention_id, source.get("url", ""),
+                                          source.get("title"), source.get("description"),
+                                          current_timestamp))
                             
-                            # Insert sources if available
-                            if with_sources and answer_sources:
-                                for source in answer_sources:
-                                    c.execute('''INSERT INTO sources
-                                                (mention_id, url, title, description, timestamp)
-                                                VALUES (?, ?, ?, ?, ?)''',
-                                             (mention_id, source.get("url", ""),
-                                              source.get("title"), source.get("description"),
-                                              current_timestamp))
-                                
-                                print(f"    ✓ Found {brand['name']} at rank #{rank_position} "
-                                      f"(confidence: {answer_confidence:.2f}, sources: {len(answer_sources)})")
-                            else:
-                                print(f"    ✓ Found {brand['name']} at rank #{rank_position}")
+                            print(f"    ✓ Found {brand['name']} at rank #{rank_position} "
+                                  f"(confidence: {answer_confidence:.2f}, sources: {len(answer_sources)})")
+                        else:
+                            print(f"    ✓ Found {brand['name']} at rank #{rank_position}")
                 
                 # Extract co-mentions for this response
                 if len(mentioned_brands) >= 2:
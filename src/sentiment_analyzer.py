@@ -106,6 +106,15 @@ def print_sentiment_report(db_path="llmseo.db"):
             f"{sentiment}: {mention_count} mentions (avg confidence: {avg_confidence:.2f})")
 
 
+async def run(db='llmseo.db', analyze=False, report=False):
+    """Run sentiment analysis and/or the report (both when neither is requested)"""
+    if analyze or (not report):
+        await analyze_brand_sentiment(db)
+
+    if report or (not analyze):
+        print_sentiment_report(db)
+
+
 async def main():
     """Main function for sentiment analysis"""
     import argparse
@@ -119,12 +128,7 @@ async def main():
                         help='Show sentiment report')
 
     args = parser.parse_args()
-
-    if args.analyze or (not args.report):
-        await analyze_brand_sentiment(args.db)
-
-    if args.report or (not args.analyze):
-        print_sentiment_report(args.db)
+    await run(**vars(args))
 
 
 if __name__ == "__main__":
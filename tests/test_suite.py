@@ -298,6 +298,473 @@ def test_configuration():
     return True
 
 
+def _make_graph_db(path, responses):
+    """
+    Build a minimal responses/mentions database for the graph tests.
+    responses: list of lists of (brand_id, brand_name, rank_position)
+    """
+    conn = sqlite3.connect(path)
+    c = conn.cursor()
+    c.execute('''CREATE TABLE IF NOT EXISTS responses (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, query_id INTEGER,
+        provider_name TEXT, model_name TEXT, raw_response TEXT,
+        timestamp REAL, error_message TEXT)''')
+    c.execute('''CREATE TABLE IF NOT EXISTS mentions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, response_id INTEGER,
+        brand_id INTEGER, brand_name TEXT, alias_used TEXT,
+        rank_position INTEGER, explanation TEXT, timestamp REAL)''')
+    for ts, brands in enumerate(responses, 1):
+        c.execute('''INSERT INTO responses (query_id, provider_name, model_name, timestamp)
+                    VALUES (1, 'openai', 'm', ?)''', (float(ts),))
+        response_id = c.lastrowid
+        for brand_id, brand_name, rank in brands:
+            c.execute('''INSERT INTO mentions (response_id, brand_id, brand_name, rank_position)
+                        VALUES (?, ?, ?, ?)''', (response_id, brand_id, brand_name, rank))
+    conn.commit()
+    conn.close()
+
+
+def test_competitor_graph_report_rerun():
+    """Test that re-running the graph report on unchanged data still shows the graph"""
+    print("\n Testing competitor graph report re-run...")
+
+    import io
+    from contextlib import redirect_stdout
+    import competitor_graph
+
+    with tempfile.TemporaryDirectory() as tmp:
+        test_db = os.path.join(tmp, "graph.db")
+        _make_graph_db(test_db, [
+            [(1, "A", 1), (2, "B", 2), (3, "C", 3)],
+        ])
+        try:
+            outputs = []
+            for _ in range(2):
+                out = io.StringIO()
+                with redirect_stdout(out):
+                    competitor_graph.print_competitor_graph_report(test_db)
+                outputs.append(out.getvalue())
+        finally:
+            competitor_graph._close_connections()
+
+    for i, output in enumerate(outputs, 1):
+        if ("No competitor relationships found" in output or
+                "Total Relationships: 3" not in output):
+            print(f"Report run {i} didn't list the 3 relationships:\n{output}")
+            return False
+    print("Graph report lists relationships on both runs")
+    return True
+
+
+def _relationships(conn):
+    """Stored competitor relationships, rounded so float noise doesn't matter"""
+    return [
+        (id1, id2, count, round(dist, 9), first, last, round(strength, 9))
+        for id1, id2, count, dist, first, last, strength in conn.execute('''
+            SELECT brand_id_1, brand_id_2, co_mention_count, avg_rank_distance,
+                   first_seen, last_seen, strength_score
+            FROM competitor_relationships ORDER BY brand_id_1, brand_id_2''')
+    ]
+
+
+def test_incremental_graph_update():
+    """Test that incremental graph updates match a full rebuild"""
+    print("\n Testing incremental competitor graph updates...")
+
+    import competitor_graph
+
+    with tempfile.TemporaryDirectory() as tmp:
+        test_db = os.path.join(tmp, "graph.db")
+        _make_graph_db(test_db, [
+            [(1, "A", 1), (2, "B", 2), (3, "C", 3)],
+            [(1, "A", 2), (2, "B", 1)],
+        ])
+        try:
+            with competitor_graph.CompetitorGraphAnalyzer(test_db) as analyzer:
+                analyzer.extract_co_mentions()
+                analyzer.update_competitor_relationships()
+
+                # Nothing new since the last pass, so nothing is redone
+                if (analyzer.extract_co_mentions() != 0 or
+                        analyzer.update_competitor_relationships() != 0):
+                    print("Second pass over unchanged data did work")
+                    return False
+
+                _make_graph_db(test_db, [
+                    [(1, "A", 1), (2, "B", 4)],
+                    [(2, "B", 1), (3, "C", 2)],
+                ])
+                if analyzer.extract_co_mentions() != 2:
+                    print("Only the new responses' co-mentions should be extracted")
+                    return False
+                analyzer.update_competitor_relationships()
+                incremental = _relationships(analyzer.conn)
+
+                analyzer.update_competitor_relationships(rebuild=True)
+                rebuilt = _relationships(analyzer.conn)
+        finally:
+            competitor_graph._close_connections()
+
+    if incremental != rebuilt:
+        print(f"Incremental {incremental} != rebuilt {rebuilt}")
+        return False
+    print(f"Incremental update matches a rebuild ({len(rebuilt)} relationships)")
+    return True
+
+
+def test_brand_normalization():
+    """Test that exact brand matching ignores case but not separators"""
+    print("\n Testing brand name normalization...")
+
+    from run_common import match_brand, build_brand_index, normalize_name
+
+    brand = {"id": 1, "name": "TestBrand", "aliases": ["TB", "Test Brand"]}
+    cases = [
+        ("TestBrand", "TestBrand"),
+        ("testbrand", "TestBrand"),
+        ("TEST BRAND", "Test Brand"),
+        ("tb", "TB"),
+        ("test-brand", None),
+        ("t.b.", None),
+        ("Testing", None),
+    ]
+    for name, expected in cases:
+        if match_brand(name, brand) != expected:
+            print(f"match_brand({name!r}) returned {match_brand(name, brand)!r}, "
+                  f"expected {expected!r}")
+            return False
+
+    index = build_brand_index([brand])
+    if index.get(normalize_name("test brand")) != [(brand, "Test Brand")]:
+        print(f"Unexpected brand index: {index}")
+        return False
+    print("Brand names match across case variations only")
+    return True
+
+
+def test_fallback_match_whole_words():
+    """Test that the regex fallback only matches whole names and aliases"""
+    print("\n Testing evaluator fallback matching...")
+
+    from llm_evaluator import LLMEvaluator
+
+    evaluator = LLMEvaluator()
+    cases = [
+        ("He said it was fine", "AI", [], False, None),
+        ("AI-first products", "AI", [], True, "AI"),
+        ("Written in C++ for speed", "Cpp", ["C++"], True, "C++"),
+        ("the CHATGPT team", "OpenAI", ["ChatGPT"], True, "ChatGPT"),
+    ]
+    for text, brand_name, aliases, expected, alias in cases:
+        result = evaluator._fallback_match(text, brand_name, aliases)
+        if result.is_match != expected or result.matched_alias != alias:
+            print(f"{brand_name} in {text!r}: match={result.is_match}, "
+                  f"alias={result.matched_alias!r}")
+            return False
+    print("Fallback matching respects word boundaries")
+    return True
+
+
+async def test_rank_batch_packing():
+    """Test that rank_batch packs queries and retries ones the model drops"""
+    print("\n Testing batched ranking...")
+
+    from types import SimpleNamespace
+    from unittest import mock
+    from providers import openai_provider
+
+    calls = []
+
+    def answers(query):
+        return [SimpleNamespace(name=f"{query} answer", why="stub")]
+
+    async def rank_single(query, k):
+        calls.append(("single", query))
+        return SimpleNamespace(answers=answers(query))
+
+    async def rank_batch(items):
+        calls.append(("batch", [item.query for item in items]))
+        # Leave out any query marked "drop", as a model sometimes does
+        return SimpleNamespace(results=[
+            SimpleNamespace(index=item.index, answers=answers(item.query))
+            for item in items if "drop" not in item.query
+        ])
+
+    stub = SimpleNamespace(RankEntitiesOpenAI=rank_single,
+                           RankEntitiesBatchOpenAI=rank_batch)
+    queries = [{"text": text, "k": 1} for text in ["q1", "drop", "q3", "q4", "q5"]]
+    with mock.patch.dict(os.environ, {"OPENAI_API_KEY": "test"}), \
+            mock.patch.object(openai_provider, "b", stub):
+        provider = openai_provider.OpenAIProvider(batch_size=2)
+        results = await provider.rank_batch(queries)
+
+    names = [result["answers"][0]["name"] for result in results]
+    if names != [f"{q['text']} answer" for q in queries]:
+        print(f"Results out of order: {names}")
+        return False
+    expected_calls = [
+        ("batch", ["q1", "drop"]),
+        ("single", "drop"),
+        ("batch", ["q3", "q4"]),
+        ("single", "q5"),
+    ]
+    if sorted(calls, key=repr) != sorted(expected_calls, key=repr):
+        print(f"Unexpected calls: {calls}")
+        return False
+    print("Queries are packed per chunk and dropped ones retried alone")
+    return True
+
+
+async def test_evaluator_call_sharing():
+    """Test that concurrent brand matches share LLM calls and batch per text"""
+    print("\n Testing evaluator call sharing...")
+
+    from types import SimpleNamespace
+    from unittest import mock
+    import llm_evaluator
+    from llm_evaluator import LLMEvaluator, EvaluationConfig
+    from baml_client.types import BrandMatch, BrandMatchBatchResult, BrandMatchResult
+
+    calls = []
+
+    async def match_single(text, brand_name, brand_aliases):
+        calls.append(("single", brand_name))
+        await asyncio.sleep(0.01)
+        return BrandMatchResult(is_match=brand_name in text, confidence=1.0,
+                                matched_alias=None, reasoning="stub")
+
+    async def match_batch(text, brands):
+        calls.append(("batch", [(q.name, list(q.aliases)) for q in brands]))
+        await asyncio.sleep(0.01)
+        return BrandMatchBatchResult(matches=[
+            BrandMatch(brand_name=q.name, is_match=q.name in text, confidence=1.0,
+                       matched_text=q.name if q.name in text else None,
+                       reasoning="stub")
+            for q in brands
+        ])
+
+    stub = SimpleNamespace(EvalBrandMatch=match_single,
+                           EvalBrandMatchBatch=match_batch)
+    with mock.patch.object(llm_evaluator, "b", stub):
+        # Identical concurrent evaluations make a single call
+        evaluator = LLMEvaluator()
+        results = await asyncio.gather(
+            *(evaluator.match_brand("Acme and Zed", "Acme", ["AC"]) for _ in range(3)))
+        if calls != [("single", "Acme")] or not all(r.is_match for r in results):
+            print(f"Single-flight made calls {calls}")
+            return False
+
+        # A caller that is cancelled doesn't take the shared call down with it
+        calls.clear()
+        evaluator = LLMEvaluator()
+        first = asyncio.ensure_future(evaluator.match_brand("Acme again", "Acme"))
+        second = asyncio.ensure_future(evaluator.match_brand("Acme again", "Acme"))
+        await asyncio.sleep(0)
+        first.cancel()
+        result = await second
+        if not (first.cancelled() and result.is_match and
+                calls == [("single", "Acme")]):
+            print(f"Cancelling one caller broke the shared call: {calls}")
+            return False
+
+        # Brands on one text go out together, aliases included
+        calls.clear()
+        evaluator = LLMEvaluator(EvaluationConfig(batch_max=3))
+        results = await asyncio.gather(
+            evaluator.match_brand("Acme and Zed", "Acme", ["AC"]),
+            evaluator.match_brand("Acme and Zed", "Zed", ["Z Corp"]),
+            evaluator.match_brand("Acme and Zed", "Other", []))
+    if calls != [("batch", [("Acme", ["AC"]), ("Zed", ["Z Corp"]), ("Other", [])])]:
+        print(f"Batching made calls {calls}")
+        return False
+    if ([r.is_match for r in results] != [True, True, False] or
+            results[0].matched_alias != "Acme"):
+        print(f"Unexpected batch results: {results}")
+        return False
+
+    # Brands the model leaves out are checked individually, concurrently
+    calls.clear()
+    running = []
+
+    async def match_tracked(text, brand_name, brand_aliases):
+        running.append(brand_name)
+        await asyncio.sleep(0.01)
+        if len(running) != 2:
+            raise RuntimeError("omitted brands were checked one at a time")
+        return await match_single(text, brand_name, brand_aliases)
+
+    async def match_none(text, brands):
+        calls.append(("batch", [q.name for q in brands]))
+        return BrandMatchBatchResult(matches=[])
+
+    stub = SimpleNamespace(EvalBrandMatch=match_tracked,
+                           EvalBrandMatchBatch=match_none)
+    evaluator = LLMEvaluator(EvaluationConfig(batch_max=2, fallback_to_regex=False))
+    with mock.patch.object(llm_evaluator, "b", stub):
+        results = await asyncio.gather(
+            evaluator.match_brand("Acme and Zed", "Acme"),
+            evaluator.match_brand("Acme and Zed", "Other"))
+    if calls[1:] != [("single", "Acme"), ("single", "Other")] or \
+            [r.is_match for r in results] != [True, False]:
+        print(f"Omitted brands made calls {calls}")
+        return False
+    print("Concurrent evaluations share calls and batch per text")
+    return True
+
+
+async def test_evaluator_circuit_breaker():
+    """Test that repeated LLM failures stop further calls for a while"""
+    print("\n Testing evaluator circuit breaker...")
+
+    from types import SimpleNamespace
+    from unittest import mock
+    import llm_evaluator
+    from llm_evaluator import LLMEvaluator, EvaluationConfig
+
+    calls = []
+
+    async def failing_match(text, brand_name, brand_aliases):
+        calls.append(text)
+        raise RuntimeError("LLM unavailable")
+
+    async def failing_batch(text, brands):
+        calls.append(text)
+        raise RuntimeError("LLM unavailable")
+
+    stub = SimpleNamespace(EvalBrandMatch=failing_match,
+                           EvalBrandMatchBatch=failing_batch)
+    evaluator = LLMEvaluator(EvaluationConfig(
+        breaker_threshold=2, breaker_cooldown_s=60))
+    with mock.patch.object(llm_evaluator, "b", stub):
+        results = [await evaluator.match_brand(f"Acme text {i}", "Acme")
+                   for i in range(4)]
+
+    if len(calls) != 2:
+        print(f"Expected 2 LLM calls before the circuit opened, got {len(calls)}")
+        return False
+    if not all(r.is_match and "fallback" in r.reasoning for r in results):
+        print(f"Expected fallback matches, got {results}")
+        return False
+
+    # A failed batch is one failed call, however many brands it carried
+    calls.clear()
+    evaluator = LLMEvaluator(EvaluationConfig(
+        batch_max=3, breaker_threshold=2, breaker_cooldown_s=60))
+    with mock.patch.object(llm_evaluator, "b", stub):
+        for i in range(2):
+            await asyncio.gather(*(
+                evaluator.match_brand(f"Acme text {i}", name)
+                for name in ["Acme", "Zed", "Other"]))
+            if i == 0 and evaluator._breaker_open():
+                print("One failed batch opened the circuit")
+                return False
+    if len(calls) != 2 or not evaluator._breaker_open():
+        print(f"Expected the circuit open after 2 failed batches, calls {calls}")
+        return False
+    print("Circuit opens after repeated failures and falls back to regex")
+    return True
+
+
+async def test_evaluator_persistent_cache():
+    """Test that brand matches are reused across evaluators via the cache file"""
+    print("\n Testing evaluator persistent cache...")
+
+    from types import SimpleNamespace
+    from unittest import mock
+    import llm_evaluator
+    from llm_evaluator import LLMEvaluator, EvaluationConfig
+    from baml_client.types import BrandMatchResult
+
+    calls = []
+
+    async def match_single(text, brand_name, brand_aliases):
+        calls.append(brand_name)
+        return BrandMatchResult(is_match=True, confidence=0.9,
+                                matched_alias=brand_name, reasoning="stub")
+
+    with tempfile.TemporaryDirectory() as tmp, \
+            mock.patch.object(llm_evaluator, "b",
+                              SimpleNamespace(EvalBrandMatch=match_single)):
+        config = EvaluationConfig(cache_db=os.path.join(tmp, "eval.db"))
+        evaluator = LLMEvaluator(config)
+        await evaluator.match_brand("Acme text", "Acme")
+        await evaluator.match_brand("Zed text", "Zed")
+        conn = evaluator._db
+        evaluator.close()
+
+        evaluator = LLMEvaluator(config)
+        result = await evaluator.match_brand("Acme text", "Acme")
+        evaluator.close()
+
+    if conn is None or calls != ["Acme", "Zed"]:
+        print(f"Expected one shared connection and 2 LLM calls, got {calls}")
+        return False
+    if not (result.is_match and result.matched_alias == "Acme"):
+        print(f"Unexpected cached result: {result}")
+        return False
+    print("Brand matches are stored once and reused by later evaluators")
+    return True
+
+
+async def test_source_validator_caches():
+    """Test the validator's bounded memory cache and persistent cache"""
+    print("\n Testing source validator caches...")
+
+    import time
+    from unittest import mock
+    from hallucination_filter import SourceValidator, _TTLCache
+
+    cache = _TTLCache(maxsize=2, ttl=60)
+    cache["a"], cache["b"] = 1, 2
+    cache["a"]  # "a" is now the most recently used
+    cache["c"] = 3
+    if "b" in cache or "a" not in cache or len(cache) != 2:
+        print("LRU cache evicted the wrong entry")
+        return False
+    cache["d"] = 4
+    with mock.patch("hallucination_filter.time.monotonic",
+                    return_value=time.monotonic() + 61):
+        if "d" in cache:
+            print("Expired entry still served")
+            return False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_db = os.path.join(tmp, "urls.db")
+        sources = [{"url": "not a url"}, {"url": "http://down.example/page"}]
+
+        async with SourceValidator(cache_db=cache_db) as validator:
+            # Treat the host as already unreachable so nothing hits the network
+            validator._unreachable_hosts.add("down.example")
+            first = await validator.validate_sources(sources)
+
+        async with SourceValidator(cache_db=cache_db) as validator:
+            stored = validator._load_cached([s["url"] for s in sources])
+
+        # A caller that is cancelled doesn't cancel the check for the others
+        async with SourceValidator(cache_db=None) as validator:
+            validator._unreachable_hosts.add("down.example")
+            url = "http://down.example/other"
+            owner = asyncio.ensure_future(validator.validate_url(url))
+            joiner = asyncio.ensure_future(validator.validate_url(url))
+            await asyncio.sleep(0)
+            owner.cancel()
+            shared = await joiner
+    if not owner.cancelled() or shared["error"] != "Host unreachable: down.example":
+        print(f"Cancelling one caller broke the shared check: {shared}")
+        return False
+
+    if [r["error"] for r in first] != ["Invalid URL format",
+                                       "Host unreachable: down.example"]:
+        print(f"Unexpected validation results: {first}")
+        return False
+    # Definite failures persist; transient ones are retried next run
+    if list(stored) != ["not a url"]:
+        print(f"Persisted URLs: {list(stored)}")
+        return False
+    print("Validator caches evict, expire and persist as expected")
+    return True
+
+
 async def run_integration_test():
     """Run a mini integration test"""
     print("\n Running integration test...")
@@ -378,6 +845,15 @@ async def main():
         ("Database Operations", test_database_operations, False),
         ("LLM Evaluator", test_llm_evaluator, True),
         ("Configuration", test_configuration, False),
+        ("Competitor Graph Report Re-run", test_competitor_graph_report_rerun, False),
+        ("Incremental Graph Update", test_incremental_graph_update, False),
+        ("Brand Normalization", test_brand_normalization, False),
+        ("Fallback Matching", test_fallback_match_whole_words, False),
+        ("Batched Ranking", test_rank_batch_packing, True),
+        ("Evaluator Call Sharing", test_evaluator_call_sharing, True),
+        ("Evaluator Circuit Breaker", test_evaluator_circuit_breaker, True),
+        ("Evaluator Persistent Cache", test_evaluator_persistent_cache, True),
+        ("Source Validator Caches", test_source_validator_caches, True),
         ("Integration Test", run_integration_test, True),
     ]
 